@@ -0,0 +1,97 @@
+import lxml.etree as ET
+
+# CityGML versions differ in their namespaces, only local names are compared
+_lod_elements = ET.XPath("descendant-or-self::*[starts-with(local-name(), 'lod')]")
+_has_pos_list = ET.XPath("boolean(descendant-or-self::*[local-name() = 'posList'])")
+
+
+class CityGMLProbe(object):
+    """Class describing the geometry of a CityGML Building or BuildingPart
+
+    The City Object is probed once and the result is reused by all functions
+    that need to know how the building is modelled, instead of searching the
+    XML again: the Level of Detail, the kind of geometry, the coordinate
+    encoding and the BuildingParts. BuildingParts are probed in the same pass
+    and their LoDs count as LoDs of the building.
+
+    Parameters
+    ----------
+
+    city_object : lxml.etree.Element
+        CityGML City Object (Building or BuildingPart)
+
+    Attributes
+    ----------
+
+    lods : list
+        sorted Levels of Detail of all lod* elements in the City Object,
+        more than one means the file should be checked
+    lod : int
+        lowest Level of Detail, None if the City Object has no geometry
+    lod_elements : list
+        local names of the lod* child elements, e.g. lod0FootPrint or
+        lod1Solid
+    surface_types : list
+        local names of the boundary surfaces of the boundedBy children, e.g.
+        WallSurface or GroundSurface
+    geometry : str
+        where the surfaces are modelled: "footprint" for lod0FootPrint or
+        lod0RoofEdge, "boundedBy" for boundary surfaces, "solid" for
+        lod1Solid, None if there is no geometry
+    pos_list : bool
+        True if coordinates are given as gml:posList, False if only as
+        gml:pos
+    building_parts : list
+        tuples (BuildingPart element, CityGMLProbe) of the BuildingParts
+
+    """
+
+    def __init__(self, city_object):
+        self.lod_elements = []
+        self.surface_types = []
+        self.pos_list = False
+        self.building_parts = []
+
+        lods = set()
+        for child in city_object:
+            if not isinstance(child.tag, str):
+                continue
+            name = _local_name(child)
+            if name == "consistsOfBuildingPart":
+                for part in child:
+                    if isinstance(part.tag, str) and _local_name(part) == "BuildingPart":
+                        part_probe = CityGMLProbe(part)
+                        self.building_parts.append((part, part_probe))
+                        lods.update(part_probe.lods)
+                        self.pos_list = self.pos_list or part_probe.pos_list
+                continue
+
+            if name.startswith("lod"):
+                self.lod_elements.append(name)
+            elif name == "boundedBy":
+                self.surface_types.extend(
+                    _local_name(surface) for surface in child
+                    if isinstance(surface.tag, str))
+
+            for element in _lod_elements(child):
+                lod = _local_name(element)[3:4]
+                if lod.isdigit():
+                    lods.add(int(lod))
+            self.pos_list = self.pos_list or _has_pos_list(child)
+
+        self.lods = sorted(lods)
+        self.lod = self.lods[0] if self.lods else None
+
+        if "lod0FootPrint" in self.lod_elements or "lod0RoofEdge" in self.lod_elements:
+            self.geometry = "footprint"
+        elif self.surface_types:
+            self.geometry = "boundedBy"
+        elif "lod1Solid" in self.lod_elements:
+            self.geometry = "solid"
+        else:
+            self.geometry = None
+
+
+def _local_name(element):
+    """Returns the tag of an element without namespace"""
+    return element.tag.rpartition("}")[2]
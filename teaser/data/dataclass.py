@@ -3,6 +3,8 @@ import os
 import sys
 import teaser.logic.utilities as utils
 import json
+import bisect
+import pickle
 import collections
 
 v = sys.version_info
@@ -12,28 +14,74 @@ if v >= (2, 7):
     except NameError:
         FileNotFoundError = IOError
 
+_LAZY_BINDINGS = {
+    "element_bind": "load_tb_binding",
+    "conditions_bind": "load_uc_binding",
+    "material_bind": "load_mat_binding",
+    "lca_data_bind": "load_lcad_binding",
+    "lca_data_fallback_bind": "load_lcad_fallback_binding",
+}
+
+_LAZY_INDICES = {
+    "element_index": "build_element_index",
+    "material_index": "build_material_index",
+    "material_name_index": "build_material_index",
+    "lca_data_index": "build_lca_data_index",
+    "lca_data_name_index": "build_lca_data_index",
+    "lca_data_fallback_index": "build_lca_data_fallback_index",
+    "lca_data_fallback_name_index": "build_lca_data_fallback_index",
+}
+
+_binding_cache = {}
+
 
 class DataClass(object):
     """Class for JSON data.
 
     This class loads all JSON files with statistic or template data needed
-    for statistical data enrichment.
+    for statistical data enrichment. The bindings are loaded lazily on first
+    access and parsed json files are cached process-wide (see
+    load_json_binding()), thus instantiating a DataClass is cheap.
 
     Parameters
     ----------
     used_statistics : str
         This parameter indicates which statistical data about building
         elements should be used. Use 'iwu' or 'tabula_de'.
+    share_material_templates : bool
+        If True, every material id of the Material binding is loaded once
+        into a read-only template. The layers of type building elements use
+        the template itself, other materials loaded by name or id copy its
+        attributes and share its read-only LCA data (including fallbacks).
+        Default is False.
 
     Attributes
     ----------
     element_bind : collections.OrderedDict
         Ordered dictionary of the TypeBuildingElements binding.
+    element_index : dict
+        Lookup index of element_bind keyed by (element class name,
+        construction type). Each value holds the sorted boundaries of all
+        building age groups of that key together with the matching type
+        element keys, see build_element_index(). The index is rebuilt
+        whenever element_bind is loaded or changed by save_type_element or
+        delete_type_element.
     path_tb : str
         Full path to TypeBuildingElements.json. Default is
         teaser/data/input/inputdata/TypeBuildingElements.json.
     material_bind : collections.OrderedDict
         Ordered dictionary of the Material binding.
+    material_index : dict
+        Material records of material_bind keyed by material id.
+    material_name_index : dict
+        Material ids of material_bind keyed by material name. If a name is
+        used more than once, the last material in the json wins.
+    material_templates : dict
+        Loaded read-only template Materials keyed by material id, only
+        filled if share_material_templates is True. Emptied whenever the
+        Material or LCA bindings are re-indexed. Project hands this dict
+        over to the DataClass that replaces its data, as long as both read
+        the same input files.
     path_mat : str
         Full path to MaterialTemplates.json. Default is
         teaser/data/input/inputdata/MaterialTemplates.json.
@@ -42,79 +90,191 @@ class DataClass(object):
     path_uc : str
         Full path to UseConditions.json. Default is
         teaser/data/input/inputdata/UseConditions.json
+    lca_data_bind : collections.OrderedDict
+        Ordered dictionary of the LCA data binding.
+    lca_data_index : dict
+        LCA data records of lca_data_bind keyed by LCA id.
+    lca_data_name_index : dict
+        LCA ids of lca_data_bind keyed by name.
+    path_lcad : str
+        Full path to LcaData.json. Default is
+        teaser/data/input/inputdata/LcaData.json
+    lca_data_fallback_bind : collections.OrderedDict
+        Ordered dictionary of the LCA data fallback binding.
+    lca_data_fallback_index : dict
+        LCA data fallback records of lca_data_fallback_bind keyed by LCA id.
+    lca_data_fallback_name_index : dict
+        LCA ids of lca_data_fallback_bind keyed by name.
+    path_lcad_fallback : str
+        Full path to LcaDataFallback.json. Default is
+        teaser/data/input/inputdata/LcaDataFallback.json
 
     """
 
-    def __init__(self, used_statistic="iwu"):
+    def __init__(self, used_statistic="iwu", share_material_templates=False):
         """Construct DataClass."""
         self.used_statistic = used_statistic
-        self.element_bind = None
+        self.share_material_templates = share_material_templates
+        self.material_templates = {}
         if self.used_statistic == "iwu":
             self.path_tb = utils.get_full_path(
                 "data/input/inputdata/TypeBuildingElements.json"
             )
-            self.load_tb_binding()
         elif self.used_statistic == "tabula_de":
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DE.json"
                 )
             )
-            self.load_tb_binding()
         elif self.used_statistic == "tabula_dk":
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DK.json"
                 )
             )
-            self.load_tb_binding()
-        elif self.used_statistic is None:
-            pass
-        self.material_bind = None
+        else:
+            self.element_bind = None
+            self.element_index = {}
         self.path_mat = utils.get_full_path(
             "data/input/inputdata/MaterialTemplates.json"
         )
-        self.conditions_bind = None
         self.path_uc = utils.get_full_path("data/input/inputdata/UseConditions.json")
-        
-        self.lca_data_bind = None
         self.path_lcad = utils.get_full_path("data/input/inputdata/LcaData.json")
-        
-        self.lca_data_fallback_bind = None
-        self.path_lcad_fallback = utils.get_full_path("data/input/inputdata/LcaDataFallback.json")
+        self.path_lcad_fallback = utils.get_full_path(
+            "data/input/inputdata/LcaDataFallback.json"
+        )
 
-        self.load_uc_binding()
-        self.load_mat_binding()
-        self.load_lcad_binding()
-        self.load_lcad_fallback_binding()
-        
-        
+    def __getattr__(self, name):
+        """Load bindings and their lookups lazily on first access."""
+        if name in _LAZY_BINDINGS:
+            self.__dict__[name] = None
+            getattr(self, _LAZY_BINDINGS[name])()
+        elif name in _LAZY_INDICES:
+            getattr(self, _LAZY_INDICES[name])()
+        else:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+            )
+        return self.__dict__[name]
+
+    def save_snapshots(self):
+        """Save binary snapshots of all json files of this DataClass.
+
+        See save_binding_snapshot(). Snapshots are written next to the json
+        files and are used by all following loads of unchanged json files.
+        """
+        for path in [
+            getattr(self, "path_tb", None),
+            self.path_uc,
+            self.path_mat,
+            self.path_lcad,
+            self.path_lcad_fallback,
+        ]:
+            if path is not None and os.path.isfile(path):
+                save_binding_snapshot(path)
 
     def load_tb_binding(self):
         """Load TypeBuildingElement json into binding classes."""
         if self.path_tb.endswith("json"):
             if os.path.isfile(self.path_tb):
                 try:
-                    with open(self.path_tb, "r+") as f:
-                        self.element_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.element_bind = load_json_binding(self.path_tb)
                 except json.decoder.JSONDecodeError:
                     print("Your TypeElements file seems to be broken.")
             else:
                 with open(self.path_tb, "w") as f:
                     self.element_bind = collections.OrderedDict()
                     self.element_bind["version"] = "0.7"
+            self.build_element_index()
+
+    def build_element_index(self):
+        """Build the lookup index for the TypeBuildingElements binding.
+
+        Groups all type elements of element_bind by their element class
+        (the part of the key in front of the first underscore) and
+        construction type. For each group the begin and end years of all
+        building age groups are collected in a sorted list of boundaries.
+        For every boundary and every open interval between two neighbouring
+        boundaries the keys of all matching type elements are stored in the
+        order of the json file. Thus a lookup in find_type_elements() is a
+        dictionary hit plus a bisection, even if building age groups of one
+        group overlap.
+        """
+        groups = collections.OrderedDict()
+        if self.element_bind is not None:
+            for key, element_in in self.element_bind.items():
+                if key == "version":
+                    continue
+                group = (key.split("_")[0], element_in["construction_type"])
+                groups.setdefault(group, []).append(
+                    (
+                        element_in["building_age_group"][0],
+                        element_in["building_age_group"][1],
+                        key,
+                    )
+                )
+
+        self.element_index = {}
+        for group, entries in groups.items():
+            bounds = sorted(
+                set([entry[0] for entry in entries] + [entry[1] for entry in entries])
+            )
+            at_bound = []
+            between_bounds = []
+            for i, bound in enumerate(bounds):
+                at_bound.append(
+                    tuple(key for begin, end, key in entries if begin <= bound <= end)
+                )
+                if i + 1 < len(bounds):
+                    between_bounds.append(
+                        tuple(
+                            key
+                            for begin, end, key in entries
+                            if begin <= bound and bounds[i + 1] <= end
+                        )
+                    )
+            self.element_index[group] = (bounds, at_bound, between_bounds)
+
+    def find_type_elements(self, element_type, construction, year):
+        """Find all type elements matching a building element.
+
+        Parameters
+        ----------
+        element_type : str
+            Class name of the building element, e.g. 'OuterWall'
+        construction : str
+            Construction type, code list ('heavy', 'light', tabula, ...)
+        year : int
+            Year of construction
+
+        Returns
+        ----------
+        keys : tuple
+            Keys of element_bind with matching element class and
+            construction type whose building age group contains year (in
+            the order of the json file).
+        """
+        try:
+            bounds, at_bound, between_bounds = self.element_index[
+                (element_type, construction)
+            ]
+        except KeyError:
+            return ()
+
+        position = bisect.bisect_left(bounds, year)
+        if position < len(bounds) and bounds[position] == year:
+            return at_bound[position]
+        elif 0 < position < len(bounds):
+            return between_bounds[position - 1]
+        else:
+            return ()
 
     def load_uc_binding(self):
         """Load UseConditions json into binding classes."""
         if self.path_uc.endswith("json"):
             if os.path.isfile(self.path_uc):
                 try:
-                    with open(self.path_uc, "r+") as f:
-                        self.conditions_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.conditions_bind = load_json_binding(self.path_uc)
                 except json.decoder.JSONDecodeError:
                     raise IOError("Your UseConditions.json file seems to be broken.")
             else:
@@ -127,45 +287,181 @@ class DataClass(object):
         if self.path_mat.endswith("json"):
             if os.path.isfile(self.path_mat):
                 try:
-                    with open(self.path_mat, "r+") as f:
-                        self.material_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.material_bind = load_json_binding(self.path_mat)
                 except json.decoder.JSONDecodeError:
                     print("Your Materials file seems to be broken.")
             else:
                 with open(self.path_mat, "w") as f:
                     self.material_bind = collections.OrderedDict()
                     self.material_bind["version"] = "0.7"
+            self.build_material_index()
     
     def load_lcad_binding(self):
         """Load LCAData json into binding classes."""
         if self.path_lcad.endswith("json"):
             if os.path.isfile(self.path_lcad):
                 try:
-                    with open(self.path_lcad, "r+") as f:
-                        self.lca_data_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.lca_data_bind = load_json_binding(self.path_lcad)
                 except json.decoder.JSONDecodeError:
                     print("Your LCA-Data file seems to be broken.")
             else:
                 with open(self.path_lcad, "w") as f:
                     self.lca_data_bind = collections.OrderedDict()
                     self.lca_data_bind["version"] = "0.7"
+            self.build_lca_data_index()
                     
     def load_lcad_fallback_binding(self):
         """Load LCAData-Fallback json into binding classes."""
         if self.path_lcad_fallback.endswith("json"):
             if os.path.isfile(self.path_lcad_fallback):
                 try:
-                    with open(self.path_lcad_fallback, "r+") as f:
-                        self.lca_data_fallback_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.lca_data_fallback_bind = load_json_binding(
+                        self.path_lcad_fallback
+                    )
                 except json.decoder.JSONDecodeError:
                     print("Your LCA-Data-Fallback file seems to be broken.")
             else:
                 with open(self.path_lcad_fallback, "w") as f:
                     self.lca_data_fallback_bind = collections.OrderedDict()
                     self.lca_data_fallback_bind["version"] = "0.7"
+            self.build_lca_data_fallback_index()
+
+    def build_material_index(self):
+        """Build id and name lookup of the Material binding."""
+        if "material_index" in self.__dict__:
+            self.material_templates = {}
+        self.material_index, self.material_name_index = _index_binding(
+            self.material_bind
+        )
+
+    def build_lca_data_index(self):
+        """Build id and name lookup of the LCA data binding."""
+        if "lca_data_index" in self.__dict__:
+            self.material_templates = {}
+        self.lca_data_index, self.lca_data_name_index = _index_binding(
+            self.lca_data_bind
+        )
+
+    def build_lca_data_fallback_index(self):
+        """Build id and name lookup of the LCA data fallback binding."""
+        if "lca_data_fallback_index" in self.__dict__:
+            self.material_templates = {}
+        (
+            self.lca_data_fallback_index,
+            self.lca_data_fallback_name_index,
+        ) = _index_binding(self.lca_data_fallback_bind)
+
+
+def _index_binding(binding):
+    """Index a json binding by id and by name.
+
+    Parameters
+    ----------
+    binding : collections.OrderedDict
+        Binding with ids as keys and records with a "name" entry as values
+
+    Returns
+    ----------
+    id_index : dict
+        Records keyed by id (without the version entry)
+    name_index : dict
+        Ids keyed by the name of the record. The last record of a name wins.
+    """
+    id_index = {}
+    name_index = {}
+    if binding is not None:
+        for id, record in binding.items():
+            if id != "version":
+                id_index[id] = record
+                name_index[record["name"]] = id
+    return id_index, name_index
+
+
+def load_json_binding(path):
+    """Load a json file into an ordered dictionary with process-wide cache.
+
+    Each json file is parsed only once per process as long as its
+    modification time and size do not change. If a valid binary snapshot
+    of the file exists (see save_binding_snapshot()), it is loaded instead
+    of parsing the json. The cache holds the binding in pickled form and
+    every call returns a new, independent copy, so changing a binding (e.g.
+    the profiles of a use condition or save_type_element) does not affect
+    other DataClass instances.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the json file
+
+    Returns
+    ----------
+    binding : collections.OrderedDict
+        Ordered dictionary of the json file
+    """
+    path = os.path.abspath(path)
+    stamp = _file_stamp(path)
+    cached = _binding_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        blob = cached[1]
+    else:
+        binding = _load_binding_snapshot(path, stamp)
+        if binding is None:
+            with open(path, "r+") as f:
+                binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+        blob = pickle.dumps(binding, pickle.HIGHEST_PROTOCOL)
+        _binding_cache[path] = (stamp, blob)
+    return pickle.loads(blob)
+
+
+def save_binding_snapshot(path):
+    """Save a binary snapshot of a json file next to it.
+
+    The snapshot is a pickle file (path + ".pickle") holding the parsed
+    json together with the modification time and size of the json file.
+    load_json_binding() uses it as long as the json file is unchanged.
+    Snapshots are loaded with a restricted unpickler that only creates
+    ordered dictionaries and plain values, any other content is ignored.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the json file
+    """
+    path = os.path.abspath(path)
+    binding = load_json_binding(path)
+    with open(path + ".pickle", "wb") as f:
+        pickle.dump((_file_stamp(path), binding), f, pickle.HIGHEST_PROTOCOL)
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that only loads ordered dictionaries and plain values"""
+
+    def find_class(self, module, name):
+        if (module, name) == ("collections", "OrderedDict"):
+            return collections.OrderedDict
+        raise pickle.UnpicklingError(
+            "{}.{} is not allowed in a binding snapshot".format(module, name)
+        )
+
+
+def _load_binding_snapshot(path, stamp):
+    """Load the snapshot of a json file if it matches the json file.
+
+    Any failure to read or to validate the snapshot is a cache miss.
+    """
+    try:
+        with open(path + ".pickle", "rb") as f:
+            snapshot_stamp, binding = _SnapshotUnpickler(f).load()
+        if tuple(snapshot_stamp) != stamp or not isinstance(
+            binding, collections.OrderedDict
+        ):
+            return None
+    except Exception:
+        return None
+    return binding
+
+
+def _file_stamp(path):
+    """Return modification time and size of a file."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
@@ -29,30 +29,37 @@ def load_type_element(element, year, construction, data_class):
     data_class : DataClass()
         DataClass containing the bindings for TypeBuildingElement and
         Material (typically this is the data class stored in prj.data,
-        but the user can individually change that.
+        but the user can individually change that. If its
+        share_material_templates is True, the layers share one read-only
+        Material per material id.
 
     """
     element_binding = data_class.element_bind
 
-    for key, element_in in element_binding.items():
-        if key != "version":
-            if (
-                element_in["building_age_group"][0]
-                <= year
-                <= element_in["building_age_group"][1]
-                and element_in["construction_type"] == construction
-                and key.startswith(type(element).__name__)
-            ):
-                _set_basic_data(element=element, element_in=element_in)
-                for id, layer_in in element_in["layer"].items():
-                    layer = Layer(element)
-                    layer.id = id
-                    layer.thickness = layer_in["thickness"]
-                    material = Material(layer)
-                    mat_input.load_material_id(
-                        material, layer_in["material"]["material_id"], data_class
-                    
-                    )
+    for key in data_class.find_type_elements(
+        element_type=type(element).__name__, construction=construction, year=year
+    ):
+        element_in = element_binding[key]
+        _set_basic_data(element=element, element_in=element_in)
+        for id, layer_in in element_in["layer"].items():
+            layer = Layer(element)
+            layer.id = id
+            layer.thickness = layer_in["thickness"]
+            mat_id = layer_in["material"]["material_id"]
+            material = None
+            if data_class.share_material_templates:
+                material = mat_input.get_material_template(mat_id, data_class)
+            if material is None:
+                material = Material(layer)
+                mat_input.load_material_id(material, mat_id, data_class)
+            else:
+                layer.material = material
+                if (
+                    element.inner_convection is not None
+                    and element.inner_radiation is not None
+                    and element.area is not None
+                ):
+                    element.calc_ua_value()
 
 
 def _set_basic_data(element, element_in):
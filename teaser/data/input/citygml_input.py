@@ -9,10 +9,15 @@ This module contains function to load Buildings in the non proprietary
 CityGML file format .gml
 """
 
+import codecs
+import json
+import os
 import lxml.etree as ET
+import xml.parsers.expat as expat
+import numpy as np
 import statistics
-from teaser.data.dataclass import DataClass
-from teaser.data.surfacegml import SurfaceGML
+from teaser.data.citygmlprobe import CityGMLProbe
+from teaser.data.surfacegml import SurfaceGMLBatch
 from teaser.logic.archetypebuildings.bmvbs.singlefamilydwelling \
                          import SingleFamilyDwelling
 from teaser.logic.archetypebuildings.bmvbs.office import Office
@@ -23,6 +28,8 @@ from teaser.logic.archetypebuildings.tabula.de.multifamilyhouse import MultiFami
 from teaser.logic.archetypebuildings.tabula.de.terracedhouse import TerracedHouse
 from teaser.logic.archetypebuildings.tabula.de.apartmentblock import ApartmentBlock
 from teaser.logic.buildingobjects.building import Building
+import teaser.logic.parallel as parallel
+import teaser.data.input.material_input_json as material_input
 
 import copy
 
@@ -33,66 +40,251 @@ alkis_mfh_codes = ["1010", "31001_1010"] #MultiFamilyHouse
 alkis_th_codes = [] #TerracedHouse
 alkis_office_codes = [] #Offices
 
+"""Compiled XPath expressions of get_gml_surfaces per namespace map"""
+_gml_surface_xpaths = {}
 
-def choose_gml_lxml(path, bldg_ids=None, bldg_names=None, bldg_addresses=None):
+
+def choose_gml_lxml(path, bldg_ids=None, bldg_names=None, bldg_addresses=None, sidecar=False):
     """This function loads buildings from a CityGML file and
         selects specific buildings by Id, name ore address
 
+        The selection uses the index of index_gml_lxml, only the chosen
+        buildings are read from the file and parsed. Buildings are returned
+        once in file order, even if they match several criteria.
+
         This function is a proof of concept, be careful using it.
 
     :param path:string
             path of CityGML file
-    :param prj:Project()
-            Teaser instance of Project()
     :param bldg_ids:list[string]
             users choice
     :param bldg_names:list[string]
             users choice
     :param bldg_addresses:list[(string,string)]
             users choice
+    :param sidecar:Boolean
+            Store the index in a file next to the CityGML file and reuse it
+            for later selections, see index_gml_lxml
 
     :return chosen_gmls: list[etree.Element]
     """
-    with open(path, 'r') as xml_file:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-        namespace = root.nsmap
-        buildings_in_file = root.findall('core:cityObjectMember/bldg:Building', namespace)
-
-    chosen_gmls = []
+    index = index_gml_lxml(path, sidecar=sidecar)
 
+    positions = set()
     if bldg_ids is not None:
+        positions.update(index["ids"][bldg_id] for bldg_id in bldg_ids if bldg_id in index["ids"])
+    if bldg_names is not None:
+        for bldg_name in bldg_names:
+            positions.update(index["names"].get(bldg_name, []))
+    if bldg_addresses is not None:
+        for street, number in bldg_addresses:
+            positions.update(index["addresses"].get(street, {}).get(number, []))
 
-        for building_lxml in buildings_in_file:
-            if building_lxml.attrib['{http://www.opengis.net/gml}id'] is not None and \
-                    building_lxml.attrib['{http://www.opengis.net/gml}id'] in bldg_ids:
-                chosen_gmls.append(building_lxml)
+    namespace = {prefix or None: uri for prefix, uri in index["namespace"].items()}
+    chosen_gmls = read_gml_buildings(path, index, sorted(positions))
+    return chosen_gmls, namespace
 
-    if bldg_names is not None:
 
-        for building_lxml in buildings_in_file:
-            if building_lxml.find('core:externalReference/core:externalObject/core:name', namespace) is not None and \
-            building_lxml.find('core:externalReference/core:externalObject/core:name', namespace).text in bldg_names:
-                chosen_gmls.append(building_lxml)
+def index_gml_lxml(path, sidecar=False):
+    """This function indexes all buildings of a CityGML file in a single pass.
 
-            if building_lxml.find('gml:name', namespace) is not None and \
-                    building_lxml.find('gml:name', namespace).text in bldg_names:
-                chosen_gmls.append(building_lxml)
+        The index holds the byte offsets of every top level Building of the
+        file (the same objects iterparse_gml yields) and maps gml:id, names
+        (external reference name and gml:name) and addresses (street, number)
+        to the positions of the buildings. With the offsets read_gml_buildings
+        parses only the chosen buildings.
 
-    if bldg_addresses is not None:
-        for building_lxml in buildings_in_file:
-            if building_lxml.find('bldg:address', namespace) is not None and \
-                    (building_lxml.find('bldg:address/core:Address/core:xalAddress/xal:AddressDetails/xal:Country'
-                                        '/xal:Locality/xal:Thoroughfare/xal:ThoroughfareName', namespace).text,
-                     building_lxml.find('bldg:address/core:Address/core:xalAddress/xal:AddressDetails/xal:Country'
-                                        '/xal:Locality/xal:Thoroughfare/xal:ThoroughfareNumber', namespace).text) \
-                    in bldg_addresses:
-
-                chosen_gmls.append(building_lxml)
-    return chosen_gmls, namespace
+        The offsets are reported by a streaming expat parser, so comments,
+        CDATA sections, self-closing elements, any namespace prefix and the
+        encoding declared in the file are handled by the parser. An empty
+        file has no buildings.
+
+        If sidecar is True, the index is stored as JSON in path + ".index.json"
+        and loaded from there as long as size and modification time of the
+        CityGML file are unchanged.
 
+    :param path:string
+            path of CityGML file
+    :param sidecar:Boolean
+            load and store the index in a file next to the CityGML file
+
+    :return index: dict
+            {"source": [size, mtime], "encoding": encoding, "namespace": {prefix: uri},
+            "offsets": [[start, end]], "ids": {id: position},
+            "names": {name: [position]}, "addresses": {street: {number: [position]}}}
+    """
+    sidecar_path = path + ".index.json"
+    stat = os.stat(path)
+    source = [stat.st_size, stat.st_mtime_ns]
+
+    if sidecar and os.path.isfile(sidecar_path):
+        with open(sidecar_path, "r") as index_file:
+            index = json.load(index_file)
+        if index.get("source") == source and "encoding" in index:
+            return index
+
+    index = {"source": source, "encoding": "UTF-8", "namespace": {}, "offsets": [], "ids": {}, "names": {},
+             "addresses": {}}
+    if stat.st_size > 0:
+        index["encoding"], index["namespace"], index["offsets"] = _scan_gml_buildings(path)
+
+    namespace = {prefix or None: uri for prefix, uri in index["namespace"].items()}
+    for position, building_lxml in enumerate(_iter_gml_buildings(path, index, range(len(index["offsets"])))):
+        gml_id, names, addresses = _gml_building_keys(building_lxml, namespace)
+        if gml_id is not None:
+            index["ids"][gml_id] = position
+        for name in names:
+            index["names"].setdefault(name, []).append(position)
+        for street, number in addresses:
+            index["addresses"].setdefault(street, {}).setdefault(number, []).append(position)
+
+    if sidecar:
+        with open(sidecar_path, "w") as index_file:
+            json.dump(index, index_file)
+    return index
+
+
+def _scan_gml_buildings(path, chunk_size=1 << 20):
+    """Scans a CityGML file for the byte offsets of its top level Buildings
+
+    Top level Buildings are the children of the members (e.g. cityObjectMember) of the root. The start of a
+    Building is the byte index of its start tag, its end is the byte index of the first event after its end
+    tag (at least the end tag of the member follows).
+
+    :param path:string
+            path of CityGML file
+    :param chunk_size:int
+            number of bytes fed to the parser at once
 
-def load_gml_lxml(path, prj, method, chosen_gmls=None, yoc_list=None):
+    :return: (encoding, namespace, offsets) - declared encoding of the file, {prefix: uri} of all namespace
+            declarations (first declaration of a prefix wins) and [[start, end]] of the Buildings
+    """
+    parser = expat.ParserCreate(namespace_separator=" ")
+    encoding = ["UTF-8"]
+    namespace = {}
+    offsets = []
+    state = {"depth": 0, "start": None, "open_end": False}
+
+    def close_building():
+        if state["open_end"]:
+            offsets.append([state["start"], parser.CurrentByteIndex])
+            state["open_end"] = False
+
+    def xml_decl(version, declared_encoding, standalone):
+        if declared_encoding:
+            encoding[0] = declared_encoding
+
+    def start_namespace(prefix, uri):
+        namespace.setdefault(prefix or "", uri)
+
+    def start_element(name, attributes):
+        close_building()
+        if state["depth"] == 2 and _is_gml_building_tag(name):
+            state["start"] = parser.CurrentByteIndex
+        state["depth"] += 1
+
+    def end_element(name):
+        close_building()
+        state["depth"] -= 1
+        if state["depth"] == 2 and _is_gml_building_tag(name):
+            state["open_end"] = True
+
+    def other_event(*args):
+        close_building()
+
+    parser.XmlDeclHandler = xml_decl
+    parser.StartNamespaceDeclHandler = start_namespace
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = other_event
+    parser.CommentHandler = other_event
+    parser.ProcessingInstructionHandler = other_event
+    parser.StartCdataSectionHandler = other_event
+
+    with open(path, "rb") as xml_file:
+        for chunk in iter(lambda: xml_file.read(chunk_size), b""):
+            parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+    return encoding[0], namespace, offsets
+
+
+def _is_gml_building_tag(name):
+    """Checks if an expat name ("uri local") is a CityGML Building"""
+    uri, _, local_name = name.rpartition(" ")
+    return local_name == "Building" and uri.startswith("http://www.opengis.net/citygml/building/")
+
+
+def _gml_building_keys(building_lxml, namespace):
+    """
+    Returns the keys a CityGML Building is selected by, see choose_gml_lxml.
+
+    :param building_lxml: lxml object
+            CityGML City Object(Building)
+    :param namespace: lxml.msmap()
+            Original namespaces from CityGML file (root), the elements are found by their local names
+            independent of the prefixes
+    :return: (gml_id, names, addresses) - gml:id, list of names (external reference name and gml:name) and
+            list of addresses (street, number)
+    """
+    names = []
+    for name_path in ('{*}externalReference/{*}externalObject/{*}name', '{http://www.opengis.net/gml}name'):
+        name = building_lxml.find(name_path)
+        if name is not None and name.text is not None:
+            names.append(name.text)
+
+    addresses = []
+    thoroughfare = building_lxml.find('{*}address/{*}Address/{*}xalAddress/{*}AddressDetails/'
+                                      '{*}Country/{*}Locality/{*}Thoroughfare')
+    if thoroughfare is not None:
+        street = thoroughfare.findtext('{*}ThoroughfareName')
+        number = thoroughfare.findtext('{*}ThoroughfareNumber')
+        if street is not None and number is not None:
+            addresses.append((street, number))
+
+    return building_lxml.get('{http://www.opengis.net/gml}id'), names, addresses
+
+
+def read_gml_buildings(path, index, positions):
+    """This function reads and parses single buildings of a CityGML file.
+
+    :param path:string
+            path of CityGML file
+    :param index:dict
+            index of the CityGML file, see index_gml_lxml
+    :param positions:list[int]
+            positions of the buildings in the file
+
+    :return buildings: list[etree.Element]
+    """
+    return list(_iter_gml_buildings(path, index, positions))
+
+
+def _iter_gml_buildings(path, index, positions):
+    """Generator that reads and parses single buildings of a CityGML file, see read_gml_buildings"""
+    namespace = {prefix or None: uri for prefix, uri in index["namespace"].items()}
+    with open(path, "rb") as xml_file:
+        for position in positions:
+            start, end = index["offsets"][position]
+            xml_file.seek(start)
+            yield _parse_gml_fragment(xml_file.read(end - start), namespace, index.get("encoding", "UTF-8"))
+
+
+def _parse_gml_fragment(fragment, namespace, encoding="UTF-8"):
+    """Parses a building cut out of a CityGML file with the namespaces of the root
+
+    The fragment is wrapped in an element declaring the namespaces, both encoded in the encoding of the file.
+    """
+    declarations = " ".join(
+        'xmlns="{}"'.format(uri) if prefix is None else 'xmlns:{}="{}"'.format(prefix, uri)
+        for prefix, uri in namespace.items())
+    encoder = codecs.getincrementalencoder(encoding)()
+    head = encoder.encode('<?xml version="1.0" encoding="{}"?><fragment {}>'.format(encoding, declarations))
+    tail = encoder.encode("</fragment>", final=True)
+    return ET.fromstring(head + fragment + tail)[0]
+
+
+def load_gml_lxml(path, prj, method, chosen_gmls=None, yoc_list=None, workers=None, executor=None,
+                  surface_cache=None):
     """
     This function loads buildings from a CityGML file, checks for a name, BuildingParts and
     start GML surface extraction and consequent building genaration.
@@ -112,6 +304,12 @@ def load_gml_lxml(path, prj, method, chosen_gmls=None, yoc_list=None):
             List of chosen CityObject(Buildings)
     :param yoc_list: List[]
             List of year of construction for chosen gml buildings
+    :param workers: int
+            Number of worker processes to create the TEASER buildings in, see load_gml_buildings
+    :param executor: concurrent.futures.Executor
+            Executor to use instead of a new process pool, see load_gml_buildings
+    :param surface_cache: SurfaceGMLCache
+            Cache of the GML surfaces of the file, see get_gml_surfaces, default is None
     :return: gml_copy_list
     """
     if chosen_gmls is None:
@@ -123,62 +321,315 @@ def load_gml_lxml(path, prj, method, chosen_gmls=None, yoc_list=None):
             boundary_box = root.find("gml:boundedBy/gml:Envelope", namespace)
     else:
         buildings, namespace = chosen_gmls
+        boundary_box = None
 
     gml_copy_list = []
     """Start Loop through selected Buildings in GML file, assign Archetype by Function and create TEASER building"""
 
+    gml_buildings = []
     for i, building_lxml in enumerate(buildings):
         gml_copy_list.append(copy.copy(building_lxml))
+        gml_buildings.append((building_lxml, namespace, None if yoc_list is None else yoc_list[i]))
 
+    load_gml_buildings(prj=prj, gml_buildings=gml_buildings, method=method, workers=workers, executor=executor,
+                       surface_cache=surface_cache)
 
-        """find building name, if not there, use building id"""
-        if building_lxml.find('core:externalReference/core:externalObject/core:name', namespace) is not None:
-            bldg_name = building_lxml.find('core:externalReference/core:externalObject/core:name', namespace).text
-        else:
-            try:
-                bldg_name = building_lxml.find('gml:name', namespace).text
-            except:
-                bldg_name = building_lxml.attrib['{http://www.opengis.net/gml}id']
+    return gml_copy_list, boundary_box
+
+
+def stream_gml_lxml(path, prj, method, bldg_ids=None, bldg_names=None, bldg_addresses=None, workers=None,
+                    executor=None, surface_cache=None):
+    """
+    This function loads buildings from a CityGML file like load_gml_lxml, but streams the file with
+    lxml.etree.iterparse instead of parsing the whole tree. Each building is converted into a TEASER
+    building as soon as it is parsed and then cleared, so the memory needed does not grow with the
+    size of the file. No copies of the GML buildings are kept.
+
+    If bldg_ids, bldg_names or bldg_addresses are given, only the buildings matching one of them
+    (see choose_gml_lxml) are loaded.
+
+    :param path:string
+            path of CityGML file
+    :param prj:Project()
+            Teaser instance of Project()
+    :param method: Str
+            method for enrichment of single family dwellings
+            either default="iwu" or "tabula_de"
+            offices always use "iwu"= BMVBS and other residential
+            buildings will be always using "tabula_de"
+    :param bldg_ids:list[string]
+            users choice
+    :param bldg_names:list[string]
+            users choice
+    :param bldg_addresses:list[(string,string)]
+            users choice
+    :param workers: int
+            Number of worker processes to create the TEASER buildings in, see load_gml_buildings
+    :param executor: concurrent.futures.Executor
+            Executor to use instead of a new process pool, see load_gml_buildings
+    :param surface_cache: SurfaceGMLCache
+            Cache of the GML surfaces of the file, see get_gml_surfaces, default is None
+    :return: boundary_box: etree.Element
+            copy of the gml:Envelope of the CityModel, None if there is none
+    """
+    select = bldg_ids is not None or bldg_names is not None or bldg_addresses is not None
+    boundary_box = None
+
+    def chosen_gmls():
+        nonlocal boundary_box
+        for element, namespace in iterparse_gml(path, tags=("{*}Envelope", "{*}Building")):
+            if element.tag == "{http://www.opengis.net/gml}Envelope":
+                boundary_box = copy.deepcopy(element)
+            elif not select or _is_chosen_gml(building_lxml=element, namespace=namespace, bldg_ids=bldg_ids,
+                                              bldg_names=bldg_names, bldg_addresses=bldg_addresses):
+                yield element, namespace, None
+
+    load_gml_buildings(prj=prj, gml_buildings=chosen_gmls(), method=method, workers=workers, executor=executor,
+                       surface_cache=surface_cache)
+
+    return boundary_box
+
+
+def load_gml_buildings(prj, gml_buildings, method, workers=None, executor=None, chunk_size=16,
+                       surface_cache=None):
+    """
+    Creates the TEASER buildings of CityGML Buildings, see _load_gml_building. If workers or an executor
+    are given, the CityGML Buildings are serialized and sent in chunks to a process pool. The workers
+    return the enriched TEASER buildings pickled without their parent, which are added to the project in
+    the order of gml_buildings. Each CityGML Building is serialized before the next one is requested, so
+    gml_buildings may be a stream from iterparse_gml.
+
+    Buildings created in a worker process do not change the data of prj, while assign_archetype sets
+    prj.data to the statistic of the last building in this process. If prj.share_material_templates is
+    True, the layers of buildings from workers reference the material templates of prj.data. Workers get the cached surfaces of
+    their chunk, surfaces they extract are added to surface_cache.
+
+    :param prj: Project()
+            Teaser instance of Project()
+    :param gml_buildings: iterable
+            (lxml object, namespace, year of construction or None) for each CityGML Building
+    :param method: Str
+            method for enrichment of single family dwellings
+            either default="iwu" or "tabula_de"
+            offices always use "iwu"= BMVBS and other residential
+            buildings will be always using "tabula_de"
+    :param workers: int
+            Number of worker processes, None uses the number of processors if no executor is given
+    :param executor: concurrent.futures.Executor
+            Executor to use instead of a new process pool
+    :param chunk_size: int
+            Number of CityGML Buildings sent to a worker at once
+    :param surface_cache: SurfaceGMLCache
+            Cache of the GML surfaces of the file, see get_gml_surfaces, default is None
+    """
+    if workers is None and executor is None:
+        for building_lxml, namespace, bldg_yoc in gml_buildings:
+            _load_gml_building(prj=prj, building_lxml=building_lxml, namespace=namespace, method=method,
+                               bldg_yoc=bldg_yoc, surface_cache=surface_cache)
+        return
+
+    used_statistic = None if prj.data is None else prj.data.used_statistic
+    with parallel.executor_scope(workers=workers, executor=executor) as pool:
+        futures = []
+        chunk = []
+        chunk_ids = []
+        for building_lxml, namespace, bldg_yoc in gml_buildings:
+            chunk.append((ET.tostring(building_lxml), bldg_yoc))
+            if surface_cache is not None:
+                chunk_ids.extend(city_object.get('{http://www.opengis.net/gml}id')
+                                 for city_object in building_lxml.iter("{*}Building", "{*}BuildingPart"))
+            if len(chunk) == chunk_size:
+                futures.append(pool.submit(_load_gml_chunk, chunk, dict(namespace), method, used_statistic,
+                                           None if surface_cache is None else surface_cache.subset(chunk_ids),
+                                           prj.share_material_templates))
+                chunk = []
+                chunk_ids = []
+        if chunk:
+            futures.append(pool.submit(_load_gml_chunk, chunk, dict(namespace), method, used_statistic,
+                                       None if surface_cache is None else surface_cache.subset(chunk_ids),
+                                       prj.share_material_templates))
+
+        template_data = prj.data
+        for future in futures:
+            payloads, new_entries, mat_ids = future.result()
+            if mat_ids and template_data is None:
+                template_data = prj.instantiate_data_class()
+            shared = [prj] + [material_input.get_material_template(mat_id, template_data) for mat_id in mat_ids]
+            for payload in payloads:
+                prj.buildings.append(parallel.loads_shared(payload, shared))
+            if surface_cache is not None:
+                surface_cache.update(new_entries)
+
+
+def _load_gml_chunk(chunk, namespace, method, used_statistic, surface_cache=None, share_material_templates=False):
+    """
+    Creates the TEASER buildings of serialized CityGML Buildings, executed in the worker process.
+
+    :param chunk: list
+            (serialized CityGML Building, year of construction or None) tuples
+    :param namespace: dict
+            Original namespaces from CityGML file (root)
+    :param method: Str
+            method for enrichment of single family dwellings
+    :param used_statistic: Str
+            statistic of the data of the project, None if it has no data
+    :param surface_cache: SurfaceGMLCache
+            Cached GML surfaces of the chunk, default is None
+    :param share_material_templates: bool
+            share_material_templates of the project, default is False
+    :return: payloads: list
+            created TEASER buildings pickled with parallel.dumps_shared() without their parent and without the
+            shared material templates
+    :return: new_entries: dict
+            surfaces added to surface_cache, see SurfaceGMLCache
+    :return: mat_ids: list
+            material ids of the shared material templates referenced by the payloads
+    """
+    from teaser.project import Project
+
+    prj = Project(load_data=False, share_material_templates=share_material_templates)
+    if used_statistic is not None:
+        prj.data = prj.instantiate_data_class(used_statistic=used_statistic)
+
+    for fragment, bldg_yoc in chunk:
+        _load_gml_building(prj=prj, building_lxml=ET.fromstring(fragment), namespace=namespace, method=method,
+                           bldg_yoc=bldg_yoc, surface_cache=surface_cache)
+
+    new_entries = {} if surface_cache is None else surface_cache.new_entries
+    templates = {} if prj.data is None else prj.data.material_templates
+    mat_ids = list(templates)
+    shared = [prj] + [templates[mat_id] for mat_id in mat_ids]
+    return [parallel.dumps_shared(bldg, shared) for bldg in prj.buildings], new_entries, mat_ids
 
-        """Check for BuildingParts"""
-        if building_lxml.find('./bldg:consistsOfBuildingPart', namespace) is not None:
-            load_gml_buildingparts_lxml(prj=prj, gml_bldg=building_lxml, namespace=namespace,
-                                        bldg_name=bldg_name, method=method)
+
+def iterparse_gml(path, tags):
+    """
+    Generator that streams the top level objects of a CityGML file with lxml.etree.iterparse.
+
+    Yields the children of the cityObjectMember, featureMember and boundedBy elements of the root
+    whose tags are in tags, each together with the namespaces of the file. After the next object is
+    requested the yielded element is cleared and all preceding elements of the root are deleted,
+    therefore only one object is held in memory at a time. Copy an element if it is needed later on.
+
+    :param path: string
+            path of CityGML file
+    :param tags: tuple(string)
+            tags of the objects to yield, lxml wildcards like "{*}Building" are allowed
+    :return: generator of (etree.Element, dict) - object and namespaces of the file
+    """
+    namespace = {}
+    for event, element in ET.iterparse(path, events=("start-ns", "end"), tag=tags, huge_tree=True):
+        if event == "start-ns":
+            prefix, uri = element
+            namespace.setdefault(prefix or None, uri)
             continue
 
-        """Assign Archetype"""
-        bldg = assign_archetype(prj=prj, building_lxml=building_lxml, namespace=namespace,
-                                bldg_name=bldg_name, method=method)
+        member = element.getparent()
+        if member is None or member.getparent() is None or member.getparent().getparent() is not None:
+            continue
 
-        """Extract GML surface from File"""
-        get_gml_surfaces(bldg=bldg, city_object=building_lxml, namespace=namespace)
+        yield element, namespace
 
-        """Set Building Attribute"""
-        if yoc_list is not None:
-            _set_attributes(bldg=bldg, gml_bldg=building_lxml, bldg_yoc=yoc_list[i])
-        else:
-            _set_attributes(bldg=bldg, gml_bldg=building_lxml, namespace=namespace, bldg_name=bldg_name)
+        element.clear()
+        while member.getprevious() is not None:
+            del member.getparent()[0]
 
-        """Calculate building height through GML surfaces, overwrites measured height from GML Building"""
-        bldg.set_height_gml()
 
-        """Calculates net_floor_area and number of toreys in Building with default storey height"""
-        try:
-            bldg.set_gml_attributes()
-        except (UserWarning, AttributeError):
-            print(f"{bldg.name} bldg.set_gml_attributes() did not work")
-            pass
-        """Sets Building Elements"""
+def _is_chosen_gml(building_lxml, namespace, bldg_ids=None, bldg_names=None, bldg_addresses=None):
+    """
+    Checks if a CityGML Building is selected by id, name or address, see choose_gml_lxml.
+
+    :param building_lxml: lxml object
+            CityGML City Object(Building)
+    :param namespace: lxml.msmap()
+            Original namespaces from CityGML file (root)
+    :param bldg_ids:list[string]
+            users choice
+    :param bldg_names:list[string]
+            users choice
+    :param bldg_addresses:list[(string,string)]
+            users choice
+    :return: Boolean
+    """
+    gml_id, names, addresses = _gml_building_keys(building_lxml, namespace)
+    if bldg_ids is not None and gml_id in bldg_ids:
+        return True
+    if bldg_names is not None and any(name in bldg_names for name in names):
+        return True
+    if bldg_addresses is not None and any(address in bldg_addresses for address in addresses):
+        return True
+    return False
+
+
+def _load_gml_building(prj, building_lxml, namespace, method, bldg_yoc=None, surface_cache=None):
+    """
+    Creates the TEASER building(s) of one CityGML Building: checks for a name and BuildingParts,
+    assigns the archetype, extracts the GML surfaces and generates the building elements.
+
+    :param prj: Project()
+            Teaser instance of Project()
+    :param building_lxml: lxml object
+            CityGML City Object(Building)
+    :param namespace: lxml.msmap()
+            Original namespaces from CityGML file (root)
+    :param method: Str
+            method for enrichment of single family dwellings
+            either default="iwu" or "tabula_de"
+            offices always use "iwu"= BMVBS and other residential
+            buildings will be always using "tabula_de"
+    :param bldg_yoc: Integer
+            year of construction, overwrites the one of the GML Building
+    :param surface_cache: SurfaceGMLCache
+            Cache of the GML surfaces of the file, see get_gml_surfaces, default is None
+    """
+    """find building name, if not there, use building id"""
+    if building_lxml.find('core:externalReference/core:externalObject/core:name', namespace) is not None:
+        bldg_name = building_lxml.find('core:externalReference/core:externalObject/core:name', namespace).text
+    else:
         try:
-            bldg.generate_from_gml()
-        except (UserWarning, AttributeError):
-            print(f"{bldg.name} bldg.generate_from_gml() did not work")
-            pass
+            bldg_name = building_lxml.find('gml:name', namespace).text
+        except:
+            bldg_name = building_lxml.attrib['{http://www.opengis.net/gml}id']
 
-    return gml_copy_list, boundary_box
+    """Probe the geometry once, check for BuildingParts"""
+    probe = CityGMLProbe(building_lxml)
+    if probe.building_parts:
+        load_gml_buildingparts_lxml(prj=prj, gml_bldg=building_lxml, namespace=namespace,
+                                    bldg_name=bldg_name, method=method, yoc=bldg_yoc,
+                                    surface_cache=surface_cache, probe=probe)
+        return
+
+    """Assign Archetype"""
+    bldg = assign_archetype(prj=prj, building_lxml=building_lxml, namespace=namespace,
+                            bldg_name=bldg_name, method=method)
+
+    """Extract GML surface from File"""
+    get_gml_surfaces(bldg=bldg, city_object=building_lxml, namespace=namespace, surface_cache=surface_cache,
+                     probe=probe)
 
+    """Set Building Attribute"""
+    _set_attributes(bldg=bldg, gml_bldg=building_lxml, namespace=namespace, bldg_name=bldg_name,
+                    bldg_yoc=bldg_yoc)
 
-def load_gml_buildingparts_lxml(prj, gml_bldg, namespace, bldg_name, method, yoc=None, calc_sep=True):
+    """Calculate building height through GML surfaces, overwrites measured height from GML Building"""
+    bldg.set_height_gml()
+
+    """Calculates net_floor_area and number of toreys in Building with default storey height"""
+    try:
+        bldg.set_gml_attributes()
+    except (UserWarning, AttributeError):
+        print(f"{bldg.name} bldg.set_gml_attributes() did not work")
+        pass
+    """Sets Building Elements"""
+    try:
+        bldg.generate_from_gml()
+    except (UserWarning, AttributeError):
+        print(f"{bldg.name} bldg.generate_from_gml() did not work")
+        pass
+
+
+def load_gml_buildingparts_lxml(prj, gml_bldg, namespace, bldg_name, method, yoc=None, calc_sep=True,
+                                surface_cache=None, probe=None):
     """
     This function loads buildings parts from a CityGML Buildings,
     assigns archetypes by gml function and creates TEASER building
@@ -203,21 +654,25 @@ def load_gml_buildingparts_lxml(prj, gml_bldg, namespace, bldg_name, method, yoc
             Decision variable for buildingPart handling, if False BuildingParts are
             calculated as separate Buildings inheriting only function and yoc. If True,
             BuildingsParts are merged together with calculation on the mean measured Height
+    :param surface_cache: SurfaceGMLCache
+            Cache of the GML surfaces of the file, see get_gml_surfaces, default is None
+    :param probe: CityGMLProbe
+            Geometry of the CityGML Building if it is already probed, default is None
     """
-
-    building_parts = gml_bldg.findall('./bldg:consistsOfBuildingPart/bldg:BuildingPart', namespace)
+    if probe is None:
+        probe = CityGMLProbe(gml_bldg)
+    building_parts = [gml_bldg_part for gml_bldg_part, part_probe in probe.building_parts]
+    part_probes = [part_probe for gml_bldg_part, part_probe in probe.building_parts]
     if calc_sep:
         for number_of_buildpart, gml_bldg_part in enumerate(building_parts):
             bldg = assign_archetype(prj=prj, building_lxml=gml_bldg, namespace=namespace,
                                     bldg_name=bldg_name, method=method)
 
-            get_gml_surfaces(bldg=bldg, city_object=gml_bldg_part, namespace=namespace)
+            get_gml_surfaces(bldg=bldg, city_object=gml_bldg_part, namespace=namespace,
+                             surface_cache=surface_cache, probe=part_probes[number_of_buildpart])
 
-            if yoc is not None:
-                _set_attributes(bldg=bldg, gml_bldg=gml_bldg, bldg_yoc=yoc)
-            else:
-                _set_attributes(bldg=bldg, gml_bldg=gml_bldg, namespace=namespace, bldg_name=bldg_name,
-                                gml_bldg_part=gml_bldg_part, bldg_part=number_of_buildpart)
+            _set_attributes(bldg=bldg, gml_bldg=gml_bldg, namespace=namespace, bldg_name=bldg_name,
+                            gml_bldg_part=gml_bldg_part, bldg_part=number_of_buildpart, bldg_yoc=yoc)
 
             bldg.set_height_gml()
 
@@ -240,17 +695,13 @@ def load_gml_buildingparts_lxml(prj, gml_bldg, namespace, bldg_name, method, yoc
 
         measured_heights = []
         for number_of_buildpart, gml_bldg_part in enumerate(building_parts):
-            get_gml_surfaces(bldg=bldg, city_object=gml_bldg_part, namespace=namespace)
+            get_gml_surfaces(bldg=bldg, city_object=gml_bldg_part, namespace=namespace,
+                             surface_cache=surface_cache, probe=part_probes[number_of_buildpart])
             measured_heights.append(float(gml_bldg_part.find(".//bldg:measuredHeight", namespace).text))
 
-        if yoc is not None:
-            _set_attributes(bldg=bldg, gml_bldg=gml_bldg, namespace=namespace, bldg_name=bldg_name,
-                            gml_bldg_part=gml_bldg_part,
-                            measured_mean_height=measured_heights.mean(), bldg_yoc=yoc)
-        else:
-            _set_attributes(bldg=bldg, gml_bldg=gml_bldg, namespace=namespace, bldg_name=bldg_name,
-                            gml_bldg_part=gml_bldg_part,
-                            measured_mean_height=statistics.mean(measured_heights))
+        _set_attributes(bldg=bldg, gml_bldg=gml_bldg, namespace=namespace, bldg_name=bldg_name,
+                        gml_bldg_part=gml_bldg_part,
+                        measured_mean_height=statistics.mean(measured_heights), bldg_yoc=yoc)
 
         #bldg.set_height_gml()
 
@@ -292,18 +743,18 @@ def assign_archetype(prj, building_lxml, namespace, bldg_name, method):
 
         if bldg_function in alkis_sfh_codes:  # Single Family Buildings
             if method == "tabula_de":
-                prj.data = DataClass(used_statistic="tabula_de")
+                prj.data = prj.instantiate_data_class(used_statistic="tabula_de")
                 bldg = SingleFamilyHouse(parent=prj, name=bldg_name)
             else:
-                prj.data = DataClass(used_statistic='iwu')
+                prj.data = prj.instantiate_data_class(used_statistic='iwu')
                 bldg = SingleFamilyDwelling(parent=prj, name=bldg_name)
 
         elif bldg_function in alkis_mfh_codes:  # Multi Family Buildings
-            prj.data = DataClass(used_statistic="tabula_de")
+            prj.data = prj.instantiate_data_class(used_statistic="tabula_de")
             bldg = MultiFamilyHouse(parent=prj, name=bldg_name)
 
         elif bldg_function in alkis_mfh_codes:  # Offices
-            prj.data = DataClass(used_statistic="iwu")
+            prj.data = prj.instantiate_data_class(used_statistic="iwu")
             bldg = Office(parent=prj, name=bldg_name)
 
         else:
@@ -314,29 +765,48 @@ def assign_archetype(prj, building_lxml, namespace, bldg_name, method):
     return bldg
 
 
-def get_gml_surfaces(bldg, city_object, namespace):
+def get_gml_surfaces(bldg, city_object, namespace, surface_cache=None, probe=None):
     """
     This Function extracts the position coordinates of CityGML Building surfaces and passes them to the SurfaceGML
     class for processing and finally populates the TEASER building gml_surfaces list for further calculation.
 
+    If a surface cache is given, the surfaces of a City Object whose gml:id is in the cache are taken from there
+    without decoding the XML geometry, the surfaces of all other City Objects are added to the cache.
+
     :param namespace: lxml.msmap()
             Original namespaces from CityGML file (root)
     :param bldg: TEASER building()
             TEASER Building Object
     :param city_object: lxml object
             CityGML City Object(Building)
+    :param surface_cache: SurfaceGMLCache
+            Cache of the GML surfaces of the file, default is None
+    :param probe: CityGMLProbe
+            Geometry of the City Object if it is already probed, default is None
     """
-
-    lod = get_lod(city_object=city_object)
+    gml_id = None if surface_cache is None else city_object.get('{http://www.opengis.net/gml}id')
+    if gml_id is not None:
+        surfaces = surface_cache.get(gml_id)
+        if surfaces is not None:
+            bldg.gml_surfaces.extend(surfaces)
+            return
+        number_of_surfaces = len(bldg.gml_surfaces)
+
+    """Collect (coordinates, name, only keep surfaces larger than 1 m2) and calculate all surfaces at once"""
+    gml_surfaces = []
+
+    if probe is None:
+        probe = CityGMLProbe(city_object)
+    if len(probe.lods) > 1:
+        print("Check file for LoDs!!!")
+    lod = probe.lod
     if lod == 0:
         if city_object.find(".//bldg:measuredHeight", namespace) is not None:
             from itertools import chain
             height = float(city_object.find(".//bldg:measuredHeight", namespace).text)
-            a_list = city_object.find("bldg:lod0FootPrint/gml:MultiSurface/gml:surfaceMember/gml:Polygon/"
-                                      "gml:exterior/gml:LinearRing/gml:posList", namespace).text.split()
-            map_object = map(float, a_list)
-            coord_list = list(map_object)
-            base = coord_list
+            base = decode_double_list(city_object.find("bldg:lod0FootPrint/gml:MultiSurface/gml:surfaceMember/"
+                                                        "gml:Polygon/gml:exterior/gml:LinearRing/gml:posList",
+                                                        namespace).text)
             roof = [base[0], base[1], base[2] + height, base[9], base[10], base[11] + height, base[6], base[7],
                     base[8] + height, base[3], base[4], base[5] + height, base[12], base[13], base[14] + height]
 
@@ -359,87 +829,87 @@ def get_gml_surfaces(bldg, city_object, namespace):
                            help_list_base[2]]
             wall_list_4 = list(chain(*wall_help_4))
 
-            bldg.gml_surfaces.append(SurfaceGML(base))
-            bldg.gml_surfaces.append(SurfaceGML(roof))
-            bldg.gml_surfaces.append(SurfaceGML(wall_list_1))
-            bldg.gml_surfaces.append(SurfaceGML(wall_list_2))
-            bldg.gml_surfaces.append(SurfaceGML(wall_list_3))
-            bldg.gml_surfaces.append(SurfaceGML(wall_list_4))
+            for coord_list in (base, roof, wall_list_1, wall_list_2, wall_list_3, wall_list_4):
+                gml_surfaces.append((coord_list, None, False))
 
         else:
             print("The LoD0 Model, no building-height is defined, set a height or no calculations are possible")
 
-    elif lod == 1:
-        boundary_surfaces = city_object.findall('./bldg:lod1Solid', namespace)
-
-    elif lod == 2 or lod == 3:
-        boundary_surfaces = city_object.findall('./bldg:boundedBy', namespace)
-
-    if not lod == 0:
-        for bound_surf in boundary_surfaces:
-            for surf_member in bound_surf.iter():
-
-                # if surf_member.tag == "{http://www.opengis.net/gml}name":
-                #     print("Surface Name:", surf_member.text)
-
-                # modelling option 1
-                if surf_member.tag == "{http://www.opengis.net/gml}exterior":
-                    for surf_pos in surf_member.iter():
-                        if "{http://www.opengis.net/gml}posList" in surf_member:
-                            if surf_pos.tag == "{http://www.opengis.net/gml}posList":
-                                a_list = surf_pos.text.split()
-                                map_object = map(float, a_list)
-                                coord_list = list(map_object)
-                                help = SurfaceGML(coord_list)
-                                if help.surface_area > 1:
-                                    bldg.gml_surfaces.append(help)
-
-                        # modelling option 2
-                        else:
-                            if surf_pos.tag == "{http://www.opengis.net/gml}LinearRing":
-                                position_list_help = []
-                                for pos in surf_pos.iter():
-                                    a_list = pos.text.split()
-                                    map_object = map(float, a_list)
-                                    coord_list = list(map_object)
-                                    position_list_help.extend(coord_list)
-                                help = SurfaceGML(position_list_help)
-                                if help.surface_area > 1:
-                                    bldg.gml_surfaces.append(help)
-    if lod == 3 or lod == 4:
-        openings_name = "Window"
-        for bound_surf in boundary_surfaces:
-            for surf_member in bound_surf.iter():
-                if surf_member.tag == "{http://www.opengis.net/citygml/building/2.0}opening":
-                    # if surf_member.tag == "{http://www.opengis.net/gml}name":
-                    #     openings_name = surf_member.text
-                    #     print("Opening Name:", surf_member.text)
-                    for openings in surf_member.iter():
-                        if openings.tag == "{http://www.opengis.net/gml}exterior":
-                            for openings_pos in openings.iter():
-                                if "{http://www.opengis.net/gml}posList" in surf_member:
-                                    # modelling option 1
-                                    if openings_pos.tag == "{http://www.opengis.net/gml}posList":
-                                        a_list = openings_pos.text.split()
-                                        map_object = map(float, a_list)
-                                        coord_list = list(map_object)
-                                        opening = SurfaceGML(coord_list)
-                                        opening.name = openings_name
-                                        # print(opening.surface_area)
-                                        bldg.gml_surfaces.append(opening)
-                                else:
-                                    # modelling option 2
-                                    if openings_pos.tag == "{http://www.opengis.net/gml}LinearRing":
-                                        position_list_help = []
-                                        for pos in openings_pos.iter():
-                                            a_list = pos.text.split()
-                                            map_object = map(float, a_list)
-                                            coord_list = list(map_object)
-                                            position_list_help.extend(coord_list)
-                                        help = SurfaceGML(position_list_help)
-                                        help.name = openings_name
-                                        # print(help.surface_area)
-                                        bldg.gml_surfaces.append(help)
+    elif lod is not None:
+        """All exterior rings of the surfaces, openings of LoD3 and LoD4 are added again as windows"""
+        xpaths = _get_gml_surface_xpaths(namespace)
+        rings = xpaths["lod1_rings"] if lod == 1 else xpaths["rings"]
+        for ring in rings(city_object):
+            gml_surfaces.append((decode_pos_elements(ring.iter()), None, True))
+
+        if lod == 3 or lod == 4:
+            for ring in xpaths["opening_rings"](city_object):
+                gml_surfaces.append((decode_pos_elements(ring.iter()), "Window", False))
+
+    if gml_surfaces:
+        batch = SurfaceGMLBatch(
+            coordinates=np.concatenate([coord_list for coord_list, name, check_area in gml_surfaces]),
+            offsets=np.cumsum([0] + [len(coord_list) for coord_list, name, check_area in gml_surfaces]),
+            names=[name for coord_list, name, check_area in gml_surfaces])
+        for i, (coord_list, name, check_area) in enumerate(gml_surfaces):
+            if not check_area or batch.surface_area[i] > 1:
+                bldg.gml_surfaces.append(batch.surface(i))
+
+    if gml_id is not None:
+        surface_cache.put(gml_id, bldg.gml_surfaces[number_of_surfaces:])
+
+
+def decode_double_list(text):
+    """
+    Decodes a whitespace separated list of numbers, like the text of a gml:posList or gml:pos, straight into
+    a contiguous float64 array without creating a Python float for every value.
+
+    :param text: string
+            text of the element, None for an empty list
+    :return: np.array
+            decoded numbers
+    :raises ValueError: if the text contains a token that is not a number
+    """
+    if text is None or not text.strip():
+        return np.zeros(0)
+    return np.array(text.split(), dtype=np.float64)
+
+
+def decode_pos_elements(pos_elements):
+    """
+    Decodes the coordinates of a run of gml:pos elements (or of all elements of a LinearRing) into one
+    float64 array. Elements without text are skipped.
+
+    :param pos_elements: iterable
+            lxml objects, e.g. the gml:pos elements of a LinearRing
+    :return: np.array
+            decoded coordinates of all elements one after another
+    """
+    return decode_double_list(" ".join(pos.text for pos in pos_elements if pos.text is not None))
+
+
+def _get_gml_surface_xpaths(namespace):
+    """
+    Help Function, returns the compiled XPath expressions of get_gml_surfaces for the namespaces of a file.
+    They are compiled once per namespace map and select the exterior LinearRings of the surfaces in a single
+    pass through the City Object.
+
+    :param namespace: lxml.msmap()
+            Original namespaces from CityGML file (root)
+    :return: dict of etree.XPath
+    """
+    key = tuple(sorted((prefix, uri) for prefix, uri in namespace.items() if prefix is not None))
+    xpaths = _gml_surface_xpaths.get(key)
+    if xpaths is None:
+        namespaces = dict(key)
+        xpaths = {
+            "lod1_rings": ET.XPath("bldg:lod1Solid//gml:exterior//gml:LinearRing", namespaces=namespaces),
+            "rings": ET.XPath("bldg:boundedBy//gml:exterior//gml:LinearRing", namespaces=namespaces),
+            "opening_rings": ET.XPath("bldg:boundedBy//bldg:opening//gml:exterior//gml:LinearRing",
+                                      namespaces=namespaces),
+        }
+        _gml_surface_xpaths[key] = xpaths
+    return xpaths
 
 
 def get_lod(city_object):
@@ -448,24 +918,9 @@ def get_lod(city_object):
     By Simon Raming CityATB
 
     :param city_object: lxml CityGML City Object(Building)
-    :return: CityGML City Object Level of Detail
+    :return: CityGML City Object Level of Detail, lowest one if there are several, None if there is none
     """
-    lods = []
-    for elem in city_object.iter():
-        # print(elem)
-        try:
-            if elem.tag.split("}")[1].startswith('lod'):
-                lods.append(elem.tag.split('}')[1][3])
-        except:
-            pass
-
-    if lods != []:
-        lods = list(set(lods))
-        if len(lods) > 1:
-            print("Check file for LoDs!!!")
-        lods.sort()
-        lod = int(lods[0])
-    return lod
+    return CityGMLProbe(city_object).lod
 
 
 def _set_attributes(bldg, gml_bldg, namespace, bldg_name, gml_bldg_part=None, bldg_part=None,
@@ -14,7 +14,7 @@ from teaser.logic.buildingobjects.buildingphysics.ceiling import Ceiling
 from teaser.logic.buildingobjects.buildingphysics.floor import Floor
 from teaser.logic.buildingobjects.buildingphysics.door import Door
 from teaser.logic.buildingobjects.useconditions import UseConditions
-from teaser.data.input.citygml_input import _set_attributes
+from teaser.data.input.citygml_input import _set_attributes, iterparse_gml, decode_double_list
 import numpy as np
 
 
@@ -23,7 +23,9 @@ def load_ade_lxml(path, prj, chosen_gmls=None):
     Function to load CityGML EnergyADE files cia lxml trees,
     loading CityGML CityObject and FeatureMembers and the
     namespace. Loops through list of chosen Building´s, checks for the
-    names and start the extraction
+    names and start the extraction. The constructions and materials of the
+    FeatureMembers are shared by all buildings of the file and are therefore
+    extracted only once.
 
     :param path: string
             path of CityGML EnergyADE file
@@ -42,41 +44,108 @@ def load_ade_lxml(path, prj, chosen_gmls=None):
             construction_members = root.findall('gml:featureMember/energy:Construction', namespace)
             material_members = root.findall('gml:featureMember/energy:SolidMaterial', namespace)
             material_members.extend(root.findall('gml:featureMember/energy:Gas', namespace))
+            construction_dict, constr_win_dict = _get_construction(construction_members)
+            material_dict = _get_materials(material_members)
     else:
         buildings, namespace = chosen_gmls
+        construction_dict, constr_win_dict, material_dict = _get_feature_members(path)
 
     """Start Loop through selected Buildings in GML file"""
 
     for i, building_lxml in enumerate(buildings):
+        _load_ade_building(prj, building_lxml, namespace, construction_dict, constr_win_dict, material_dict)
 
-        """find building name, if not there, use building id"""
-        if building_lxml.find('core:externalReference/core:externalObject/core:name', namespace) is not None:
-            bldg_name = building_lxml.find('core:externalReference/core:externalObject/core:name', namespace).text
+
+def stream_ade_lxml(path, prj):
+    """
+    Function to load CityGML EnergyADE files like load_ade_lxml, but streaming
+    the file with lxml.etree.iterparse instead of parsing the whole tree. The
+    file is read twice: first the constructions and materials of the
+    FeatureMembers are extracted, then the Buildings are created one after
+    another and cleared, so only one Building is held in memory at a time.
+
+    :param path: string
+            path of CityGML EnergyADE file
+    :param prj: Project()
+            Teaser instance of Project()
+    """
+    construction_dict, constr_win_dict, material_dict = _get_feature_members(path)
+
+    for building_lxml, namespace in iterparse_gml(path, tags=("{*}Building",)):
+        _load_ade_building(prj, building_lxml, namespace, construction_dict, constr_win_dict, material_dict)
+
+
+def _get_feature_members(path):
+    """
+    Function that streams the FeatureMembers of a CityGML EnergyADE file and extracts the constructions and
+    materials, which are referenced by xlink:href from the thermal boundaries of all buildings. Each FeatureMember
+    is extracted as soon as it is read, the elements are not kept.
+
+    :param path: string
+            path of CityGML EnergyADE file
+    :return: constr_dict, constr_win_dict
+            construction dictionaries of the file, see _get_construction
+    :return: material_dict
+            material dictionary of the file, see _get_materials
+    """
+    construction_dict = {}
+    constr_win_dict = {}
+    material_dict = {}
+    for element, namespace in iterparse_gml(path, tags=("{*}Construction", "{*}SolidMaterial", "{*}Gas")):
+        if element.tag == "{http://www.sig3d.org/citygml/2.0/energy/1.0}Construction":
+            element_constr_dict, element_constr_win_dict = _get_construction([element])
+            construction_dict.update(element_constr_dict)
+            constr_win_dict.update(element_constr_win_dict)
         else:
-            try:
-                bldg_name = building_lxml.find('gml:name', namespace).text
-            except:
-                bldg_name = building_lxml.attrib['{http://www.opengis.net/gml}id']
-        print(bldg_name)
-
-        """Create TEASER Building Object and get/set general attributes and Thermal Zone..."""
-        bldg = Building(parent=prj)
-        _set_attributes(bldg=bldg, gml_bldg=building_lxml, namespace=namespace, bldg_name=bldg_name)
-        # bldg.set_gml_attributes()
-        construction_dict, constr_win_dict = _get_construction(construction_members)
-        material_dict = _get_materials(material_members)
-        bldg_info_list, thermal_zone_lxml, usage_zone_lxml = _get_building_info(building_lxml)
-        thermal_zone_dict = _get_thermal_zones(thermal_zone_lxml)
-        usage_condition_dict = _get_usage_zones(usage_zone_lxml)
-
-        # tz, usage_href, tzb_dict, tzb_dict_openings = _set_thermal_zones(bldg, thermal_zone_dict, construction_dict,
-        #                                                                  constr_win_dict, material_dict)
-        for tz, usage_href, tzb_dict, tzb_dict_openings in _set_thermal_zones(bldg, thermal_zone_dict,
-                                                                              construction_dict):
-            _set_building_elements(tz, tzb_dict, tzb_dict_openings, construction_dict,
-                                   constr_win_dict, material_dict)
-            _set_usage_conditions(prj, tz, usage_href, usage_condition_dict)
-            _set_inner_walls(bldg, tz)
+            material_dict.update(_get_materials([element]))
+
+    return construction_dict, constr_win_dict, material_dict
+
+
+def _load_ade_building(prj, building_lxml, namespace, construction_dict, constr_win_dict, material_dict):
+    """
+    Function to create a TEASER Building with its thermal zones, building
+    elements and usage conditions from one CityGML EnergyADE Building
+
+    :param prj: Project()
+            Teaser instance of Project()
+    :param building_lxml: lxml object
+            CityGML City Object(Building)
+    :param namespace: lxml.msmap()
+            Original namespaces from CityGML file (root)
+    :param construction_dict: python Dict{}
+            constructions of the file for Walls, Roofs and Grounds, see _get_construction
+    :param constr_win_dict: python Dict{}
+            window constructions of the file, see _get_construction
+    :param material_dict: python Dict{}
+            materials of the file, see _get_materials
+    """
+    """find building name, if not there, use building id"""
+    if building_lxml.find('core:externalReference/core:externalObject/core:name', namespace) is not None:
+        bldg_name = building_lxml.find('core:externalReference/core:externalObject/core:name', namespace).text
+    else:
+        try:
+            bldg_name = building_lxml.find('gml:name', namespace).text
+        except:
+            bldg_name = building_lxml.attrib['{http://www.opengis.net/gml}id']
+    print(bldg_name)
+
+    """Create TEASER Building Object and get/set general attributes and Thermal Zone..."""
+    bldg = Building(parent=prj)
+    _set_attributes(bldg=bldg, gml_bldg=building_lxml, namespace=namespace, bldg_name=bldg_name)
+    # bldg.set_gml_attributes()
+    bldg_info_list, thermal_zone_lxml, usage_zone_lxml = _get_building_info(building_lxml)
+    thermal_zone_dict = _get_thermal_zones(thermal_zone_lxml)
+    usage_condition_dict = _get_usage_zones(usage_zone_lxml)
+
+    # tz, usage_href, tzb_dict, tzb_dict_openings = _set_thermal_zones(bldg, thermal_zone_dict, construction_dict,
+    #                                                                  constr_win_dict, material_dict)
+    for tz, usage_href, tzb_dict, tzb_dict_openings in _set_thermal_zones(bldg, thermal_zone_dict,
+                                                                          construction_dict):
+        _set_building_elements(tz, tzb_dict, tzb_dict_openings, construction_dict,
+                               constr_win_dict, material_dict)
+        _set_usage_conditions(prj, tz, usage_href, usage_condition_dict)
+        _set_inner_walls(bldg, tz)
 
 
 def _get_construction(construction_members):
@@ -504,18 +573,14 @@ def _get_schedules(schedule):
                             if daily_schedule.tag == "{http://www.sig3d.org/citygml/2.0/energy/1.0}values":
                                 schedule_weekday = []
                                 day_type = "weekDay"
-                                values = daily_schedule.text.splitlines()  # if there is a \n newline
-                                for value in values:
-                                    schedule_weekday.extend(list(map(float, value.split())))
+                                schedule_weekday.extend(decode_double_list(daily_schedule.text).tolist())
                                 schedule_dict["weekDay"] = schedule_weekday
                     elif day_type_info.text == "weekEnd":
                         for daily_schedule in schedule_info.iter():
                             if daily_schedule.tag == "{http://www.sig3d.org/citygml/2.0/energy/1.0}values":
                                 schedule_weekend = []
                                 day_type = "weekEnd"
-                                values = daily_schedule.text.splitlines()  # if there is a \n newline
-                                for value in values:
-                                    schedule_weekend.extend(list(map(float, value.split())))
+                                schedule_weekend.extend(decode_double_list(daily_schedule.text).tolist())
                                 schedule_dict["weekEnd"] = schedule_weekday
 
                     else:
@@ -524,9 +589,7 @@ def _get_schedules(schedule):
                             if daily_schedule.tag == "{http://www.sig3d.org/citygml/2.0/energy/1.0}values":
                                 schedule_weekday = []
                                 day_type = "weekDay"
-                                values = daily_schedule.text.splitlines()  # if there is a \n newline
-                                for value in values:
-                                    schedule_weekday.extend(list(map(float, value.split())))
+                                schedule_weekday.extend(decode_double_list(daily_schedule.text).tolist())
                                 schedule_dict["weekDay"] = schedule_weekday
 
     return schedule_dict
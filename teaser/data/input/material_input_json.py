@@ -24,24 +24,10 @@ def load_material(material, mat_name, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if mat["name"] == mat_name:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
-                material.service_life = mat["service_life"]
-                lca_data = En15804LcaData(material)
-                lca_data.load_lca_data_template(mat["lca_id"], data_class)
-                material.lca_data = lca_data
+    mat_id = data_class.material_name_index.get(mat_name)
+
+    if mat_id is not None:
+        _set_material_data(material, mat_id, data_class)
 
 
 def load_material_id(material, mat_id, data_class):
@@ -63,21 +49,84 @@ def load_material_id(material, mat_id, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if id == mat_id:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
-                material.service_life = mat["service_life"]
-                lca_data = En15804LcaData(material)
-                lca_data.load_lca_data_template(mat["lca_id"], data_class)
-                material.lca_data = lca_data
+    if mat_id in data_class.material_index:
+        _set_material_data(material, mat_id, data_class)
+
+
+def get_material_template(mat_id, data_class):
+    """Shared material with id as identification.
+
+    Returns the read-only template Material of the given material_id, which
+    is loaded from the JSON on first request and then shared by all layers
+    that use this material, see DataClass.share_material_templates.
+
+    Parameters
+    ----------
+    mat_id : name
+        id of material from JSON
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that.
+
+    Returns
+    -------
+    material : Material()
+        frozen Material without parent, None if the id is unknown
+
+    """
+    template = data_class.material_templates.get(mat_id)
+    if template is None and mat_id in data_class.material_index:
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        template = Material()
+        _set_material_data_json(template, mat_id, data_class)
+        template.freeze()
+        data_class.material_templates[mat_id] = template
+    return template
+
+
+def _set_material_data(material, mat_id, data_class):
+    """Set material data from the Material binding.
+
+    Helper function to set the data of the material with the given id to the
+    Material class. If data_class.share_material_templates is True, the
+    material copies the scalar attributes of the shared template of this id
+    and shares its read-only LCA data.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+
+    mat_id : str
+        id of material from JSON
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material
+
+    """
+    if data_class.share_material_templates:
+        material.share_template(get_material_template(mat_id, data_class))
+    else:
+        _set_material_data_json(material, mat_id, data_class)
+
+
+def _set_material_data_json(material, mat_id, data_class):
+    """Set material data and LCA data from the json bindings."""
+    mat = data_class.material_index[mat_id]
+
+    material.material_id = mat_id
+    material.name = mat["name"]
+    material.density = mat["density"]
+    material.thermal_conduc = mat["thermal_conduc"]
+    material.heat_capac = mat["heat_capac"]
+    material.solar_absorp = mat["solar_absorp"]
+    material.thickness_default = mat["thickness_default"]
+    material.thickness_list = mat["thickness_list"]
+    material.service_life = mat["service_life"]
+    lca_data = En15804LcaData(material)
+    lca_data.load_lca_data_template(mat["lca_id"], data_class)
+    material.lca_data = lca_data
@@ -5,10 +5,27 @@ import warnings
 import shutil
 from mako.template import Template
 from mako.lookup import TemplateLookup
+import teaser.logic.parallel as parallel
 import teaser.logic.utilities as utilities
 
+_template_files = {
+    "zone_1": "AixLib/AixLib_ThermalZoneRecord_OneElement",
+    "zone_2": "AixLib/AixLib_ThermalZoneRecord_TwoElement",
+    "zone_3": "AixLib/AixLib_ThermalZoneRecord_ThreeElement",
+    "zone_4": "AixLib/AixLib_ThermalZoneRecord_FourElement",
+    "model": "AixLib/AixLib_Multizone",
+    "test_script": "modelica_test_script",
+    "package": "package",
+    "package_order": "package_order",
+}
 
-def export_multizone(buildings, prj, path=None):
+# compiled templates, see _get_templates()
+_templates = {}
+
+
+def export_multizone(
+        buildings, prj, path=None, table_format="txt", workers=None,
+        executor=None):
     """Exports models for AixLib library
 
     Exports a building for
@@ -23,7 +40,13 @@ def export_multizone(buildings, prj, path=None):
     old options please contact us.
 
     This function uses Mako Templates specified in
-    data.output.modelicatemplates.AixLib
+    data.output.modelicatemplate.AixLib, they are compiled once per process
+    (see _get_templates()).
+
+    The package of the project and the shared directories are written in this
+    process. The packages of the buildings can be written in a process pool,
+    each worker writes the complete directory of a building, so the exported
+    files are identical to the serial export.
 
     Parameters
     ----------
@@ -38,55 +61,18 @@ def export_multizone(buildings, prj, path=None):
     path : string
         if the Files should not be stored in default output path of TEASER,
         an alternative path can be specified as a full path
-
-    Attributes
-    ----------
-
-    lookup : TemplateLookup object
-        Instance of mako.TemplateLookup to store general functions for templates
-    zone_template_1 : Template object
-        Template for ThermalZoneRecord using 1 element model
-    zone_template_2 : Template object
-        Template for ThermalZoneRecord using 2 element model
-    zone_template_3 : Template object
-        Template for ThermalZoneRecord using 3 element model
-    zone_template_4 : Template object
-        Template for ThermalZoneRecord using 4 element model
-    model_template : Template object
-        Template for MultiZone model
+    table_format : str
+        File format of the boundary condition tables, "txt" (default) for
+        text files or "mat" for MATLAB v4 files
+    workers : int
+        Number of worker processes to export the buildings in parallel.
+        Default is None, which exports all buildings in this process unless
+        an executor is given.
+    executor : concurrent.futures.Executor
+        Executor (e.g. ProcessPoolExecutor) to export the buildings in
+        parallel instead of creating a new process pool, default is None
     """
 
-    lookup = TemplateLookup(directories=[utilities.get_full_path(
-        os.path.join('data', 'output', 'modelicatemplate'))])
-    zone_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_OneElement"),
-        lookup=lookup)
-    zone_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_TwoElement"),
-        lookup=lookup)
-    zone_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_ThreeElement"),
-        lookup=lookup)
-    zone_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_FourElement"),
-        lookup=lookup)
-    model_template = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib/AixLib_Multizone"),
-        lookup=lookup)
-    test_script_template = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/modelica_test_script"),
-        lookup=lookup)
-
     uses = [
         'Modelica(version="' + prj.modelica_info.version + '")',
         'AixLib(version="' + prj.buildings[-1].library_attr.version + '")']
@@ -102,6 +88,13 @@ def export_multizone(buildings, prj, path=None):
         extra=None)
     _copy_weather_data(prj.weather_file_path, path)
 
+    dir_resources = os.path.join(path, "Resources")
+    dir_scripts = os.path.join(dir_resources, "Scripts")
+    dir_dymola = os.path.join(dir_scripts, "Dymola")
+    for directory in (dir_resources, dir_scripts, dir_dymola):
+        if not os.path.exists(directory):
+            os.mkdir(directory)
+
     for i, bldg in enumerate(buildings):
 
         ass_error = "You chose IBPSA calculation, " \
@@ -110,24 +103,7 @@ def export_multizone(buildings, prj, path=None):
 
         assert bldg.used_library_calc == 'AixLib', ass_error
 
-        bldg_path = os.path.join(path, bldg.name)
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path,
-                         bldg.name + "_DataBase")))
-        bldg.library_attr.modelica_set_temp(path=bldg_path)
-        bldg.library_attr.modelica_set_temp_cool(path=bldg_path)
-        bldg.library_attr.modelica_AHU_boundary(
-            path=bldg_path)
-        bldg.library_attr.modelica_gains_boundary(
-            path=bldg_path)
-
-        _help_package(path=bldg_path, name=bldg.name, within=bldg.parent.name)
-        _help_package_order(
-            path=bldg_path,
-            package_list=[bldg],
-            addition=None,
-            extra=bldg.name + "_DataBase")
+        bldg.library_attr.table_format = table_format
 
         if bldg.building_id is None:
             bldg.building_id = i
@@ -140,53 +116,23 @@ def export_multizone(buildings, prj, path=None):
                                                "number of the building in "
                                                "the project list.")
                 bldg.building_id = i
-        with open(utilities.get_full_path(
-                os.path.join(bldg_path, bldg.name + ".mo")), 'w') as out_file:
-
-            out_file.write(model_template.render_unicode(
-                bldg=bldg,
-                weather=bldg.parent.weather_file_path,
-                modelica_info=bldg.parent.modelica_info))
-            out_file.close()
-
-        dir_resources = os.path.join(path, "Resources")
-        if not os.path.exists(dir_resources):
-            os.mkdir(dir_resources)
-        dir_scripts = os.path.join(dir_resources, "Scripts")
-        if not os.path.exists(dir_scripts):
-            os.mkdir(dir_scripts)
-        dir_dymola = os.path.join(dir_scripts, "Dymola")
-        if not os.path.exists(dir_dymola):
-            os.mkdir(dir_dymola)
-        _help_test_script(bldg, dir_dymola, test_script_template)
-
-        zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
-
-        for zone in bldg.thermal_zones:
-
-            with open(utilities.get_full_path(os.path.join(
-                    zone_path,
-                    bldg.name + '_' + zone.name + '.mo')), 'w') as out_file:
-                if type(zone.model_attr).__name__ == "OneElement":
-                    out_file.write(zone_template_1.render_unicode(zone=zone))
-                elif type(zone.model_attr).__name__ == "TwoElement":
-                    out_file.write(zone_template_2.render_unicode(zone=zone))
-                elif type(zone.model_attr).__name__ == "ThreeElement":
-                    out_file.write(zone_template_3.render_unicode(zone=zone))
-                elif type(zone.model_attr).__name__ == "FourElement":
-                    out_file.write(zone_template_4.render_unicode(zone=zone))
-
-                out_file.close()
-
-        _help_package(
-            path=zone_path,
-            name=bldg.name + '_DataBase',
-            within=prj.name + '.' + bldg.name)
-        _help_package_order(
-            path=zone_path,
-            package_list=bldg.thermal_zones,
-            addition=bldg.name + "_",
-            extra=None)
+
+    if workers is not None or executor is not None:
+        project_payload = parallel.dumps_project(prj)
+        with parallel.executor_scope(
+                workers=workers, executor=executor) as pool:
+            futures = [
+                pool.submit(
+                    _export_building_payload,
+                    project_payload,
+                    parallel.dumps_building(bldg),
+                    path)
+                for bldg in buildings]
+            for future in futures:
+                future.result()
+    else:
+        for bldg in buildings:
+            _export_building(bldg=bldg, path=path)
 
     _copy_script_unit_tests(os.path.join(dir_scripts, "runUnitTests.py"))
     _copy_reference_results(dir_resources, prj)
@@ -195,6 +141,118 @@ def export_multizone(buildings, prj, path=None):
     print(path)
 
 
+def _export_building(bldg, path):
+    """Exports the package of one building for AixLib
+
+    Writes the boundary condition tables, the model of the building, its
+    test script and the records of its thermal zones. The building_id and
+    the table format of the building are set by export_multizone().
+
+    Parameters
+    ----------
+    bldg : teaser.logic.buildingobjects.building.Building
+        Building that is exported
+    path : str
+        Path of the package of the project
+    """
+    templates = _get_templates()
+    zone_templates = {
+        "OneElement": templates["zone_1"],
+        "TwoElement": templates["zone_2"],
+        "ThreeElement": templates["zone_3"],
+        "FourElement": templates["zone_4"]}
+
+    bldg_path = os.path.join(path, bldg.name)
+    utilities.create_path(utilities.get_full_path(bldg_path))
+    utilities.create_path(utilities.get_full_path(
+        os.path.join(bldg_path,
+                     bldg.name + "_DataBase")))
+    bldg.library_attr.modelica_set_temp(path=bldg_path)
+    bldg.library_attr.modelica_set_temp_cool(path=bldg_path)
+    bldg.library_attr.modelica_AHU_boundary(
+        path=bldg_path)
+    bldg.library_attr.modelica_gains_boundary(
+        path=bldg_path)
+
+    _help_package(path=bldg_path, name=bldg.name, within=bldg.parent.name)
+    _help_package_order(
+        path=bldg_path,
+        package_list=[bldg],
+        addition=None,
+        extra=bldg.name + "_DataBase")
+
+    with open(utilities.get_full_path(
+            os.path.join(bldg_path, bldg.name + ".mo")), 'w') as out_file:
+        out_file.write(templates["model"].render_unicode(
+            bldg=bldg,
+            weather=bldg.parent.weather_file_path,
+            modelica_info=bldg.parent.modelica_info))
+
+    dir_dymola = os.path.join(path, "Resources", "Scripts", "Dymola")
+    _help_test_script(bldg, dir_dymola, templates["test_script"])
+
+    zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
+
+    for zone in bldg.thermal_zones:
+        zone_template = zone_templates.get(type(zone.model_attr).__name__)
+        with open(utilities.get_full_path(os.path.join(
+                zone_path,
+                bldg.name + '_' + zone.name + '.mo')), 'w') as out_file:
+            if zone_template is not None:
+                out_file.write(zone_template.render_unicode(zone=zone))
+
+    _help_package(
+        path=zone_path,
+        name=bldg.name + '_DataBase',
+        within=bldg.parent.name + '.' + bldg.name)
+    _help_package_order(
+        path=zone_path,
+        package_list=bldg.thermal_zones,
+        addition=bldg.name + "_",
+        extra=None)
+
+
+def _export_building_payload(project_payload, payload, path):
+    """Exports a pickled building, executed in the worker process
+
+    Parameters
+    ----------
+    project_payload : bytes
+        Project pickled with teaser.logic.parallel.dumps_project()
+    payload : bytes
+        Building pickled with teaser.logic.parallel.dumps_building()
+    path : str
+        Path of the package of the project
+    """
+    bldg = parallel.loads_building(payload)
+    bldg.parent = parallel.loads_project(project_payload)
+    _export_building(bldg=bldg, path=path)
+
+
+def _get_templates():
+    """Returns the compiled Mako templates of the AixLib export
+
+    The templates are compiled on the first call and reused by all later
+    exports of the process.
+
+    Returns
+    -------
+    templates : dict
+        Compiled templates by name: zone_1 to zone_4 for the
+        ThermalZoneRecords of the 1 to 4 element models, model for the
+        MultiZone model, test_script, package and package_order
+    """
+    if not _templates:
+        lookup = TemplateLookup(directories=[utilities.get_full_path(
+            os.path.join('data', 'output', 'modelicatemplate'))])
+        for name, filename in _template_files.items():
+            _templates[name] = Template(
+                filename=utilities.get_full_path(
+                    "data/output/modelicatemplate/" + filename),
+                lookup=lookup)
+    return _templates
+
+
 def _copy_reference_results(dir_resources, prj):
     """Copy reference results to modelica output.
 
@@ -276,8 +334,7 @@ def _help_package(path, name, uses=None, within=None):
 
     """
 
-    package_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package"))
+    package_template = _get_templates()["package"]
     with open(utilities.get_full_path(os.path.join(
             path, "package.mo")), 'w') as out_file:
 
@@ -309,8 +366,7 @@ def _help_package_order(path, package_list, addition=None, extra=None):
 
     """
 
-    order_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package_order"))
+    order_template = _get_templates()["package_order"]
     with open(utilities.get_full_path(
             path + "/" + "package" + ".order"), 'w') as out_file:
 
@@ -0,0 +1,191 @@
+"""This module contains functions to write boundary condition tables.
+
+By default the tables are written in the text format of the Modelica
+CombiTimeTable: a "#1" line, the declaration "double name(rows, columns)" and
+one tab separated row per hour with the time in seconds in the first column.
+The values are formatted exactly like pandas.DataFrame.to_csv() does. As the
+columns are expanded from short profiles, only their distinct values are
+formatted. Tables with the same content, e.g. of buildings with the same use
+conditions, are formatted once and reused.
+
+Alternatively the tables are written as MATLAB v4 files ("mat"), which the
+CombiTimeTable reads as well. They hold the same matrix as double values and
+are smaller and much faster to write and to read than the text files.
+"""
+
+import collections
+import hashlib
+import os
+
+import numpy as np
+
+hours_per_year = 8760
+
+# file formats of the tables, also used as file extensions
+table_formats = ("txt", "mat")
+
+# formatted tables by content hash, the least recently used ones are dropped
+_table_cache = collections.OrderedDict()
+_table_cache_size = 32
+
+
+def write_table(path, name, columns, first_row=False, table_format="txt"):
+    """Writes a boundary condition table into a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, an existing file is replaced
+    name : str
+        Name of the table in Modelica, e.g. Tset or Internals
+    columns : list
+        One array (or list) per column with one value per hour of the year,
+        the time column is added
+    first_row : bool
+        If True, an additional first row with time 0 and the values of the
+        first hour is written. Default is False
+    table_format : str
+        "txt" (default) for the text format or "mat" for a MATLAB v4 file
+
+    """
+    ass_error = "table_format has to be 'txt' or 'mat'"
+    assert table_format in table_formats, ass_error
+
+    if table_format == "mat":
+        write_mat_table(path=path, name=name, columns=columns, first_row=first_row)
+    else:
+        with open(path, "w") as f:
+            f.write(format_table(name=name, columns=columns, first_row=first_row))
+
+
+def write_mat_table(path, name, columns, first_row=False):
+    """Writes a boundary condition table into a MATLAB v4 file.
+
+    The file holds one full matrix of little endian doubles with the time in
+    seconds in the first column, as read by the Modelica CombiTimeTable.
+    Missing values are written as NaN.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, an existing file is replaced
+    name : str
+        Name of the table in Modelica, e.g. Tset or Internals
+    columns : list
+        One array (or list) per column with one value per hour of the year,
+        the time column is added
+    first_row : bool
+        If True, an additional first row with time 0 and the values of the
+        first hour is written. Default is False
+
+    """
+    offset = 1 if first_row else 0
+    data = np.empty(
+        (hours_per_year + offset, len(columns) + 1), dtype="<f8", order="F")
+    data[:offset, 0] = 0
+    data[offset:, 0] = np.arange(1, hours_per_year + 1) * 3600
+    for i, column in enumerate(columns):
+        data[offset:, i + 1] = np.asarray(column, dtype=float)
+        data[:offset, i + 1] = data[offset, i + 1]
+
+    # type 0 (little endian, double, full matrix), rows, columns, no
+    # imaginary part and the length of the name including the trailing NUL
+    header = np.array(
+        [0, data.shape[0], data.shape[1], 0, len(name) + 1], dtype="<i4")
+    with open(path, "wb") as f:
+        f.write(header.tobytes())
+        f.write(name.encode("ascii") + b"\0")
+        f.write(data.tobytes(order="F"))
+
+
+def table_file_name(file_name, table_format):
+    """Returns the file name with the extension of the table format
+
+    Parameters
+    ----------
+    file_name : str
+        File name of a table, e.g. AHU_Building.txt
+    table_format : str
+        "txt" or "mat"
+
+    Returns
+    ----------
+    file_name : str
+        File name with the extension of the table format, e.g. AHU_Building.mat
+
+    """
+    return os.path.splitext(file_name)[0] + "." + table_format
+
+
+def format_table(name, columns, first_row=False):
+    """Returns the text of a boundary condition table.
+
+    Parameters
+    ----------
+    name : str
+        Name of the table in Modelica, e.g. Tset or Internals
+    columns : list
+        One array (or list) per column with one value per hour of the year,
+        the time column is added
+    first_row : bool
+        If True, an additional first row with time 0 and the values of the
+        first hour is written. Default is False
+
+    Returns
+    ----------
+    text : str
+        Table in the text format of the Modelica CombiTimeTable
+
+    """
+    columns = [np.asarray(column) for column in columns]
+    if any(column.dtype.kind == "O" for column in columns):
+        return _format_table(name=name, columns=columns, first_row=first_row)
+
+    key = hashlib.blake2b(digest_size=16)
+    key.update(repr((name, first_row)).encode())
+    for column in columns:
+        key.update(column.dtype.str.encode())
+        key.update(np.ascontiguousarray(column).tobytes())
+    key = key.hexdigest()
+
+    text = _table_cache.get(key)
+    if text is None:
+        text = _format_table(name=name, columns=columns, first_row=first_row)
+        _table_cache[key] = text
+        if len(_table_cache) > _table_cache_size:
+            _table_cache.popitem(last=False)
+    else:
+        _table_cache.move_to_end(key)
+    return text
+
+
+def _format_table(name, columns, first_row):
+    """Formats a table, see format_table()"""
+    time = np.arange(1, hours_per_year + 1) * 3600
+    if first_row:
+        time = np.concatenate(([0], time))
+        columns = [np.concatenate((column[:1], column)) for column in columns]
+
+    cells = np.empty((len(time), len(columns) + 1), dtype=object)
+    cells[:, 0] = _format_column(time)
+    for i, column in enumerate(columns):
+        cells[:, i + 1] = _format_column(column)
+
+    rows = ["\t".join(row) for row in cells.tolist()]
+    return "#1\ndouble {}({}, {})\n{}\n".format(
+        name, len(time), len(columns) + 1, "\n".join(rows))
+
+
+def _format_column(column):
+    """Formats the values of a column like pandas.DataFrame.to_csv()
+
+    Only the distinct values are formatted, missing values are written as
+    empty strings.
+    """
+    if column.dtype.kind == "O":
+        return np.array(["" if value is None else str(value) for value in column], dtype=object)
+    values, inverse = np.unique(column, return_inverse=True)
+    strings = values.astype(str).astype(object)
+    if values.dtype.kind == "f":
+        strings[np.isnan(values)] = ""
+    return strings[inverse]
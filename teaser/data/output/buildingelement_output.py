@@ -56,6 +56,8 @@ def save_type_element(element, data_class):
             element=element, wall_out=data_class.element_bind[check_str]
         )
 
+        data_class.build_element_index()
+
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
             json.dumps(data_class.element_bind, indent=4, separators=(",", ": "))
@@ -86,6 +88,7 @@ def delete_type_element(element, data_class):
     )
 
     del data_class.element_bind[check_str]
+    data_class.build_element_index()
 
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
@@ -17,7 +17,8 @@ def export_ibpsa(
         buildings,
         prj,
         path=None,
-        library='AixLib'):
+        library='AixLib',
+        table_format='txt'):
     """Exports models for IBPSA library
 
     Export a building to several models for
@@ -51,6 +52,9 @@ def export_ibpsa(
         just a core set of models and should not be used standalone.
         Valid values are 'AixLib' (default), 'Buildings',
         'BuildingSystems' and 'IDEAS'.
+    table_format : str
+        File format of the internal gains tables, 'txt' (default) for text
+        files or 'mat' for MATLAB v4 files
 
      Attributes
     ----------
@@ -133,10 +137,12 @@ def export_ibpsa(
             bldg_path,
             bldg.name + "_Models")
 
+        bldg.library_attr.table_format = table_format
+
         for zone in bldg.thermal_zones:
 
             zone.parent.library_attr.file_internal_gains = \
-                'InternalGains_' + bldg.name + zone.name + '.txt'
+                'InternalGains_' + bldg.name + zone.name + '.' + table_format
             bldg.library_attr.modelica_gains_boundary(
                 zone=zone,
                 path=zone_path)
@@ -65,6 +65,8 @@ def save_material(material, data_class):
         data_class.material_bind[
             material.material_id]["solar_absorp"] = material.solar_absorp
 
+        data_class.build_material_index()
+
     with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
         file.write(json.dumps(
             data_class.material_bind,
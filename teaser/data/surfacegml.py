@@ -20,6 +20,16 @@ class SurfaceGML(object):
     boundary : str
         Name of the boundary surface
 
+    Attributes
+    ----------
+
+    gml_surface : list
+        list of gml points, for surfaces created with from_values() it is
+        only copied from the coordinates on first access
+    coordinates : np.array
+        gml points as float64 array, for surfaces created with from_values()
+        a view into the given coordinates
+
     """
 
     def __init__(self,
@@ -35,6 +45,75 @@ class SurfaceGML(object):
         self.surface_orientation = self.get_gml_orientation()
         self.surface_tilt = self.get_gml_tilt()
 
+    @classmethod
+    def from_values(cls,
+                    gml_surface,
+                    surface_area,
+                    surface_orientation,
+                    surface_tilt,
+                    boundary=None):
+        """Creates a surface from attributes that are already calculated
+
+        Used for surfaces of a SurfaceGMLBatch or the SurfaceGMLCache, the
+        attributes are not calculated again and the coordinates are kept as
+        a view instead of being copied into a list.
+
+        Parameters
+        ----------
+
+        gml_surface : np.array
+            gml points with srsDimension=3, e.g. a slice of the coordinates
+            of a SurfaceGMLBatch
+        surface_area : float
+            area of the surface
+        surface_orientation : float
+            TEASER orientation of the surface, NaN for None
+        surface_tilt : float
+            tilt of the surface, NaN for None
+        boundary : str
+            Name of the boundary surface
+
+        Returns
+        ----------
+
+        surface : SurfaceGML
+            surface with the given attributes
+        """
+        surface = cls.__new__(cls)
+        surface._gml_surface = None
+        surface._coordinates = np.asarray(gml_surface, dtype=np.float64)
+        surface.name = boundary
+        surface.surface_area = float(surface_area)
+        if np.isnan(surface_orientation):
+            surface.surface_orientation = None
+        elif surface_orientation in (-1, -2):
+            surface.surface_orientation = int(surface_orientation)
+        else:
+            surface.surface_orientation = float(surface_orientation)
+        if np.isnan(surface_tilt):
+            surface.surface_tilt = None
+        else:
+            surface.surface_tilt = float(surface_tilt)
+        return surface
+
+    @property
+    def gml_surface(self):
+        if self._gml_surface is None:
+            self._gml_surface = self._coordinates.tolist()
+            self._coordinates = None
+        return self._gml_surface
+
+    @gml_surface.setter
+    def gml_surface(self, value):
+        self._gml_surface = value
+        self._coordinates = None
+
+    @property
+    def coordinates(self):
+        if self._coordinates is not None:
+            return self._coordinates
+        return np.asarray(self._gml_surface, dtype=np.float64)
+
     def get_gml_area(self):
         """calc the area of a gml_surface defined by gml coordinates
 
@@ -201,4 +280,201 @@ class SurfaceGML(object):
             total[1] += prod[1]
             total[2] += prod[2]
         result = np.dot(total, self.unit_normal(poly[0], poly[1], poly[2]))
-        return abs(result / 2)
\ No newline at end of file
+        return abs(result / 2)
+
+
+class SurfaceGMLBatch(object):
+    """Class for calculating attributes of many CityGML surfaces at once
+
+    Calculates area, normal vector, tilt and TEASER orientation of all
+    surfaces of e.g. a building or a whole file in one vectorized pass, with
+    the same algorithms as SurfaceGML. The surfaces are given as one flat
+    coordinate buffer and the offsets of the surfaces in that buffer.
+
+    Parameters
+    ----------
+
+    coordinates : array_like
+        gml points with srsDimension=3 of all surfaces one after another,
+        for each surface the first 3 and the last 3 entries must describe
+        the same point in CityGML
+    offsets : array_like
+        start of each surface in coordinates and the end of the last
+        surface, the length is the number of surfaces + 1
+    names : list
+        Name of the boundary surface for each surface, default is None
+
+    Attributes
+    ----------
+
+    coordinates : np.array
+        read-only view of the given coordinates, the surfaces of the batch
+        are views into it
+    surface_area : np.array
+        area of the surfaces
+    surface_normal : np.array
+        normal vectors of the surfaces used for the orientation, shape
+        (number of surfaces, 3)
+    surface_tilt : np.array
+        tilt of the surfaces, NaN where SurfaceGML returns None
+    surface_orientation : np.array
+        TEASER orientation of the surfaces, NaN where SurfaceGML returns None
+
+    """
+
+    def __init__(self,
+                 coordinates,
+                 offsets,
+                 names=None):
+        self.coordinates = np.asarray(coordinates, dtype=np.float64).view()
+        self.coordinates.flags.writeable = False
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.names = names if names is not None else [None] * len(self)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.surface_area = self.get_gml_area()
+            self.surface_normal = self.get_gml_normal()
+            self.surface_orientation = self.get_gml_orientation()
+            self.surface_tilt = self.get_gml_tilt()
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def surface(self, index):
+        """Returns one surface as SurfaceGML with the calculated attributes
+
+        Parameters
+        ----------
+
+        index : int
+            index of the surface
+
+        Returns
+        ----------
+
+        surface : SurfaceGML
+            surface with the attributes of this batch
+        """
+        return SurfaceGML.from_values(
+            gml_surface=self.coordinates[
+                self.offsets[index]:self.offsets[index + 1]],
+            surface_area=self.surface_area[index],
+            surface_orientation=self.surface_orientation[index],
+            surface_tilt=self.surface_tilt[index],
+            boundary=self.names[index])
+
+    def surfaces(self):
+        """Returns all surfaces as list of SurfaceGML"""
+        return [self.surface(index) for index in range(len(self))]
+
+    def _points(self, number):
+        """Returns the given point of each surface, NaN if it has less
+        points"""
+        points = np.full((len(self), 3), np.nan)
+        position = self.offsets[:-1] + 3 * number
+        valid = position + 3 <= self.offsets[1:]
+        for dimension in range(3):
+            points[valid, dimension] = self.coordinates[
+                position[valid] + dimension]
+        return points
+
+    def get_gml_area(self):
+        """calc the area of all surfaces like SurfaceGML.poly_area()
+
+        Surfaces need to be planar
+
+        Returns
+        ----------
+        surface_area : np.array
+            returns the area of the surfaces
+        """
+        number_of_points = (self.offsets[1:] - self.offsets[:-1]) // 3
+        points = self.coordinates[:3 * (len(self.coordinates) // 3)].reshape(
+            -1, 3)
+        first = self.offsets[:-1] // 3
+        surface_index = np.repeat(np.arange(len(self)), number_of_points)
+        point_index = np.arange(len(surface_index))
+        next_index = point_index + 1
+        last = next_index == (first + number_of_points)[surface_index]
+        next_index[last] = first[surface_index[last]]
+
+        products = np.cross(points[point_index], points[next_index])
+        total = np.zeros((len(self), 3))
+        np.add.at(total, surface_index, products)
+
+        normal = np.cross(self._points(1) - self._points(0),
+                          self._points(2) - self._points(0))
+        unit_normal = normal / np.sqrt(np.sum(normal ** 2, axis=1))[:, None]
+
+        surface_area = np.abs(np.sum(total * unit_normal, axis=1) / 2)
+        surface_area[number_of_points < 3] = 0
+        return surface_area
+
+    def get_gml_normal(self):
+        """calc the normal vectors used for the orientation
+
+        Uses the points 1, 2 and 4 of surfaces with more than 4 points and
+        the points 1, 2 and 3 otherwise, like SurfaceGML.get_gml_orientation()
+
+        Returns
+        ----------
+        surface_normal : np.array
+            returns the normal vectors of the surfaces
+        """
+        first = self._points(0)
+        more_points = (self.offsets[1:] - self.offsets[:-1]) > 12
+        third = np.where(more_points[:, None], self._points(3),
+                         self._points(2))
+        return np.cross(self._points(1) - first, third - first)
+
+    def get_gml_tilt(self):
+        """calc the tilt of all surfaces like SurfaceGML.get_gml_tilt()
+
+        Returns
+        ----------
+        surface_tilt : np.array
+            returns the tilt of the surfaces
+        """
+        normal = np.cross(self._points(1) - self._points(0),
+                          self._points(2) - self._points(0))
+        surface_tilt = np.arccos(
+            normal[:, 2] / np.sqrt(np.sum(normal ** 2, axis=1))) * 360 / (
+            2 * np.pi)
+        surface_tilt[surface_tilt == 180] = 0.0
+        return surface_tilt
+
+    def get_gml_orientation(self):
+        """calc the orientation of all surfaces like
+        SurfaceGML.get_gml_orientation()
+
+        The orientation returned is in TEASER coordinates
+
+        Returns
+        ----------
+        surface_orientation : np.array
+            returns the orientation of the surfaces
+        """
+        normal_uni = self.surface_normal / np.sqrt(
+            np.sum(self.surface_normal ** 2, axis=1))[:, None]
+        x = normal_uni[:, 0]
+        y = normal_uni[:, 1]
+        z = normal_uni[:, 2]
+
+        phi = np.full(len(self), np.nan)
+        arctan = np.arctan(y / x)
+        phi = np.where(x > 0, arctan, phi)
+        phi = np.where((x < 0) & (y >= 0), arctan + np.pi, phi)
+        phi = np.where((x < 0) & (y < 0), arctan - np.pi, phi)
+        phi = np.where((x == 0) & (y > 0), np.pi / 2, phi)
+        phi = np.where((x == 0) & (y < 0), -np.pi / 2, phi)
+
+        surface_orientation = np.where(
+            phi < 0, (phi + 2 * np.pi) * 360 / (2 * np.pi),
+            phi * 360 / (2 * np.pi))
+        surface_orientation = np.where(
+            (surface_orientation >= 0) & (surface_orientation <= 90),
+            90 - surface_orientation, 450 - surface_orientation)
+
+        surface_orientation[z == -1] = -2
+        surface_orientation[z == 1] = -1
+        return surface_orientation
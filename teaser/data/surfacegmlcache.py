@@ -0,0 +1,194 @@
+import hashlib
+import os
+
+import numpy as np
+
+from teaser.data.surfacegml import SurfaceGML
+
+
+class SurfaceGMLCache(object):
+    """On-disk cache of the GML surfaces of the buildings of a CityGML file
+
+    The cache maps the gml:id of a CityGML Building (or BuildingPart) to the
+    surfaces that citygml_input.get_gml_surfaces() extracted from it: the
+    coordinates, the name and the derived area, orientation and tilt. All
+    surfaces of one CityGML file are stored column wise in one NumPy .npz
+    file, named after the hash of the file content, so a changed file never
+    uses outdated surfaces.
+
+    Parameters
+    ----------
+
+    cache_path : str
+        Path of the .npz file of the cache, None for a cache that is only
+        kept in memory (default)
+
+    Attributes
+    ----------
+
+    entries : dict
+        Surfaces per gml:id as a tuple of arrays (coordinates, offsets of
+        the surfaces in the coordinates, names, areas, orientations, tilts),
+        orientations and tilts that are None in SurfaceGML are NaN
+    new_entries : dict
+        Entries that were added since the cache was loaded or saved
+
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.entries = {}
+        self.new_entries = {}
+
+        if cache_path is not None and os.path.isfile(cache_path):
+            self.load()
+
+    @classmethod
+    def for_file(cls, path, cache_dir):
+        """Returns the cache of a CityGML file in the given directory
+
+        Parameters
+        ----------
+
+        path : str
+            Path of the CityGML file
+        cache_dir : str
+            Directory of the cache files, created if it does not exist
+
+        Returns
+        ----------
+
+        cache : SurfaceGMLCache
+            Cache stored in cache_dir/<hash of the file content>.npz
+        """
+        file_hash = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as gml_file:
+            for block in iter(lambda: gml_file.read(1 << 20), b""):
+                file_hash.update(block)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        return cls(
+            cache_path=os.path.join(cache_dir, file_hash.hexdigest() + ".npz"))
+
+    def get(self, gml_id):
+        """Returns the cached surfaces of a CityGML Building
+
+        Parameters
+        ----------
+
+        gml_id : str
+            gml:id of the CityGML Building or BuildingPart
+
+        Returns
+        ----------
+
+        surfaces : list
+            List of SurfaceGML instances, None if the building is not in the
+            cache
+        """
+        entry = self.entries.get(gml_id)
+        if entry is None:
+            return None
+
+        coords, offsets, names, areas, orientations, tilts = entry
+        coords = coords.view()
+        coords.flags.writeable = False
+        return [
+            SurfaceGML.from_values(
+                gml_surface=coords[offsets[i]:offsets[i + 1]],
+                surface_area=areas[i],
+                surface_orientation=orientations[i],
+                surface_tilt=tilts[i],
+                boundary=names[i] or None)
+            for i in range(len(areas))]
+
+    def put(self, gml_id, surfaces):
+        """Adds the surfaces of a CityGML Building to the cache
+
+        Parameters
+        ----------
+
+        gml_id : str
+            gml:id of the CityGML Building or BuildingPart
+        surfaces : list
+            List of SurfaceGML instances
+        """
+        coords = [surface.coordinates for surface in surfaces]
+        entry = (
+            np.concatenate(coords) if coords else np.zeros(0),
+            np.cumsum([0] + [len(coord) for coord in coords]),
+            np.array([surface.name or "" for surface in surfaces], dtype=str),
+            np.array([surface.surface_area for surface in surfaces],
+                     dtype=np.float64),
+            np.array([_to_float(surface.surface_orientation)
+                      for surface in surfaces], dtype=np.float64),
+            np.array([_to_float(surface.surface_tilt) for surface in surfaces],
+                     dtype=np.float64))
+        self.entries[gml_id] = entry
+        self.new_entries[gml_id] = entry
+
+    def subset(self, gml_ids):
+        """Returns an in-memory cache with the entries of the given gml:ids"""
+        cache = SurfaceGMLCache()
+        cache.entries = {gml_id: self.entries[gml_id] for gml_id in gml_ids
+                         if gml_id in self.entries}
+        return cache
+
+    def update(self, entries):
+        """Adds entries of another cache, e.g. new_entries of a subset"""
+        self.entries.update(entries)
+        self.new_entries.update(entries)
+
+    def load(self):
+        """Loads all entries from the .npz file of the cache"""
+        with np.load(self.cache_path) as data:
+            ids = data["ids"]
+            bldg_offsets = data["bldg_offsets"]
+            coord_offsets = data["coord_offsets"]
+            coords = data["coords"]
+            names = data["names"]
+            areas = data["areas"]
+            orientations = data["orientations"]
+            tilts = data["tilts"]
+
+        for i, gml_id in enumerate(ids.tolist()):
+            first, last = bldg_offsets[i], bldg_offsets[i + 1]
+            offsets = coord_offsets[first:last + 1]
+            self.entries[gml_id] = (
+                coords[offsets[0]:offsets[-1]],
+                offsets - offsets[0],
+                names[first:last],
+                areas[first:last],
+                orientations[first:last],
+                tilts[first:last])
+        self.new_entries = {}
+
+    def save(self):
+        """Writes all entries into the .npz file of the cache if new
+        entries were added"""
+        if self.cache_path is None or not self.new_entries:
+            return
+
+        ids = list(self.entries)
+        entries = [self.entries[gml_id] for gml_id in ids]
+        number_of_surfaces = [len(entry[3]) for entry in entries]
+        coord_offsets = [0]
+        for entry in entries:
+            coord_offsets.extend(coord_offsets[-1] + entry[1][1:])
+
+        np.savez(
+            self.cache_path,
+            ids=np.array(ids, dtype=str),
+            bldg_offsets=np.cumsum([0] + number_of_surfaces),
+            coord_offsets=np.array(coord_offsets, dtype=np.int64),
+            coords=np.concatenate([np.zeros(0)] + [entry[0] for entry in entries]),
+            names=np.concatenate([np.zeros(0, dtype=str)] + [entry[2] for entry in entries]),
+            areas=np.concatenate([np.zeros(0)] + [entry[3] for entry in entries]),
+            orientations=np.concatenate([np.zeros(0)] + [entry[4] for entry in entries]),
+            tilts=np.concatenate([np.zeros(0)] + [entry[5] for entry in entries]))
+        self.new_entries = {}
+
+
+def _to_float(value):
+    """Converts None into NaN for storage in float arrays"""
+    return np.nan if value is None else value
@@ -123,6 +123,9 @@ class Building(object):
         additional environmental indicators to the indicators from the thermalzones
     _estimate_elec_demand : float [MJ]
         estimate annual electric demand of the building (without heating)
+    calc_dirty : bool
+        True if one of the thermal zones changed since the last calculation,
+        see recalc_building_parameter()
 
     """
 
@@ -139,6 +142,7 @@ class Building(object):
         """
 
         self.parent = parent
+        self.calc_dirty = True
         self.name = name
         self.year_of_construction = year_of_construction
         self.net_leased_area = net_leased_area
@@ -196,9 +200,9 @@ class Building(object):
             max_help = 0
             min_help = 9999
             for surface in self.gml_surfaces:
-                z_value = surface.gml_surface[2::3]
-                max_help = max(max_help, max(z_value))
-                min_help = min(min_help, min(z_value))
+                z_value = surface.coordinates[2::3]
+                max_help = max(max_help, float(z_value.max()))
+                min_help = min(min_help, float(z_value.min()))
             self.bldg_height = max_help - min_help
 
     def get_footprint_gml(self, merge_building_part=False):
@@ -519,6 +523,56 @@ class Building(object):
             )
             self.sum_heat_load += zone.model_attr.heat_load
 
+        self._calc_library_attr()
+        self.calc_dirty = False
+
+    def recalc_building_parameter(
+        self, number_of_elements=2, merge_windows=False, used_library="AixLib"
+    ):
+        """recalc building parameters of changed zones
+
+        This functions recalculates only the zones that changed since their
+        last calculation (see ThermalZone.needs_recalc()), sums norm heat
+        load of all zones and updates the library attributes. Unchanged
+        zones keep their calculated parameters.
+
+        Parameters
+        ----------
+        number_of_elements : int
+            defines the number of elements, that area aggregated, between 1
+            and 4, default is 2
+        merge_windows : bool
+            True for merging the windows into the outer walls, False for
+            separate resistance for window, default is False
+        used_library : str
+            used library (AixLib and IBPSA are supported)
+        """
+
+        self._number_of_elements_calc = number_of_elements
+        self._merge_windows_calc = merge_windows
+        self._used_library_calc = used_library
+
+        for zone in self.thermal_zones:
+            if zone.needs_recalc(
+                number_of_elements=number_of_elements,
+                merge_windows=merge_windows,
+                t_bt=5,
+            ):
+                zone.calc_zone_parameters(
+                    number_of_elements=number_of_elements,
+                    merge_windows=merge_windows,
+                    t_bt=5,
+                )
+
+        self.sum_heat_load = sum(
+            zone.model_attr.heat_load for zone in self.thermal_zones
+        )
+        self._calc_library_attr()
+        self.calc_dirty = False
+
+    def _calc_library_attr(self):
+        """Sets and calculates the library attributes of the building"""
+
         if self.used_library_calc == self.library_attr.__class__.__name__:
             if self.used_library_calc == "AixLib":
                 self.library_attr.calc_auxiliary_attr()
@@ -119,12 +119,16 @@ class BuildingElement(object):
         additional environmental indicators to the indicators from the materials
     service_life : int [a]
         service_life of the building_element in years
+    calc_dirty : bool
+        True if the element changed since the last calculation of its
+        thermal zone, see ThermalZone.needs_recalc()
     """
 
     def __init__(self, parent=None):
         """Constructor for BuildingElement
         """
 
+        self.calc_dirty = True
         self.parent = parent
 
         self.internal_id = uuid.uuid1()
@@ -165,6 +169,16 @@ class BuildingElement(object):
         self._additional_lca_data = None
         self._service_life = None
 
+    def invalidate_calc(self):
+        """Marks the element and its parents for recalculation.
+
+        Called by setters of the element, its layers and materials, so that
+        Project.recalculate() only recalculates changed thermal zones.
+        """
+        self.calc_dirty = True
+        if self.parent is not None:
+            self.parent.invalidate_calc()
+
     def calc_ua_value(self):
         """U*A value for building element.
 
@@ -474,6 +488,7 @@ class BuildingElement(object):
             if (self.parent is not None and self.parent.parent is not None and
                     self.area is not None):
                 self.parent.parent.fill_window_area_dict()
+        self.invalidate_calc()
 
     @property
     def layer(self):
@@ -489,6 +504,7 @@ class BuildingElement(object):
                 self.inner_radiation is not None and\
                 self.area is not None:
             self.calc_ua_value()
+        self.invalidate_calc()
 
     @property
     def inner_convection(self):
@@ -513,6 +529,7 @@ class BuildingElement(object):
                 self.inner_radiation is not None and\
                 self.area is not None:
             self.calc_ua_value()
+        self.invalidate_calc()
 
     @property
     def inner_radiation(self):
@@ -537,6 +554,7 @@ class BuildingElement(object):
                 self.inner_radiation is not None and\
                 self.area is not None:
             self.calc_ua_value()
+        self.invalidate_calc()
 
     @property
     def outer_convection(self):
@@ -561,6 +579,7 @@ class BuildingElement(object):
                 self.inner_radiation is not None and\
                 self.area is not None:
             self.calc_ua_value()
+        self.invalidate_calc()
 
     @property
     def outer_radiation(self):
@@ -585,6 +604,7 @@ class BuildingElement(object):
                 self.inner_radiation is not None and\
                 self.area is not None:
             self.calc_ua_value()
+        self.invalidate_calc()
 
     @property
     def area(self):
@@ -618,6 +638,7 @@ class BuildingElement(object):
                 self.inner_radiation is not None and\
                 self.area is not None:
             self.calc_ua_value()
+        self.invalidate_calc()
 
     @property
     def tilt(self):
@@ -636,6 +657,7 @@ class BuildingElement(object):
                 self._tilt = value
             except:
                 raise ValueError("Can't convert tilt to float")
+        self.invalidate_calc()
 
     @property
     def year_of_construction(self):
@@ -91,6 +91,26 @@ class En15804IndicatorValue(object):
         
     
         
+    def freeze(self):
+        """Makes the values read-only
+
+        Used for values that are shared between materials, every further
+        attempt to set an attribute raises an AttributeError.
+        """
+        self.__class__ = _FrozenEn15804IndicatorValue
+
+    def copy(self):
+        """Returns a copy of the values that can be changed
+
+        Returns
+        -------
+        copy : En15804IndicatorValue
+            copy with the same unit and stage values, not frozen
+        """
+        new = En15804IndicatorValue.__new__(En15804IndicatorValue)
+        new.__dict__.update(self.__dict__)
+        return new
+
     def _validate_stage_value(self, value, stage_name):
         """Function to validate the value of an stage.
 
@@ -611,3 +631,12 @@ class En15804IndicatorValue(object):
                 
     
         
+
+
+class _FrozenEn15804IndicatorValue(En15804IndicatorValue):
+    """Read-only En15804IndicatorValue, see En15804IndicatorValue.freeze()"""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "En15804IndicatorValue is shared and read-only, change a copy() "
+            "of it instead")
@@ -124,6 +124,45 @@ class En15804LcaData(object):
         self._fallback_added = False
         
         
+    def freeze(self):
+        """Makes the LCA-data read-only
+
+        Used for LCA-data that is shared between materials. The indicator
+        values and fallbacks are frozen as well, every further attempt to
+        set one of their attributes raises an AttributeError.
+        """
+        for value in self.__dict__.values():
+            if isinstance(value, En15804IndicatorValue):
+                value.freeze()
+        if isinstance(self._fallback, dict):
+            for fallback in self._fallback.values():
+                fallback.freeze()
+        elif isinstance(self._fallback, list):
+            self._fallback = tuple(self._fallback)
+        self.__class__ = _FrozenEn15804LcaData
+
+    def copy(self):
+        """Returns a copy of the LCA-data that can be changed
+
+        Returns
+        -------
+        copy : En15804LcaData
+            copy with copies of all indicator values and fallbacks, not
+            frozen
+        """
+        new = En15804LcaData.__new__(En15804LcaData)
+        for name, value in self.__dict__.items():
+            if isinstance(value, En15804IndicatorValue):
+                value = value.copy()
+            new.__dict__[name] = value
+        if isinstance(self._fallback, dict):
+            new.__dict__["_fallback"] = {
+                stage: fallback.copy()
+                for stage, fallback in self._fallback.items()}
+        elif isinstance(self._fallback, (list, tuple)):
+            new.__dict__["_fallback"] = list(self._fallback)
+        return new
+
     def _check_unit(self, unit, unit_expected, var_name = None):
         """function to check if unit
 
@@ -876,3 +915,12 @@ class En15804LcaData(object):
                 
 
             
+
+
+class _FrozenEn15804LcaData(En15804LcaData):
+    """Read-only En15804LcaData, see En15804LcaData.freeze()"""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "En15804LcaData is shared and read-only, assign a copy() of it "
+            "instead")
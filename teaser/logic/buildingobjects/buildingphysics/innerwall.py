@@ -140,6 +140,8 @@ class InnerWall(Wall):
             else:
                 raise ValueError('Instance of InnerWall not known')
 
+            self.invalidate_calc()
+
             if self.parent.parent is not None:
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
@@ -63,6 +63,7 @@ class Layer(object):
 
             self.__parent = value
             self.__parent.layer.append(self)
+            self.__parent.invalidate_calc()
 
         else:
             self.__parent = None
@@ -78,6 +79,8 @@ class Layer(object):
         assert type(value).__name__ == ("Material"), ass_error_1
 
         self._material = value
+        if self.parent is not None:
+            self.parent.invalidate_calc()
 
     @property
     def thickness(self):
@@ -102,3 +105,5 @@ class Layer(object):
         if self.material is not None and self.parent is not None:
             if vars(self.material)['_thermal_conduc'] != 0:
                 self.parent.calc_ua_value()
+        if self.parent is not None:
+            self.parent.invalidate_calc()
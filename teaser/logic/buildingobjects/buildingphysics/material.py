@@ -14,6 +14,9 @@ class Material(object):
     """Material class
 
     This class holds information of Material used for building element layer.
+    If the project shares material templates (see
+    Project.share_material_templates), layers of type elements reference one
+    frozen Material per material id; use copy() to change it for one layer.
 
 
     Parameters
@@ -104,6 +107,81 @@ class Material(object):
                                      mat_name=mat_name,
                                      data_class=data_class)
 
+    def __setattr__(self, name, value):
+        """Sets an attribute unless the material is frozen
+
+        Raises
+        ------
+        AttributeError
+            if the material is shared between layers and frozen, see
+            freeze()
+        """
+        if self.__dict__.get("_frozen", False):
+            raise AttributeError(
+                "Material {} is shared between layers and read-only, assign "
+                "a copy() of it to the layer instead".format(self._name))
+        super(Material, self).__setattr__(name, value)
+
+    def freeze(self):
+        """Makes the material and its LCA data read-only
+
+        Used for materials that are shared between layers, every further
+        attempt to set an attribute raises an AttributeError.
+        """
+        if self._lca_data is not None:
+            self._lca_data.freeze()
+        self._thickness_list = tuple(self._thickness_list)
+        self._frozen = True
+
+    def copy(self, parent=None):
+        """Returns a copy of the material that can be changed
+
+        Parameters
+        ----------
+
+        parent : Layer()
+            Layer of the copy, default is None
+
+        Returns
+        ----------
+
+        copy : Material()
+            copy with copied LCA data, not frozen
+        """
+        new = Material.__new__(Material)
+        new.__dict__.update(self.__dict__)
+        new.__dict__["_frozen"] = False
+        new.__parent = None
+        new._thickness_list = list(self._thickness_list)
+        if self._lca_data is not None:
+            new._lca_data = self._lca_data.copy()
+            new._lca_data.parent = new
+        new.parent = parent
+        return new
+
+    def share_template(self, template):
+        """Copy of a material template that shares its LCA data.
+
+        Takes over all attributes of the template Material except of the
+        parent. The read-only LCA data of the template is shared with all
+        other materials copied from it; to change it, assign
+        lca_data.copy() to lca_data first.
+
+        Parameters
+        ----------
+
+        template : Material()
+            Frozen Material (without parent) to copy from, typically one of
+            DataClass.material_templates
+
+        """
+        parent = self.parent
+        self.__dict__.update(template.__dict__)
+        self.__dict__["_frozen"] = False
+        self.__parent = parent
+        self._thickness_list = list(template.thickness_list)
+        self.thermal_conduc = template.thermal_conduc
+
     def save_material_template(self, data_class):
         """Material saver.
 
@@ -151,6 +229,11 @@ class Material(object):
 
         material_output.modify_material(material=self, data_class=data_class)
 
+    def _invalidate_calc(self):
+        """Marks the building element of this material for recalculation"""
+        if self.parent is not None and self.parent.parent is not None:
+            self.parent.parent.invalidate_calc()
+
     @property
     def material_id(self):
         return self.__material_id
@@ -223,6 +306,7 @@ class Material(object):
                             not None and \
                             self.parent.parent.area is not None:
                         self.parent.parent.calc_ua_value()
+        self._invalidate_calc()
 
     @property
     def density(self):
@@ -241,6 +325,7 @@ class Material(object):
                 self._density = value
             except:
                 raise ValueError("Can't convert density to float")
+        self._invalidate_calc()
 
     @property
     def heat_capac(self):
@@ -259,6 +344,7 @@ class Material(object):
                 self._heat_capac = value
             except:
                 raise ValueError("Can't convert heat capacity to float")
+        self._invalidate_calc()
 
     @property
     def solar_absorp(self):
@@ -277,6 +363,7 @@ class Material(object):
                 self._solar_absorp = value
             except:
                 raise ValueError("Can't convert solar absorption to float")
+        self._invalidate_calc()
 
     @property
     def ir_emissivity(self):
@@ -295,6 +382,7 @@ class Material(object):
                 self._ir_emissivity = value
             except:
                 raise ValueError("Can't convert emissivity to float")
+        self._invalidate_calc()
 
     @property
     def transmittance(self):
@@ -313,6 +401,7 @@ class Material(object):
                 self._transmittance = value
             except:
                 raise ValueError("Can't convert transmittance to float")
+        self._invalidate_calc()
 
     @property
     def thickness_default(self):
@@ -138,6 +138,8 @@ class OuterWall(Wall):
             else:
                 raise ValueError('Instance of OuterWall not known')
 
+            self.invalidate_calc()
+
             if self.parent.parent is not None:
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
@@ -3,7 +3,7 @@ from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
-import numpy as np
+import teaser.logic.buildingobjects.calculation.vdi6007 as vdi6007
 import warnings
 
 class Wall(BuildingElement):
@@ -116,7 +116,8 @@ class Wall(BuildingElement):
         """Equivalent resistance according to VDI 6007.
 
         Calculates the equivalent resistance and capacity of a wall according
-        to VDI 6007 guideline. (Analogous model).
+        to VDI 6007 guideline. (Analogous model). To calculate many walls at
+        once use vdi6007.calc_equivalent_res_walls().
 
         Parameters
         ----------
@@ -124,105 +125,7 @@ class Wall(BuildingElement):
             Time constant according to VDI 6007 (default t_bt = 7)
         """
 
-        nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
-            self.gather_element_properties()
-
-        omega = 2 * np.pi / (86400 * t_bt)
-
-        r_layer = thickness / thermal_conduc
-        c_layer = heat_capac * density * thickness * 1000
-
-        re11 = np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.cos(np.sqrt(0.5 * omega * r_layer * c_layer))
-        im11 = np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.sin(np.sqrt(0.5 * omega * r_layer * c_layer))
-        re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re21 = (-1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im21 = (1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re22 = re11
-        im22 = im11
-
-        # -----setting up the matrix for each layer
-        a_layer = np.zeros((nr_of_layer, 4, 4))
-
-        for i, r in enumerate(re11):
-            a_layer[i][0][0] = r
-            a_layer[i][0][1] = im11[i]
-            a_layer[i][0][2] = re12[i]
-            a_layer[i][0][3] = im12[i]
-            a_layer[i][1][0] = -im11[i]
-            a_layer[i][1][1] = re11[i]
-            a_layer[i][1][2] = -im12[i]
-            a_layer[i][1][3] = re12[i]
-            a_layer[i][2][0] = re21[i]
-            a_layer[i][2][1] = im21[i]
-            a_layer[i][2][2] = re22[i]
-            a_layer[i][2][3] = im22[i]
-            a_layer[i][3][0] = -im21[i]
-            a_layer[i][3][1] = re21[i]
-            a_layer[i][3][2] = -im22[i]
-            a_layer[i][3][3] = re22[i]
-
-        # -----multiplication of the matrix
-        new_mat = np.diag(np.ones(4))
-
-        for count_layer in a_layer:
-            new_mat = np.dot(new_mat, count_layer)
-
-        # calculation of equivalent Resistance and capacities of each element
-        self.r1 = (1 / self.area) * ((new_mat[3][3] - 1) *
-                                     new_mat[0][2] + new_mat[2][3] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[3][3] - 1) ** 2 + new_mat[2][3] ** 2)
-        self.r2 = (1 / self.area) * ((new_mat[0][0] - 1) *
-                                     new_mat[0][2] + new_mat[0][1] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[0][0] - 1) ** 2 + new_mat[0][1] ** 2)
-        self.c1 = self.area * ((new_mat[3][3] - 1) ** 2 +
-                               (new_mat[2][3]) ** 2) / \
-            (omega * (new_mat[0][2] * new_mat[2][3] -
-                      (new_mat[3][3] - 1) * new_mat[0][3]))
-        self.c2 = self.area * ((new_mat[0][0] - 1) ** 2 +
-                               (new_mat[0][1]) ** 2) / (
-            omega * (new_mat[0][2] *
-                     new_mat[0][1] -
-                     (new_mat[0][0] - 1) *
-                     new_mat[0][3]))
-        self.r3 = (1 / self.area) * (np.sum(r_layer)) - self.r1 - self.r2
-
-        r_wall = self.r1 + self.r2 + self.r3
-
-        self.c1_korr = (1 / (omega * self.r1)) * ((r_wall * self.area -
-                                                   new_mat[0][2] * new_mat[3][
-                                                       3] -
-                                                   new_mat[0][3] * new_mat[2][
-                                                       3]) /
-                                                  (new_mat[3][3] * new_mat[0][
-                                                      3] -
-                                                   new_mat[0][2] * new_mat[2][
-                                                       3]))
-
-        if type(self).__name__ == "OuterWall" \
-                or type(self).__name__ == "Rooftop" \
-                or type(self).__name__ == "GroundFloor":
-            self.c1 = self.c1_korr
+        vdi6007.calc_equivalent_res_walls([self], t_bt=t_bt)
 
     def insulate_wall(
             self,
@@ -204,6 +204,8 @@ class Window(BuildingElement):
             else:
                 raise ValueError('Instance of Window not known')
 
+            self.invalidate_calc()
+
             if self.parent.parent is not None:
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
@@ -230,6 +232,7 @@ class Window(BuildingElement):
                 self._g_value = value
             except:
                 raise ValueError("Can't convert g value to float")
+        self.invalidate_calc()
 
     @property
     def a_conv(self):
@@ -248,6 +251,7 @@ class Window(BuildingElement):
                 self._a_conv = value
             except:
                 raise ValueError("Can't convert a conv to float")
+        self.invalidate_calc()
 
     @property
     def shading_g_total(self):
@@ -266,6 +270,7 @@ class Window(BuildingElement):
                 self._shading_g_total = value
             except:
                 raise ValueError("Can't convert shaded g value to float")
+        self.invalidate_calc()
 
     @property
     def shading_max_irr(self):
@@ -284,3 +289,4 @@ class Window(BuildingElement):
                 self._shading_max_irr = value
             except:
                 raise ValueError("Can't convert max irradiation to float")
+        self.invalidate_calc()
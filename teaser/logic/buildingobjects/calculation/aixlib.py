@@ -1,9 +1,9 @@
 """This module includes AixLib calculation class."""
 
 import teaser.logic.utilities as utilities
-from itertools import cycle, islice
+import teaser.data.output.boundarytable as boundarytable
+import numpy as np
 import os
-import pandas as pd
 
 
 class AixLib(object):
@@ -29,6 +29,10 @@ class AixLib(object):
         Filename for AHU boundary conditions file
     file_internal_gains : str
         Filename for internal gains file
+    table_format : str
+        File format of the boundary condition tables, "txt" (default) for
+        text files or "mat" for MATLAB v4 files. Setting it changes the
+        extensions of the file names accordingly
     version : str
         Used AixLib version, default should always be current master version
         of GitHub
@@ -61,6 +65,7 @@ class AixLib(object):
         self.file_set_t_cool = "TsetCool_" + self.parent.name + ".txt"
         self.file_ahu = "AHU_" + self.parent.name + ".txt"
         self.file_internal_gains = "InternalGains_" + self.parent.name + ".txt"
+        self._table_format = "txt"
         self.version = "1.0.0"
         self.total_surface_area = None
         self.consider_heat_capacity = True
@@ -68,6 +73,24 @@ class AixLib(object):
         self.use_set_point_temperature_profile_heating = False
         self.use_set_back_cool = False
 
+    @property
+    def table_format(self):
+        return self._table_format
+
+    @table_format.setter
+    def table_format(self, value):
+        ass_error = "table_format has to be 'txt' or 'mat'"
+        assert value in boundarytable.table_formats, ass_error
+
+        self._table_format = value
+        self.file_set_t_heat = boundarytable.table_file_name(
+            self.file_set_t_heat, value)
+        self.file_set_t_cool = boundarytable.table_file_name(
+            self.file_set_t_cool, value)
+        self.file_ahu = boundarytable.table_file_name(self.file_ahu, value)
+        self.file_internal_gains = boundarytable.table_file_name(
+            self.file_internal_gains, value)
+
     def calc_auxiliary_attr(self):
         """Call function to calculate all auxiliary attributes for AixLib."""
         self._calc_surface_area()
@@ -103,7 +126,7 @@ class AixLib(object):
         self.total_surface_area = surf_area_temp
 
     def modelica_set_temp(self, path=None):
-        """Create .txt file for set temperatures for heating.
+        """Create table file for set temperatures for heating.
 
         This function creates a txt for set temperatures of each
         zone, that are all saved into one matrix.
@@ -122,29 +145,18 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_set_t_heat)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
+        boundarytable.write_table(
+            path=path,
+            name="Tset",
+            columns=[
+                zone_count.use_conditions.schedules["heating_profile"].to_numpy()
+                for zone_count in self.parent.thermal_zones
+            ],
+            table_format=self.table_format,
         )
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "heating_profile"
-            ]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
     def modelica_set_temp_cool(self, path=None):
-        """Create .txt file for set temperatures cooling.
+        """Create table file for set temperatures cooling.
 
         This function creates a txt for set temperatures for cooling
         of each zone, that are all saved into one matrix.
@@ -164,29 +176,18 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_set_t_cool)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
+        boundarytable.write_table(
+            path=path,
+            name="Tset",
+            columns=[
+                zone_count.use_conditions.schedules["cooling_profile"].to_numpy()
+                for zone_count in self.parent.thermal_zones
+            ],
+            table_format=self.table_format,
         )
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "cooling_profile"
-            ]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
     def modelica_AHU_boundary(self, path=None):
-        """Create .txt file for AHU boundary conditions (building).
+        """Create table file for AHU boundary conditions (building).
 
         This function creates a txt for building AHU boundary
         conditions
@@ -223,28 +224,20 @@ class AixLib(object):
         path = os.path.join(path, self.file_ahu)
 
         if self.parent.with_ahu is True:
-            export = self.parent.central_ahu.schedules
+            schedules = self.parent.central_ahu.schedules
+            columns = [schedules[column].to_numpy() for column in schedules.columns]
         else:  # Dummy values for Input Table
-            export = pd.DataFrame(
-                index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-                .to_series()
-                .dt.strftime("%m-%d %H:%M:%S")
-            )
-
-            export["temperature_profile"] = list(islice(cycle([293.15, 293.15]), 8760))
-            export["min_relative_humidity_profile"] = list(islice(cycle([0, 0]), 8760))
-            export["max_relative_humidity_profile"] = list(islice(cycle([1, 1]), 8760))
-            export["v_flow_profile"] = list(islice(cycle([0, 1]), 8760))
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write("double AHU({}, {})\n".format(8760, 5))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+            columns = [
+                np.resize(np.asarray(profile), 8760)
+                for profile in ([293.15, 293.15], [0, 0], [1, 1], [0, 1])
+            ]
+
+        boundarytable.write_table(
+            path=path, name="AHU", columns=columns, table_format=self.table_format
+        )
 
     def modelica_gains_boundary(self, path=None):
-        """Create .txt file for internal gains boundary conditions.
+        """Create table file for internal gains boundary conditions.
 
         This function creates a matfile (-v4) for building internal gains
         boundary conditions. It collects all internal gain profiles of the
@@ -275,33 +268,19 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
+        columns = []
         for zone_count in self.parent.thermal_zones:
-            export[
-                "person_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["persons_profile"]
-            export[
-                "machines_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["machines_profile"]
-            export[
-                "lighting_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["lighting_profile"]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Internals({}, {})\n".format(
-                    8760, (len(self.parent.thermal_zones) * 3 + 1)
-                )
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+            schedules = zone_count.use_conditions.schedules
+            columns.append(schedules["persons_profile"].to_numpy())
+            columns.append(schedules["machines_profile"].to_numpy())
+            columns.append(schedules["lighting_profile"].to_numpy())
+
+        boundarytable.write_table(
+            path=path,
+            name="Internals",
+            columns=columns,
+            table_format=self.table_format,
+        )
 
     def _delete_file(self, path):
         """Delete a file before new information is written to it.
@@ -1,7 +1,7 @@
 """This module includes IBPSA calculation class."""
 
 import os
-import pandas as pd
+import teaser.data.output.boundarytable as boundarytable
 import teaser.logic.utilities as utilities
 
 
@@ -22,6 +22,10 @@ class IBPSA(object):
     ----------
     file_internal_gains : str
         Filename for internal gains file
+    table_format : str
+        File format of the boundary condition tables, "txt" (default) for
+        text files or "mat" for MATLAB v4 files. Setting it changes the
+        extension of the file name accordingly
     version : dict
         Dictionary with supported libraries and their version numbers
     consider_heat_capacity : bool
@@ -35,6 +39,7 @@ class IBPSA(object):
         """Construct IBPSA."""
         self.parent = parent
         self.file_internal_gains = "InternalGains_" + self.parent.name + ".mat"
+        self._table_format = "txt"
         self.version = {
             "AixLib": "1.0.0",
             "Buildings": "7.0.0",
@@ -43,6 +48,19 @@ class IBPSA(object):
         }
         self.consider_heat_capacity = True
 
+    @property
+    def table_format(self):
+        return self._table_format
+
+    @table_format.setter
+    def table_format(self, value):
+        ass_error = "table_format has to be 'txt' or 'mat'"
+        assert value in boundarytable.table_formats, ass_error
+
+        self._table_format = value
+        self.file_internal_gains = boundarytable.table_file_name(
+            self.file_internal_gains, value)
+
     def modelica_gains_boundary(self, zone, path=None):
         """creates .mat file for internal gains boundary conditions
 
@@ -83,43 +101,35 @@ class IBPSA(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
-        export["person_rad_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
+        persons = zone.use_conditions.schedules["persons_profile"].to_numpy()
+        machines = zone.use_conditions.schedules["machines_profile"].to_numpy()
+        columns = [
+            persons
             * (1 - zone.use_conditions.ratio_conv_rad_persons)
             * zone.use_conditions.fixed_heat_flow_rate_persons
             * zone.use_conditions.persons
-            * zone.area
-        )
-        export["person_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
+            * zone.area,
+            persons
             * zone.use_conditions.ratio_conv_rad_persons
             * zone.use_conditions.fixed_heat_flow_rate_persons
             * zone.use_conditions.persons
-            * zone.area
-        )
-        export["machines_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["machines_profile"]
+            * zone.area,
+            machines
             * zone.use_conditions.ratio_conv_rad_machines
             * zone.use_conditions.machines
-            * zone.area
+            * zone.area,
+        ]
+
+        # The size of the dataset is always 4 columns as each thermal zone has its own data file,
+        # the first row with t=0 is added.
+        boundarytable.write_table(
+            path=path,
+            name="Internals",
+            columns=columns,
+            first_row=True,
+            table_format=self.table_format,
         )
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            # The size of the dataset is always 4 columns as each thermal zone has its own data file.
-            f.write("double Internals(8761, 4)\n")
-            # write the first row with t=0
-            f.write("0\t{}".format(export.iloc[:1, :].to_csv(sep="\t", header=False, index=False)))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
     def _delete_file(self, path):
         """Delete a file before new information is written to it.
 
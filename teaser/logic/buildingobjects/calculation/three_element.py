@@ -4,6 +4,7 @@ from __future__ import division
 import math
 import random
 import warnings
+import teaser.logic.buildingobjects.calculation.vdi6007 as vdi6007
 
 
 class ThreeElement(object):
@@ -461,21 +462,23 @@ class ThreeElement(object):
 
         outer_walls = self.thermal_zone.outer_walls + self.thermal_zone.rooftops
 
+        vdi6007.calc_equivalent_res_walls(
+            outer_walls + self.thermal_zone.ground_floors
+        )
         for out_wall in outer_walls:
-            out_wall.calc_equivalent_res()
             out_wall.calc_ua_value()
         for gf in self.thermal_zone.ground_floors:
-            gf.calc_equivalent_res()
             gf.calc_ua_value()
         for win in self.thermal_zone.windows:
             win.calc_equivalent_res()
             win.calc_ua_value()
-        for inner_wall in (
+        inner_walls = (
             self.thermal_zone.inner_walls
             + self.thermal_zone.floors
             + self.thermal_zone.ceilings
-        ):
-            inner_wall.calc_equivalent_res()
+        )
+        vdi6007.calc_equivalent_res_walls(inner_walls)
+        for inner_wall in inner_walls:
             inner_wall.calc_ua_value()
 
         self.set_calc_default()
@@ -546,7 +549,9 @@ class ThreeElement(object):
         """Parallel connection of walls according to VDI 6007
 
         Calculates the parallel connection of wall elements according to VDI
-        6007, resulting in R1 and C1 (equation 23, 24).
+        6007, resulting in R1 and C1 (equation 23, 24). The pairwise
+        combination is evaluated in closed form for all walls at once, see
+        vdi6007.calc_parallel_connection.
 
         Parameters
         ----------
@@ -563,88 +568,11 @@ class ThreeElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
-
-            if wall_count == 0:
-
-                r1 = (
-                    element_list[wall_count].r1 * element_list[wall_count].c1 ** 2
-                    + element_list[wall_count + 1].r1
-                    * element_list[wall_count + 1].c1 ** 2
-                    + omega ** 2
-                    * element_list[wall_count].r1
-                    * element_list[wall_count + 1].r1
-                    * (element_list[wall_count].r1 + element_list[wall_count + 1].r1)
-                    * element_list[wall_count].c1 ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    (element_list[wall_count].c1 + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (element_list[wall_count].r1 + element_list[wall_count + 1].r1)
-                    ** 2
-                    * element_list[wall_count].c1 ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                )
-
-                c1 = (
-                    (element_list[wall_count].c1 + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (element_list[wall_count].r1 + element_list[wall_count + 1].r1)
-                    ** 2
-                    * element_list[wall_count].c1 ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    element_list[wall_count].c1
-                    + element_list[wall_count + 1].c1
-                    + omega ** 2
-                    * (
-                        element_list[wall_count].r1 ** 2 * element_list[wall_count].c1
-                        + element_list[wall_count + 1].r1 ** 2
-                        * element_list[wall_count + 1].c1
-                    )
-                    * element_list[wall_count].c1
-                    * element_list[wall_count + 1].c1
-                )
-            else:
-                r1x = r1
-                c1x = c1
-                r1 = (
-                    r1x * c1x ** 2
-                    + element_list[wall_count + 1].r1
-                    * element_list[wall_count + 1].c1 ** 2
-                    + omega ** 2
-                    * r1x
-                    * element_list[wall_count + 1].r1
-                    * (r1x + element_list[wall_count + 1].r1)
-                    * c1x ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    (c1x + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (r1x + element_list[wall_count + 1].r1) ** 2
-                    * c1x ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                )
-
-                c1 = (
-                    (c1x + element_list[wall_count + 1].c1) ** 2
-                    + omega ** 2
-                    * (r1x + element_list[wall_count + 1].r1) ** 2
-                    * c1x ** 2
-                    * element_list[wall_count + 1].c1 ** 2
-                ) / (
-                    c1x
-                    + element_list[wall_count + 1].c1
-                    + omega ** 2
-                    * (
-                        r1x ** 2 * c1x
-                        + element_list[wall_count + 1].r1 ** 2
-                        * element_list[wall_count + 1].c1
-                    )
-                    * c1x
-                    * element_list[wall_count + 1].c1
-                )
-        return r1, c1
+        return vdi6007.calc_parallel_connection(
+            r1=[element.r1 for element in element_list],
+            c1=[element.c1 for element in element_list],
+            omega=omega,
+        )
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -1091,8 +1019,8 @@ class ThreeElement(object):
             + self.thermal_zone.ceilings
         )
 
+        vdi6007.calc_equivalent_res_walls(inner_walls)
         for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
             in_wall.calc_ua_value()
 
         if 0 < len(inner_walls) <= 1:
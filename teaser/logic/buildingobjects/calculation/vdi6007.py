@@ -0,0 +1,393 @@
+"""This module contains vectorized calculations according to VDI 6007.
+
+The functions work on many building elements at once. Layer properties of
+all elements are stored in arrays of shape (number of elements, maximal
+number of layers), elements with fewer layers are padded. Padded layers do
+not contribute to the results.
+
+Results are memoized per layer stack. Archetype buildings reuse a small
+number of constructions, so the equivalent resistances and capacities are
+stored for a unit area of 1 m² and scaled by the area of each wall.
+"""
+
+import collections
+import numpy as np
+
+
+class EquivalentResCache(object):
+    """Size-bounded LRU cache of equivalent resistances per layer stack.
+
+    The cache maps the signature of a layer stack (see layer_signature) to
+    the equivalent resistances and capacities of a wall with 1 m² area.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximal number of cached layer stacks, least recently used entries
+        are evicted first (default 4096)
+
+    Attributes
+    ----------
+    hits : int
+        Number of walls whose results were taken from the cache
+    misses : int
+        Number of walls whose results had to be calculated
+    """
+
+    def __init__(self, maxsize=4096):
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+
+        return len(self._entries)
+
+    def get(self, signature, count=1):
+        """Returns cached per-m² results or None, counts hits and misses
+
+        Parameters
+        ----------
+        signature : tuple
+            Signature of the layer stack, see layer_signature
+        count : int
+            Number of walls with this signature, added to hits or misses
+            (default 1)
+        """
+
+        try:
+            values = self._entries[signature]
+        except KeyError:
+            self.misses += count
+            return None
+        self._entries.move_to_end(signature)
+        self.hits += count
+        return values
+
+    def put(self, signature, values):
+        """Stores per-m² results and evicts least recently used entries"""
+
+        self._entries[signature] = values
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all entries and resets the counters"""
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        """Returns hits, misses, maxsize and current size of the cache"""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._entries),
+        }
+
+
+equivalent_res_cache = EquivalentResCache()
+
+
+def layer_signature(element, t_bt=7):
+    """Returns the hashable signature of the layer stack of an element.
+
+    Parameters
+    ----------
+    element : BuildingElement
+        TEASER BuildingElement instance
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    signature : tuple
+        Tuple of (density, thermal_conduc, heat_capac, thickness) of each
+        layer, followed by t_bt
+    """
+    return tuple(
+        (
+            layer.material.density,
+            layer.material.thermal_conduc,
+            layer.material.heat_capac,
+            layer.thickness,
+        )
+        for layer in element.layer
+    ) + (t_bt,)
+
+
+def gather_layer_properties(elements):
+    """Gathers the layer properties of building elements into padded arrays.
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER BuildingElement instances
+
+    Returns
+    ----------
+    number_of_layer : np.array
+        Number of layer of each element, shape (n,)
+    density : np.array
+        Density of each layer, shape (n, max(number_of_layer))
+    thermal_conduc : np.array
+        Thermal conductivity of each layer, shape (n, max(number_of_layer))
+    heat_capac : np.array
+        Heat capacity of each layer, shape (n, max(number_of_layer))
+    thickness : np.array
+        Thickness of each layer, shape (n, max(number_of_layer))
+    area : np.array
+        Area of each element, shape (n,)
+    """
+    number_of_layer = np.array([len(element.layer) for element in elements], dtype=int)
+    max_layer = max(number_of_layer.max(initial=0), 1)
+
+    density = np.zeros((len(elements), max_layer))
+    thermal_conduc = np.zeros((len(elements), max_layer))
+    heat_capac = np.zeros((len(elements), max_layer))
+    thickness = np.zeros((len(elements), max_layer))
+    area = np.zeros(len(elements))
+
+    for i, element in enumerate(elements):
+        area[i] = element.area
+        for j, layer in enumerate(element.layer):
+            density[i, j] = layer.material.density
+            thermal_conduc[i, j] = layer.material.thermal_conduc
+            heat_capac[i, j] = layer.material.heat_capac
+            thickness[i, j] = layer.thickness
+
+    return number_of_layer, density, thermal_conduc, heat_capac, thickness, area
+
+
+def calc_equivalent_res_layers(
+    number_of_layer, density, thermal_conduc, heat_capac, thickness, area, t_bt=7
+):
+    """Equivalent resistances and capacities according to VDI 6007.
+
+    Vectorized calculation of the analogous model of VDI 6007 for many
+    walls. The 4x4 transfer matrices of all layers are evaluated at once
+    and chained layer position by layer position for all walls together.
+
+    Parameters
+    ----------
+    number_of_layer : np.array
+        Number of layer of each wall, shape (n,)
+    density : np.array
+        Density of each layer, shape (n, m)
+    thermal_conduc : np.array
+        Thermal conductivity of each layer, shape (n, m)
+    heat_capac : np.array
+        Heat capacity of each layer, shape (n, m)
+    thickness : np.array
+        Thickness of each layer, shape (n, m)
+    area : np.array
+        Area of each wall, shape (n,)
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    r1, r2, r3, c1, c2, c1_korr : np.array
+        Equivalent resistances [K/W] and capacities [J/K] of each wall,
+        shape (n,)
+    """
+    number_of_layer = np.asarray(number_of_layer, dtype=int)
+    area = np.asarray(area, dtype=float)
+    real_layer = (
+        np.arange(np.shape(thickness)[1])[np.newaxis, :]
+        < number_of_layer[:, np.newaxis]
+    )
+
+    # padded layers get dummy properties and are replaced by unit matrices
+    density = np.where(real_layer, density, 1.0)
+    thermal_conduc = np.where(real_layer, thermal_conduc, 1.0)
+    heat_capac = np.where(real_layer, heat_capac, 1.0)
+    thickness = np.where(real_layer, thickness, 1.0)
+
+    omega = 2 * np.pi / (86400 * t_bt)
+
+    r_layer = thickness / thermal_conduc
+    c_layer = heat_capac * density * thickness * 1000
+
+    arg = np.sqrt(0.5 * omega * r_layer * c_layer)
+    cosh_cos = np.cosh(arg) * np.cos(arg)
+    sinh_sin = np.sinh(arg) * np.sin(arg)
+    cosh_sin = np.cosh(arg) * np.sin(arg)
+    sinh_cos = np.sinh(arg) * np.cos(arg)
+
+    re11 = cosh_cos
+    im11 = sinh_sin
+    re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * (
+        cosh_sin + sinh_cos
+    )
+    im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * (
+        cosh_sin - sinh_cos
+    )
+    re21 = (-1 / r_layer) * arg * (cosh_sin - sinh_cos)
+    im21 = (1 / r_layer) * arg * (cosh_sin + sinh_cos)
+    re22 = re11
+    im22 = im11
+
+    # -----setting up the matrix for each layer, shape (n, m, 4, 4)
+    a_layer = np.stack(
+        [
+            np.stack([re11, im11, re12, im12], axis=-1),
+            np.stack([-im11, re11, -im12, re12], axis=-1),
+            np.stack([re21, im21, re22, im22], axis=-1),
+            np.stack([-im21, re21, -im22, re22], axis=-1),
+        ],
+        axis=-2,
+    )
+    a_layer = np.where(real_layer[:, :, np.newaxis, np.newaxis], a_layer, np.eye(4))
+
+    # -----multiplication of the matrix
+    new_mat = np.broadcast_to(np.eye(4), (len(area), 4, 4))
+    for count_layer in range(a_layer.shape[1]):
+        new_mat = np.matmul(new_mat, a_layer[:, count_layer])
+
+    m00 = new_mat[:, 0, 0]
+    m01 = new_mat[:, 0, 1]
+    m02 = new_mat[:, 0, 2]
+    m03 = new_mat[:, 0, 3]
+    m23 = new_mat[:, 2, 3]
+    m33 = new_mat[:, 3, 3]
+
+    # calculation of equivalent Resistance and capacities of each element
+    r1 = (1 / area) * ((m33 - 1) * m02 + m23 * m03) / ((m33 - 1) ** 2 + m23 ** 2)
+    r2 = (1 / area) * ((m00 - 1) * m02 + m01 * m03) / ((m00 - 1) ** 2 + m01 ** 2)
+    c1 = area * ((m33 - 1) ** 2 + m23 ** 2) / (omega * (m02 * m23 - (m33 - 1) * m03))
+    c2 = area * ((m00 - 1) ** 2 + m01 ** 2) / (omega * (m02 * m01 - (m00 - 1) * m03))
+    r3 = (1 / area) * np.sum(np.where(real_layer, r_layer, 0.0), axis=1) - r1 - r2
+
+    r_wall = r1 + r2 + r3
+
+    c1_korr = (1 / (omega * r1)) * (
+        (r_wall * area - m02 * m33 - m03 * m23) / (m33 * m03 - m02 * m23)
+    )
+
+    return r1, r2, r3, c1, c2, c1_korr
+
+
+def calc_equivalent_res_walls(walls, t_bt=7, cache=equivalent_res_cache):
+    """Equivalent resistance according to VDI 6007 for many walls at once.
+
+    Calculates the equivalent resistances and capacities of all given walls
+    (e.g. all walls of a zone, building or project) in one vectorized pass
+    and sets r1, r2, r3, c1, c2 and c1_korr of each wall. For OuterWalls,
+    Rooftops and GroundFloors c1 is set to c1_korr. Only layer stacks that
+    are not in the cache are calculated, all others are scaled from the
+    cached results for 1 m².
+
+    Parameters
+    ----------
+    walls : list
+        List of TEASER Wall instances
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+    cache : EquivalentResCache
+        Cache of per-m² results, None disables caching (default
+        equivalent_res_cache)
+    """
+    if len(walls) == 0:
+        return
+
+    for wall in walls:
+        if wall.area is None:
+            raise TypeError("Area of wall {} is None".format(wall.name))
+        elif wall.area == 0:
+            raise ZeroDivisionError("Area of wall {} is zero".format(wall.name))
+
+    signatures = [layer_signature(wall, t_bt) for wall in walls]
+    per_m2 = {}
+    missing = []
+    for signature, count in collections.Counter(signatures).items():
+        values = cache.get(signature, count) if cache is not None else None
+        if values is None:
+            missing.append(signature)
+            per_m2[signature] = None
+        else:
+            per_m2[signature] = values
+
+    if missing:
+        results = calc_equivalent_res_layers(
+            *_signature_arrays(missing), area=np.ones(len(missing)), t_bt=t_bt
+        )
+        for i, signature in enumerate(missing):
+            values = tuple(float(result[i]) for result in results)
+            per_m2[signature] = values
+            if cache is not None:
+                cache.put(signature, values)
+
+    for wall, signature in zip(walls, signatures):
+        r1, r2, r3, c1, c2, c1_korr = per_m2[signature]
+        wall.r1 = r1 / wall.area
+        wall.r2 = r2 / wall.area
+        wall.r3 = r3 / wall.area
+        wall.c1 = c1 * wall.area
+        wall.c2 = c2 * wall.area
+        wall.c1_korr = c1_korr * wall.area
+
+        if (
+            type(wall).__name__ == "OuterWall"
+            or type(wall).__name__ == "Rooftop"
+            or type(wall).__name__ == "GroundFloor"
+        ):
+            wall.c1 = wall.c1_korr
+
+
+def _signature_arrays(signatures):
+    """Padded layer arrays of layer stack signatures, see layer_signature"""
+    number_of_layer = np.array(
+        [len(signature) - 1 for signature in signatures], dtype=int
+    )
+    max_layer = max(number_of_layer.max(initial=0), 1)
+
+    properties = np.zeros((4, len(signatures), max_layer))
+    for i, signature in enumerate(signatures):
+        if number_of_layer[i] > 0:
+            properties[:, i, : number_of_layer[i]] = np.array(
+                signature[:-1], dtype=float
+            ).T
+
+    density, thermal_conduc, heat_capac, thickness = properties
+    return number_of_layer, density, thermal_conduc, heat_capac, thickness
+
+
+def calc_parallel_connection(r1, c1, omega):
+    """Parallel connection of walls according to VDI 6007
+
+    Calculates the parallel connection of wall elements according to VDI
+    6007, resulting in R1 and C1 (equation 23, 24). Instead of combining
+    the walls pairwise, the complex admittances j*omega*C1 / (1 +
+    j*omega*R1*C1) of all walls are summed up in one pass and converted back
+    to R1 and C1. For two walls this is identical to equation 23 and 24.
+
+    Parameters
+    ----------
+    r1 : list or np.array
+        VDI 6007 resistance of each wall [K/W]
+    c1 : list or np.array
+        VDI 6007 capacity of each wall [J/K]
+    omega : float
+        VDI 6007 frequency
+
+    Returns
+    ----------
+    r1 : float [K/W]
+        VDI 6007 resistance for all walls
+    c1 : float [J/K]
+        VDI 6007 capacity for all walls
+    """
+    r1 = np.asarray(r1, dtype=float)
+    c1 = np.asarray(c1, dtype=float)
+
+    admittance = np.sum(1j * omega * c1 / (1 + 1j * omega * r1 * c1))
+    impedance = 1 / admittance
+
+    return float(impedance.real), float(-1 / (omega * impedance.imag))
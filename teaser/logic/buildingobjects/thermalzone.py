@@ -80,6 +80,9 @@ class ThermalZone(object):
         average density of the air in the thermal zone
     heat_capac_air : float [J/K]
         average heat capacity of the air in the thermal zone
+    calc_dirty : bool
+        True if the zone changed since its last calculation, see
+        needs_recalc()
     """
 
     def __init__(self, parent=None):
@@ -88,6 +91,8 @@ class ThermalZone(object):
 
         self.parent = parent
 
+        self.calc_dirty = True
+        self._calc_element_count = None
         self.internal_id = uuid.uuid1()
         self.name = None
         self._area = None
@@ -171,6 +176,78 @@ class ThermalZone(object):
                 t_bt=t_bt)
             self.model_attr.calc_attributes()
 
+        elements = self._all_elements()
+        for element in elements:
+            element.calc_dirty = False
+        self._calc_element_count = len(elements)
+        self.calc_dirty = False
+
+    def invalidate_calc(self):
+        """Marks the zone and its building for recalculation.
+
+        Called by setters of the zone, of its building elements and of its
+        UseConditions, so that Project.recalculate() only recalculates changed
+        thermal zones. Changes of lists in place are not tracked, call this
+        function after modifying them.
+        """
+        self.calc_dirty = True
+        if self.parent is not None:
+            self.parent.calc_dirty = True
+
+    def needs_recalc(self, number_of_elements=2, merge_windows=False, t_bt=5):
+        """Checks if the zone has to be recalculated
+
+        The zone has to be recalculated if it or one of its building elements
+        changed, if building elements were added or removed or if it was
+        calculated with other settings since the last call of
+        calc_zone_parameters().
+
+        Parameters
+        ----------
+        number_of_elements : int
+            defines the number of elements, that area aggregated, between 1
+            and 4, default is 2
+        merge_windows : bool
+            True for merging the windows into the outer walls, False for
+            separate resistance for window, default is False
+        t_bt : float
+            Time constant according to VDI 6007 (default t_bt = 5)
+
+        Returns
+        ----------
+        needs_recalc : bool
+            True if calc_zone_parameters() has to be called
+        """
+        model_attr = getattr(self, "model_attr", None)
+        if self.calc_dirty or model_attr is None:
+            return True
+        if (
+            type(model_attr).__name__
+            != ("OneElement", "TwoElement", "ThreeElement", "FourElement")[
+                number_of_elements - 1
+            ]
+            or model_attr.merge_windows != merge_windows
+            or model_attr.t_bt != t_bt
+        ):
+            return True
+        elements = self._all_elements()
+        if len(elements) != self._calc_element_count:
+            return True
+        return any(element.calc_dirty for element in elements)
+
+    def _all_elements(self):
+        """Returns all building elements of the zone, including doors"""
+        return (
+            self.outer_walls
+            + self.doors
+            + self.rooftops
+            + self.ground_floors
+            + self.windows
+            + self.inner_walls
+            + self.floors
+            + self.ceilings
+        )
+
     def find_walls(self, orientation, tilt):
         """Returns all outer walls with given orientation and tilt
 
@@ -462,6 +539,8 @@ class ThermalZone(object):
         elif type(building_element).__name__ == "Window":
             self._windows.append(building_element)
 
+        self.invalidate_calc()
+
     @property
     def parent(self):
         return self.__parent
@@ -501,6 +580,7 @@ class ThermalZone(object):
     def outer_walls(self, value):
         if value is None:
             self._outer_walls = []
+        self.invalidate_calc()
 
     @property
     def doors(self):
@@ -510,6 +590,7 @@ class ThermalZone(object):
     def doors(self, value):
         if value is None:
             self._doors = []
+        self.invalidate_calc()
 
     @property
     def rooftops(self):
@@ -519,6 +600,7 @@ class ThermalZone(object):
     def rooftops(self, value):
         if value is None:
             self._rooftops = []
+        self.invalidate_calc()
 
     @property
     def ground_floors(self):
@@ -528,6 +610,7 @@ class ThermalZone(object):
     def ground_floors(self, value):
         if value is None:
             self._ground_floors = []
+        self.invalidate_calc()
 
     @property
     def ceilings(self):
@@ -537,6 +620,7 @@ class ThermalZone(object):
     def ceilings(self, value):
         if value is None:
             self._ceilings = []
+        self.invalidate_calc()
 
     @property
     def floors(self):
@@ -546,6 +630,7 @@ class ThermalZone(object):
     def floors(self, value):
         if value is None:
             self._floors = []
+        self.invalidate_calc()
 
     @property
     def inner_walls(self):
@@ -556,6 +641,7 @@ class ThermalZone(object):
 
         if value is None:
             self._inner_walls = []
+        self.invalidate_calc()
 
     @property
     def windows(self):
@@ -566,6 +652,7 @@ class ThermalZone(object):
 
         if value is None:
             self._windows = []
+        self.invalidate_calc()
 
     @property
     def use_conditions(self):
@@ -582,6 +669,7 @@ class ThermalZone(object):
             self.typical_length = value.typical_length
             self.typical_width = value.typical_width
         self._use_conditions = value
+        self.invalidate_calc()
 
     @property
     def area(self):
@@ -612,6 +700,7 @@ class ThermalZone(object):
                 self._area = value
         else:
             self._area = value
+        self.invalidate_calc()
 
     @property
     def volume(self):
@@ -640,6 +729,7 @@ class ThermalZone(object):
                 self._volume = value
         else:
             self._volume = value
+        self.invalidate_calc()
 
     @property
     def infiltration_rate(self):
@@ -669,6 +759,7 @@ class ThermalZone(object):
                 self._t_inside = value
             except:
                 raise ValueError("Can't convert temperature to float")
+        self.invalidate_calc()
 
     @property
     def t_outside(self):
@@ -687,6 +778,7 @@ class ThermalZone(object):
                 self._t_outside = value
             except:
                 raise ValueError("Can't convert temperature to float")
+        self.invalidate_calc()
                 
     @property
     def lca_data(self):
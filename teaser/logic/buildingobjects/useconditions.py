@@ -1,12 +1,12 @@
 """This module contains UseConditions class."""
 import random
+import numpy as np
 import teaser.data.input.usecond_input as usecond_input
 import teaser.data.output.usecond_output as usecond_output
-import pandas as pd
 import uuid
-from itertools import cycle, islice
 from collections import OrderedDict
 from teaser.logic.utilities import division_from_json
+from teaser.logic.schedulestore import schedule_store
 
 
 class UseConditions(object):
@@ -179,9 +179,18 @@ class UseConditions(object):
         aligned to :cite:`DINV1859910`.
     schedules: pandas.DataFrame
         All time dependent boundary attributes in one pandas DataFrame, used
-        for export (one year in hourly timestep.)
-        Note: python attribute, not customizable by user (derived from Json)
-
+        for export (one year in hourly timestep.) On first access it is
+        taken as a shallow copy of the DataFrame of the profiles in
+        teaser.logic.schedulestore.schedule_store, whose read-only values
+        are shared with all other UseConditions with the same profiles.
+        Setting a profile stores a copy of the given list and discards the
+        DataFrame, or updates the column of the profile if the DataFrame was
+        set or changed by the user. Such DataFrames are kept in pickles and
+        copies.
+
+    Setting any public attribute marks the parent ThermalZone for
+    recalculation (see ThermalZone.invalidate_calc()). Changes of list
+    attributes in place (e.g. profile[0] = 1.0) are not tracked.
 
     """
 
@@ -225,6 +234,8 @@ class UseConditions(object):
 
         self._with_ideal_thresholds = False
 
+        self._schedules = None
+        self._shared_schedules = None
         self._heating_profile = [
             294.15,
             294.15,
@@ -356,19 +367,6 @@ class UseConditions(object):
             0.0,
         ]
 
-        self.schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            data={
-                "heating_profile": list(islice(cycle(self._heating_profile), 8760)),
-                "cooling_profile": list(islice(cycle(self._cooling_profile), 8760)),
-                "persons_profile": list(islice(cycle(self._persons_profile), 8760)),
-                "lighting_profile": list(islice(cycle(self._lighting_profile), 8760)),
-                "machines_profile": list(islice(cycle(self._machines_profile), 8760)),
-            },
-        )
-
     def load_use_conditions(self, zone_usage, data_class=None):
         """Load typical use conditions from JSON data base.
 
@@ -430,16 +428,87 @@ class UseConditions(object):
         else:
             self._with_ideal_thresholds = value
 
+    def __setattr__(self, name, value):
+        """Sets an attribute and marks the parent zone for recalculation
+
+        Private attributes are set by the setters of the public ones or hold
+        caches, they do not mark the zone again.
+        """
+        super(UseConditions, self).__setattr__(name, value)
+        if not name.startswith("_"):
+            parent = self.__dict__.get("_parent")
+            if parent is not None:
+                parent.invalidate_calc()
+
+    def __getstate__(self):
+        """Pickles and copies the UseConditions without unchanged schedules
+
+        Schedules that were set or changed by the user are kept, unchanged
+        ones are taken from the schedule store again on first access.
+        """
+        state = self.__dict__.copy()
+        if self._schedules_are_shared():
+            state["_schedules"] = None
+        state["_shared_schedules"] = None
+        return state
+
+    def _schedules_are_shared(self):
+        """Returns True if the schedules are an unchanged shallow copy of the
+        DataFrame in the schedule store"""
+        schedules = self._schedules
+        shared = self._shared_schedules
+        if schedules is None or shared is None:
+            return False
+        return (
+            list(schedules.columns) == list(shared.columns)
+            and schedules.index is shared.index
+            and all(
+                np.shares_memory(schedules[column].to_numpy(), shared[column].to_numpy())
+                for column in shared.columns
+            )
+        )
+
+    def _update_schedules(self, column, profile):
+        """Updates the column of a profile in schedules set or changed by
+        the user and discards unchanged schedules"""
+        if self._schedules is not None and not self._schedules_are_shared():
+            self._schedules[column] = schedule_store.expand(profile).copy()
+        else:
+            self._schedules = None
+        self._shared_schedules = None
+
+    @property
+    def schedules(self):
+        if self._schedules is None:
+            self._shared_schedules = schedule_store.frame(
+                {
+                    "heating_profile": self._heating_profile,
+                    "cooling_profile": self._cooling_profile,
+                    "persons_profile": self._persons_profile,
+                    "lighting_profile": self._lighting_profile,
+                    "machines_profile": self._machines_profile,
+                }
+            )
+            self._schedules = self._shared_schedules.copy(deep=False)
+        return self._schedules
+
+    @schedules.setter
+    def schedules(self, value):
+        self._schedules = value
+        self._shared_schedules = None
+
     @property
     def heating_profile(self):
         return self._heating_profile
 
     @heating_profile.setter
     def heating_profile(self, value):
-        if not isinstance(value, list):
+        if isinstance(value, list):
+            value = list(value)
+        else:
             value = [value]
         self._heating_profile = value
-        self.schedules["heating_profile"] = list(islice(cycle(value), 8760))
+        self._update_schedules("heating_profile", value)
 
     @property
     def cooling_profile(self):
@@ -447,10 +516,12 @@ class UseConditions(object):
 
     @cooling_profile.setter
     def cooling_profile(self, value):
-        if not isinstance(value, list):
+        if isinstance(value, list):
+            value = list(value)
+        else:
             value = [value]
         self._cooling_profile = value
-        self.schedules["cooling_profile"] = list(islice(cycle(value), 8760))
+        self._update_schedules("cooling_profile", value)
 
     @property
     def persons_profile(self):
@@ -458,10 +529,12 @@ class UseConditions(object):
 
     @persons_profile.setter
     def persons_profile(self, value):
-        if not isinstance(value, list):
+        if isinstance(value, list):
+            value = list(value)
+        else:
             value = [value]
         self._persons_profile = value
-        self.schedules["persons_profile"] = list(islice(cycle(value), 8760))
+        self._update_schedules("persons_profile", value)
 
     @property
     def machines_profile(self):
@@ -469,10 +542,12 @@ class UseConditions(object):
 
     @machines_profile.setter
     def machines_profile(self, value):
-        if not isinstance(value, list):
+        if isinstance(value, list):
+            value = list(value)
+        else:
             value = [value]
         self._machines_profile = value
-        self.schedules["machines_profile"] = list(islice(cycle(value), 8760))
+        self._update_schedules("machines_profile", value)
 
     @property
     def lighting_profile(self):
@@ -480,10 +555,12 @@ class UseConditions(object):
 
     @lighting_profile.setter
     def lighting_profile(self, value):
-        if not isinstance(value, list):
+        if isinstance(value, list):
+            value = list(value)
+        else:
             value = [value]
         self._lighting_profile = value
-        self.schedules["lighting_profile"] = list(islice(cycle(value), 8760))
+        self._update_schedules("lighting_profile", value)
 
     @property
     def parent(self):
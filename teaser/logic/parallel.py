@@ -0,0 +1,272 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""Parallel: Helper functions to run TEASER calculations and exports in a
+process pool
+
+Buildings are sent to the worker processes without their parent Project.
+The schedules of their UseConditions are not sent either, only the short
+profiles they are expanded from (see teaser.logic.schedulestore). The workers
+send back only the calculated values, which are written into the buildings of
+the parent process. Exports send a copy of the Project without its buildings
+along, which becomes the parent of the building in the worker process.
+"""
+
+import concurrent.futures
+import contextlib
+import io
+import pickle
+
+import numpy as np
+
+_plain_types = (int, float, str, bool, type(None), np.number)
+
+
+@contextlib.contextmanager
+def executor_scope(workers=None, executor=None):
+    """Yields an executor to run tasks in parallel.
+
+    If an executor is given it is used as it is and not shut down. Otherwise
+    a ProcessPoolExecutor with the given number of workers is created and
+    shut down at the end.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes, None uses the number of processors
+    executor : concurrent.futures.Executor
+        Executor to use instead of a new process pool
+    """
+    if executor is not None:
+        yield executor
+    else:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield pool
+        finally:
+            pool.shutdown(wait=True)
+
+
+class _DetachedPickler(pickle.Pickler):
+    """Pickler that stores the given objects only by a key"""
+
+    def __init__(self, file, detached):
+        super(_DetachedPickler, self).__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.detached = detached
+
+    def persistent_id(self, obj):
+        return self.detached.get(id(obj))
+
+
+class _DetachedUnpickler(pickle.Unpickler):
+    """Unpickler that loads objects stored by key from a given mapping
+
+    Keys that are not in the mapping are loaded as None.
+    """
+
+    def __init__(self, file, objects):
+        super(_DetachedUnpickler, self).__init__(file)
+        self.objects = objects
+
+    def persistent_load(self, pid):
+        return self.objects.get(pid)
+
+
+def zone_elements(zone):
+    """Returns all building elements of a thermal zone in a fixed order"""
+    return (
+        zone.outer_walls
+        + zone.doors
+        + zone.rooftops
+        + zone.ground_floors
+        + zone.windows
+        + zone.inner_walls
+        + zone.floors
+        + zone.ceilings
+    )
+
+
+def dumps_building(bldg):
+    """Pickles a building without its parent
+
+    Parameters
+    ----------
+    bldg : Building
+        TEASER Building instance
+
+    Returns
+    ----------
+    payload : bytes
+        Pickled building, load it with loads_building()
+    """
+    detached = {id(bldg.parent): "detached"} if bldg.parent is not None else {}
+
+    buffer = io.BytesIO()
+    _DetachedPickler(buffer, detached).dump(bldg)
+    return buffer.getvalue()
+
+
+def loads_building(payload):
+    """Loads a building pickled with dumps_building()"""
+    return _DetachedUnpickler(io.BytesIO(payload), {}).load()
+
+
+def dumps_project(prj):
+    """Pickles a project without its buildings and data bindings
+
+    Parameters
+    ----------
+    prj : Project
+        TEASER Project instance
+
+    Returns
+    ----------
+    payload : bytes
+        Pickled project, load it with loads_project()
+    """
+    return dumps_shared(prj, [prj.buildings, prj.data])
+
+
+def loads_project(payload):
+    """Loads a project pickled with dumps_project()
+
+    The loaded project has an empty buildings list and no data bindings, it
+    is meant as parent of buildings loaded with loads_building(), e.g. to
+    export them.
+    """
+    return loads_shared(payload, [[], None])
+
+
+def dumps_shared(obj, shared):
+    """Pickles an object that keeps references to shared objects
+
+    Loading the payload with loads_shared() creates a new copy of the object
+    which references the very same shared objects instead of copies of them.
+
+    Parameters
+    ----------
+    obj : object
+        Object to pickle, e.g. a TEASER Building instance
+    shared : list
+        Objects referenced by obj that are not copied
+
+    Returns
+    ----------
+    payload : bytes
+        Pickled object
+    """
+    detached = {id(shared_obj): index for index, shared_obj in enumerate(shared)}
+
+    buffer = io.BytesIO()
+    _DetachedPickler(buffer, detached).dump(obj)
+    return buffer.getvalue()
+
+
+def loads_shared(payload, shared):
+    """Loads a copy of an object pickled with dumps_shared()
+
+    Parameters
+    ----------
+    payload : bytes
+        Object pickled with dumps_shared()
+    shared : list
+        The same shared objects that were passed to dumps_shared()
+    """
+    return _DetachedUnpickler(io.BytesIO(payload), dict(enumerate(shared))).load()
+
+
+def calc_building(payload, number_of_elements, merge_windows, used_library):
+    """Calculates a pickled building, executed in the worker process
+
+    Parameters
+    ----------
+    payload : bytes
+        Building pickled with dumps_building()
+    number_of_elements : int
+        defines the number of elements, that area aggregated, between 1
+        and 4
+    merge_windows : bool
+        True for merging the windows into the outer walls, False for
+        separate resistance for window
+    used_library : str
+        used library (AixLib and IBPSA are supported)
+
+    Returns
+    ----------
+    state : dict
+        Calculated values of the building, see apply_calculated_state()
+    """
+    bldg = loads_building(payload)
+    bldg.calc_building_parameter(
+        number_of_elements=number_of_elements,
+        merge_windows=merge_windows,
+        used_library=used_library,
+    )
+
+    if bldg.library_attr is not None:
+        bldg.library_attr.parent = None
+
+    zones = []
+    for zone in bldg.thermal_zones:
+        zone.model_attr.thermal_zone = None
+        zones.append(
+            {
+                "zone": _plain_attributes(zone),
+                "model_attr": zone.model_attr,
+                "elements": [
+                    _plain_attributes(element) for element in zone_elements(zone)
+                ],
+            }
+        )
+
+    return {
+        "building": _plain_attributes(bldg),
+        "library_attr": bldg.library_attr,
+        "zones": zones,
+    }
+
+
+def apply_calculated_state(bldg, state):
+    """Writes values calculated by calc_building() into a building
+
+    Parameters
+    ----------
+    bldg : Building
+        TEASER Building instance that was sent to calc_building()
+    state : dict
+        Return value of calc_building()
+    """
+    _update_plain_attributes(bldg, state["building"])
+    bldg.library_attr = state["library_attr"]
+    if bldg.library_attr is not None:
+        bldg.library_attr.parent = bldg
+
+    for zone, zone_state in zip(bldg.thermal_zones, state["zones"]):
+        _update_plain_attributes(zone, zone_state["zone"])
+        zone.model_attr = zone_state["model_attr"]
+        zone.model_attr.thermal_zone = zone
+        for element, element_state in zip(
+            zone_elements(zone), zone_state["elements"]
+        ):
+            _update_plain_attributes(element, element_state)
+
+
+def _plain_attributes(obj):
+    """Returns all attributes of an object holding numbers or strings"""
+    return {
+        key: value
+        for key, value in vars(obj).items()
+        if isinstance(value, _plain_types)
+    }
+
+
+def _update_plain_attributes(obj, values):
+    """Sets attributes of an object unless they hold other objects
+
+    Attributes detached for the worker process (e.g. the parent project)
+    are None in the worker and must not overwrite the original objects.
+    """
+    attributes = vars(obj)
+    for key, value in values.items():
+        if isinstance(attributes.get(key), _plain_types):
+            attributes[key] = value
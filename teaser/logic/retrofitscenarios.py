@@ -0,0 +1,205 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""RetrofitScenarios: Evaluation of many retrofit variants for many buildings
+
+Every building is combined with every retrofit variant. The project is not
+copied: each building is sent on its own (see teaser.logic.parallel) and
+every variant is applied to a fresh copy of that building. Only building
+elements that a retrofit never writes to (inner walls, floors, ceilings)
+are shared between the copies of all variants. Doors (which TABULA
+retrofits reload) and the use conditions are copied for every variant, so
+the results do not depend on the order of the variants.
+"""
+
+import warnings
+
+import pandas as pd
+
+import teaser.logic.parallel as parallel
+
+variant_keys = ("year_of_retrofit", "type_of_retrofit", "window_type", "material")
+
+lca_indicators = (
+    "pere",
+    "perm",
+    "pert",
+    "penre",
+    "penrm",
+    "penrt",
+    "sm",
+    "rsf",
+    "nrsf",
+    "fw",
+    "hwd",
+    "nhwd",
+    "rwd",
+    "cru",
+    "mfr",
+    "mer",
+    "eee",
+    "eet",
+    "gwp",
+    "odp",
+    "pocp",
+    "ap",
+    "ep",
+    "adpe",
+    "adpf",
+)
+
+
+def evaluate_building(payload, variants, settings):
+    """Evaluates all retrofit variants of one building
+
+    Each variant is applied to a copy of the building with
+    Building.retrofit_building(), which also calculates the building. Then
+    the LCA data of the building is calculated.
+
+    Parameters
+    ----------
+    payload : bytes
+        Building pickled with parallel.dumps_building()
+    variants : list
+        List of dicts with the keywords of Building.retrofit_building()
+    settings : dict
+        used_statistic of the data class for this building, use_b4 and
+        period_lca_scenario of the project
+
+    Returns
+    ----------
+    rows : list
+        One dict with the results for each variant that could be evaluated
+    failures : list
+        Tuples of variant index and error message of variants that could
+        not be evaluated
+    """
+    from teaser.project import Project
+    from teaser.data.dataclass import DataClass
+
+    prj = Project(load_data=False)
+    prj.data = DataClass(used_statistic=settings["used_statistic"])
+
+    base = parallel.loads_building(payload)
+    shared = []
+    for zone in base.thermal_zones:
+        shared.extend(zone.inner_walls + zone.floors + zone.ceilings)
+    copy_payload = parallel.dumps_shared(base, shared)
+
+    rows = []
+    failures = []
+    for index, variant in enumerate(variants):
+        bldg = parallel.loads_shared(copy_payload, shared)
+        bldg.parent = prj
+        try:
+            bldg.retrofit_building(**variant)
+            bldg.calc_lca_data(
+                use_b4=settings["use_b4"],
+                period_lca_scenario=settings["period_lca_scenario"],
+            )
+        except (ZeroDivisionError, TypeError, ValueError) as error:
+            failures.append((index, str(error)))
+        else:
+            rows.append(_result_row(bldg, index, variant))
+        finally:
+            prj.buildings.remove(bldg)
+
+    return rows, failures
+
+
+def evaluate_scenarios(buildings, variants, settings, workers=None, executor=None):
+    """Evaluates every building with every retrofit variant
+
+    Parameters
+    ----------
+    buildings : list
+        TEASER Building instances, they are not modified
+    variants : list
+        List of dicts with the keys year_of_retrofit, type_of_retrofit,
+        window_type and material (see Project.retrofit_all_buildings())
+    settings : list
+        One settings dict per building, see evaluate_building()
+    workers : int
+        Number of worker processes, default is None
+    executor : concurrent.futures.Executor
+        Executor to use instead of a new process pool, default is None. If
+        neither workers nor executor are given, all buildings are evaluated
+        in this process.
+
+    Returns
+    ----------
+    results : pandas.DataFrame
+        One row per building and variant with the variant, heat load, UA
+        values and LCA indicators summed over all stages
+    """
+    variants = [
+        {key: variant.get(key) for key in variant_keys} for variant in variants
+    ]
+    payloads = [parallel.dumps_building(bldg) for bldg in buildings]
+
+    if workers is None and executor is None:
+        results = [
+            evaluate_building(payload, variants, bldg_settings)
+            for payload, bldg_settings in zip(payloads, settings)
+        ]
+    else:
+        with parallel.executor_scope(workers=workers, executor=executor) as pool:
+            futures = [
+                pool.submit(evaluate_building, payload, variants, bldg_settings)
+                for payload, bldg_settings in zip(payloads, settings)
+            ]
+            results = [future.result() for future in futures]
+
+    rows = []
+    for bldg, (bldg_rows, failures) in zip(buildings, results):
+        for index, message in failures:
+            warnings.warn(
+                "Retrofit variant {} can't be evaluated for building {}: "
+                "{}".format(index, bldg.name, message)
+            )
+        for row in bldg_rows:
+            row["building"] = bldg.name
+            row["internal_id"] = bldg.internal_id
+        rows.extend(bldg_rows)
+
+    columns = (
+        ["building", "internal_id", "variant"]
+        + list(variant_keys)
+        + [
+            "sum_heat_load",
+            "ua_value_outer_walls",
+            "ua_value_rooftops",
+            "ua_value_ground_floors",
+            "ua_value_windows",
+            "ua_value_doors",
+            "ua_value",
+        ]
+        + ["lca_" + indicator for indicator in lca_indicators]
+    )
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _result_row(bldg, index, variant):
+    """Collects the results of a retrofitted and calculated building"""
+    row = {"variant": index}
+    row.update(variant)
+    row["sum_heat_load"] = bldg.sum_heat_load
+
+    for name in ("outer_walls", "rooftops", "ground_floors", "windows", "doors"):
+        row["ua_value_" + name] = sum(
+            element.ua_value
+            for zone in bldg.thermal_zones
+            for element in getattr(zone, name)
+        )
+    row["ua_value"] = (
+        row["ua_value_outer_walls"]
+        + row["ua_value_rooftops"]
+        + row["ua_value_ground_floors"]
+        + row["ua_value_windows"]
+        + row["ua_value_doors"]
+    )
+
+    for indicator in lca_indicators:
+        row["lca_" + indicator] = getattr(bldg.lca_data, indicator).sum_stages()
+
+    return row
@@ -0,0 +1,149 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""ScheduleStore: Shared storage of the hourly profiles of UseConditions
+
+Most zones of a project use the same few profiles, e.g. all zones that load
+the same use conditions from the data base. The store keeps one tuple per
+distinct profile, one read-only expansion of that profile to a full year and
+one DataFrame per combination of profiles. The schedules of all
+UseConditions with the same profiles are shallow copies of that DataFrame,
+so the hourly values of a year are held once per distinct profile instead of
+once per zone. The UseConditions keep their own profile lists, so editing
+the profile of one zone never changes the profiles of other zones.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+hours_per_year = 8760
+
+
+class ScheduleStore(object):
+    """Store of profiles, interned by their content
+
+    Profiles are identified by a hash of their values including the types of
+    the values, so [1, 0] and [1.0, 0.0] are different profiles and the
+    exported schedules keep their number format.
+
+    Attributes
+    ----------
+
+    profiles : dict
+        Interned profile tuples per content hash
+    expansions : dict
+        Read-only NumPy arrays with the profiles repeated for one year in
+        hourly steps per content hash, created on first request
+    frames : dict
+        DataFrames with the expansions as columns per column names and
+        content hashes of the profiles, created on first request
+
+    """
+
+    def __init__(self):
+        self.profiles = {}
+        self.expansions = {}
+        self.frames = {}
+        self._index = None
+
+    @staticmethod
+    def key(profile):
+        """Returns the content hash of a profile"""
+        return hashlib.blake2b(
+            repr(list(profile)).encode(), digest_size=16).hexdigest()
+
+    def intern(self, profile):
+        """Returns the shared tuple with the values of the given profile
+
+        Parameters
+        ----------
+
+        profile : list
+            Profile values, e.g. 24 hourly values of one day
+
+        Returns
+        ----------
+
+        profile : tuple
+            Shared immutable tuple with the same values
+        """
+        key = self.key(profile)
+        interned = self.profiles.get(key)
+        if interned is None:
+            interned = tuple(profile)
+            self.profiles[key] = interned
+        return interned
+
+    def expand(self, profile):
+        """Returns the profile repeated cyclically for one year
+
+        Parameters
+        ----------
+
+        profile : list
+            Profile values, e.g. 24 hourly values of one day
+
+        Returns
+        ----------
+
+        expansion : numpy.ndarray
+            Read-only array with 8760 hourly values
+        """
+        key = self.key(profile)
+        expansion = self.expansions.get(key)
+        if expansion is None:
+            expansion = np.resize(np.asarray(self.intern(profile)), hours_per_year)
+            expansion.flags.writeable = False
+            self.expansions[key] = expansion
+        return expansion
+
+    def frame(self, profiles):
+        """Returns the shared DataFrame of the expansions of the profiles
+
+        The columns are the read-only expansions of the store, so changing
+        values in place raises a ValueError. Columns must not be replaced
+        or added, as the DataFrame is shared; use a shallow copy
+        (DataFrame.copy(deep=False)) for that.
+
+        Parameters
+        ----------
+
+        profiles : dict
+            Profile values per column name
+
+        Returns
+        ----------
+
+        frame : pandas.DataFrame
+            DataFrame with 8760 hourly values per profile
+        """
+        key = tuple((name, self.key(profile)) for name, profile in profiles.items())
+        frame = self.frames.get(key)
+        if frame is None:
+            frame = pd.DataFrame(
+                index=self.index(),
+                data={name: self.expand(profile) for name, profile in profiles.items()},
+                copy=False,
+            )
+            self.frames[key] = frame
+        return frame
+
+    def index(self):
+        """Returns the shared time index of the schedules ("%m-%d %H:%M:%S")"""
+        if self._index is None:
+            self._index = pd.Index(
+                pd.date_range("2019-01-01 00:00:00", periods=hours_per_year, freq="H")
+                .strftime("%m-%d %H:%M:%S"))
+        return self._index
+
+    def clear(self):
+        """Removes all profiles, expansions and DataFrames from the store"""
+        self.profiles = {}
+        self.expansions = {}
+        self.frames = {}
+
+
+# store shared by all UseConditions of the process
+schedule_store = ScheduleStore()
@@ -4,11 +4,14 @@ import warnings
 import os
 import re
 import teaser.logic.utilities as utilities
+import teaser.logic.parallel as parallel
+import teaser.logic.retrofitscenarios as retrofitscenarios
 import teaser.data.input.teaserjson_input as tjson_in
 import teaser.data.output.teaserjson_output as tjson_out
 import teaser.data.output.aixlib_output as aixlib_output
 import teaser.data.output.ibpsa_output as ibpsa_output
 from teaser.data.dataclass import DataClass
+from teaser.data.surfacegmlcache import SurfaceGMLCache
 from teaser.logic.archetypebuildings.bmvbs.office import Office
 from teaser.logic.archetypebuildings.bmvbs.custom.institute import Institute
 from teaser.logic.archetypebuildings.bmvbs.custom.institute4 import Institute4
@@ -64,6 +67,12 @@ class Project(object):
         should be loaded. default = False but will be automatically loaded
         once you add a archetype building. For building generation from
         scratch, set to True
+    share_material_templates : boolean
+        boolean if the layers of type building elements should share one
+        read-only Material (and its LCA data) per material id instead of
+        loading their own, which saves memory for large projects. Passed to
+        every DataClass the project creates, which also takes over the
+        loaded templates of the data it replaces. default = False
 
     Attributes
     ----------
@@ -101,7 +110,7 @@ class Project(object):
     
     """
 
-    def __init__(self, load_data=False):
+    def __init__(self, load_data=False, share_material_templates=False):
         """Constructor of Project Class.
         """
         self._name = "Project"
@@ -120,6 +129,7 @@ class Project(object):
         self.buildings = []
 
         self.load_data = load_data
+        self.share_material_templates = share_material_templates
 
         self._number_of_elements_calc = 2
         self._merge_windows_calc = False
@@ -135,19 +145,38 @@ class Project(object):
         self._period_lca_scenario = 80
         self._use_b4 = False
 
-    @staticmethod
-    def instantiate_data_class():
+    def instantiate_data_class(self, used_statistic="iwu"):
         """Initialization of DataClass
 
+        Parameters
+        ----------
+
+        used_statistic : str
+            statistic of the building elements, 'iwu' or 'tabula_de',
+            default is 'iwu'
+
         Returns
         ----------
 
         DataClass : Instance of DataClass()
 
         """
-        return DataClass()
+        data = DataClass(
+            used_statistic=used_statistic,
+            share_material_templates=self.share_material_templates,
+        )
+        old_data = getattr(self, "data", None)
+        if (
+            self.share_material_templates
+            and old_data is not None
+            and old_data.share_material_templates
+            and (old_data.path_mat, old_data.path_lcad, old_data.path_lcad_fallback)
+            == (data.path_mat, data.path_lcad, data.path_lcad_fallback)
+        ):
+            data.material_templates = old_data.material_templates
+        return data
 
-    def calc_all_buildings(self, raise_errors=False):
+    def calc_all_buildings(self, raise_errors=False, workers=None, executor=None):
         """Calculates values for all project buildings
 
         You need to set the following parameters in the Project class.
@@ -165,8 +194,27 @@ class Project(object):
         used_library_calc : str
             used library (AixLib and IBPSA are supported)
 
+        Parameters
+        ----------
+        raise_errors : bool
+            True to raise errors of the calculation, False to remove
+            buildings that can't be calculated from the buildings list,
+            default is False
+        workers : int
+            Number of worker processes to calculate the buildings in
+            parallel. The calculated values are written back into the
+            buildings of this project. Default is None, which calculates all
+            buildings in this process unless an executor is given.
+        executor : concurrent.futures.Executor
+            Executor (e.g. ProcessPoolExecutor) to calculate the buildings in
+            parallel instead of creating a new process pool, default is None
+
         """
-        if raise_errors is True:
+        if workers is not None or executor is not None:
+            self._calc_all_buildings_parallel(
+                raise_errors=raise_errors, workers=workers, executor=executor
+            )
+        elif raise_errors is True:
             for bldg in reversed(self.buildings):
                 bldg.calc_building_parameter(
                     number_of_elements=self._number_of_elements_calc,
@@ -190,6 +238,89 @@ class Project(object):
                     )
                     self.buildings.remove(bldg)
 
+    def recalculate(self, raise_errors=False):
+        """Recalculates values of all changed project buildings
+
+        Only thermal zones that changed since their last calculation (e.g.
+        by Window.replace_window() or setters of building elements, layers
+        and materials) are recalculated, see
+        Building.recalc_building_parameter(). Buildings that were never
+        calculated are calculated completely. The settings
+        number_of_elements_calc, merge_windows_calc and used_library_calc
+        are used as in calc_all_buildings().
+
+        Parameters
+        ----------
+        raise_errors : bool
+            True to raise errors of the calculation, False to remove
+            buildings that can't be calculated from the buildings list,
+            default is False
+        """
+        for bldg in reversed(self.buildings):
+            try:
+                bldg.recalc_building_parameter(
+                    number_of_elements=self._number_of_elements_calc,
+                    merge_windows=self._merge_windows_calc,
+                    used_library=self._used_library_calc,
+                )
+            except (ZeroDivisionError, TypeError):
+                if raise_errors is True:
+                    raise
+                warnings.warn(
+                    "Following building can't be calculated and is "
+                    "removed from buildings list. Use raise_errors=True "
+                    "to get python errors and stop TEASER from deleting "
+                    "this building:" + bldg.name
+                )
+                self.buildings.remove(bldg)
+
+    def _calc_all_buildings_parallel(self, raise_errors, workers, executor):
+        """Calculates all project buildings in a process pool
+
+        Each building is sent to a worker process without its parent project,
+        the calculated values are written back into the building. Buildings
+        that can't be calculated are handled as in calc_all_buildings().
+
+        Parameters
+        ----------
+        raise_errors : bool
+            True to raise errors of the calculation, False to remove
+            buildings that can't be calculated from the buildings list
+        workers : int
+            Number of worker processes
+        executor : concurrent.futures.Executor
+            Executor to use instead of a new process pool
+        """
+        with parallel.executor_scope(workers=workers, executor=executor) as pool:
+            futures = [
+                (
+                    bldg,
+                    pool.submit(
+                        parallel.calc_building,
+                        parallel.dumps_building(bldg),
+                        self._number_of_elements_calc,
+                        self._merge_windows_calc,
+                        self._used_library_calc,
+                    ),
+                )
+                for bldg in reversed(self.buildings)
+            ]
+            for bldg, future in futures:
+                try:
+                    state = future.result()
+                except (ZeroDivisionError, TypeError):
+                    if raise_errors is True:
+                        raise
+                    warnings.warn(
+                        "Following building can't be calculated and is "
+                        "removed from buildings list. Use raise_errors=True "
+                        "to get python errors and stop TEASER from deleting "
+                        "this building:" + bldg.name
+                    )
+                    self.buildings.remove(bldg)
+                else:
+                    parallel.apply_calculated_state(bldg, state)
+
     def retrofit_all_buildings(
         self,
         year_of_retrofit=None,
@@ -263,14 +394,14 @@ class Project(object):
                     window_type=window_type,
                     material=material,
                 )
-            self.data = DataClass(used_statistic="tabula_de")
+            self.data = self.instantiate_data_class(used_statistic="tabula_de")
             for bld_tabula in tabula_buildings:
                 bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
 
         else:
             for bld_tabula in tabula_buildings:
                 bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
-            self.data = DataClass(used_statistic="iwu")
+            self.data = self.instantiate_data_class(used_statistic="iwu")
             for bld_iwu in iwu_buildings:
                 bld_iwu.retrofit_building(
                     year_of_retrofit=year_of_retrofit,
@@ -278,6 +409,74 @@ class Project(object):
                     material=material,
                 )
 
+    def evaluate_retrofit_scenarios(self, variants, workers=None, executor=None):
+        """Evaluates retrofit variants for all buildings in the project.
+
+        Every building is retrofitted with every variant as in
+        retrofit_all_buildings() and calculated afterwards. The buildings of
+        the project are not modified: each variant is applied to a copy of a
+        single building, elements not affected by a retrofit are shared
+        between the copies (see teaser.logic.retrofitscenarios).
+
+        Parameters
+        ----------
+        variants : list
+            List of dicts with the keys year_of_retrofit, type_of_retrofit,
+            window_type and material, see retrofit_all_buildings(). Missing
+            keys are None.
+        workers : int
+            Number of worker processes to evaluate the buildings in
+            parallel, default is None
+        executor : concurrent.futures.Executor
+            Executor (e.g. ProcessPoolExecutor) to evaluate the buildings in
+            parallel instead of creating a new process pool, default is None
+
+        Returns
+        ----------
+        results : pandas.DataFrame
+            One row per building and variant with the variant, sum_heat_load,
+            UA values of outer elements and LCA indicators summed over all
+            stages (columns lca_gwp etc.)
+        """
+        ass_error_type = "only 'retrofit' and 'adv_retrofit' are valid "
+        for variant in variants:
+            assert variant.get("type_of_retrofit") in [
+                None,
+                "adv_retrofit",
+                "retrofit",
+            ], ass_error_type
+
+        settings = []
+        for bldg in self.buildings:
+            if isinstance(bldg, SingleFamilyHouse):
+                if any(variant.get("type_of_retrofit") is None for variant in variants):
+                    raise ValueError(
+                        "you need to set type_of_retrofit for " "TABULA retrofit"
+                    )
+                if self.data.used_statistic == "iwu":
+                    used_statistic = "tabula_de"
+                else:
+                    used_statistic = self.data.used_statistic
+            else:
+                if any(variant.get("year_of_retrofit") is None for variant in variants):
+                    raise ValueError("you need to set year_of_retrofit for " "retrofit")
+                used_statistic = "iwu"
+            settings.append(
+                {
+                    "used_statistic": used_statistic,
+                    "use_b4": self.use_b4,
+                    "period_lca_scenario": self.period_lca_scenario,
+                }
+            )
+
+        return retrofitscenarios.evaluate_scenarios(
+            buildings=self.buildings,
+            variants=variants,
+            settings=settings,
+            workers=workers,
+            executor=executor,
+        )
+
     def add_non_residential(
         self,
         method,
@@ -385,9 +584,9 @@ internal_gains_mode: int [1, 2, 3]
         ], ass_error_usage
 
         if self.data is None:
-            self.data = DataClass(used_statistic="iwu")
+            self.data = self.instantiate_data_class(used_statistic="iwu")
         elif self.data.used_statistic != "iwu":
-            self.data = DataClass(used_statistic="iwu")
+            self.data = self.instantiate_data_class(used_statistic="iwu")
 
         if usage == "office":
 
@@ -609,9 +808,9 @@ internal_gains_mode: int [1, 2, 3]
         if method == "tabula_de":
 
             if self.data is None:
-                self.data = DataClass(used_statistic=method)
+                self.data = self.instantiate_data_class(used_statistic=method)
             elif self.data.used_statistic != "tabula_de":
-                self.data = DataClass(used_statistic=method)
+                self.data = self.instantiate_data_class(used_statistic=method)
 
             ass_error_usage_tabula = "only 'single_family_house',"
             "'terraced_house', 'multi_family_house', 'apartment_block' are"
@@ -691,9 +890,9 @@ internal_gains_mode: int [1, 2, 3]
         elif method == "tabula_dk":
 
             if self.data is None:
-                self.data = DataClass(used_statistic=method)
+                self.data = self.instantiate_data_class(used_statistic=method)
             elif self.data.used_statistic != "tabula_dk":
-                self.data = DataClass(used_statistic=method)
+                self.data = self.instantiate_data_class(used_statistic=method)
 
             ass_error_usage_tabula = "only 'single_family_house',"
             "'terraced_house', 'apartment_block' are"
@@ -755,9 +954,9 @@ internal_gains_mode: int [1, 2, 3]
         elif method == "iwu":
 
             if self.data is None:
-                self.data = DataClass(used_statistic=method)
+                self.data = self.instantiate_data_class(used_statistic=method)
             elif self.data.used_statistic != "iwu":
-                self.data = DataClass(used_statistic=method)
+                self.data = self.instantiate_data_class(used_statistic=method)
 
             ass_error_usage_iwu = (
                 "only 'single_family_dwelling' is a valid "
@@ -787,9 +986,9 @@ internal_gains_mode: int [1, 2, 3]
         elif method == "urbanrenet":
 
             if self.data is None:
-                self.data = DataClass(used_statistic="iwu")
+                self.data = self.instantiate_data_class(used_statistic="iwu")
             elif self.data.used_statistic != "iwu":
-                self.data = DataClass(used_statistic="iwu")
+                self.data = self.instantiate_data_class(used_statistic="iwu")
 
             ass_error_usage_urn = (
                 "only 'est1a', 'est1b', 'est2', 'est3', "
@@ -1064,7 +1263,9 @@ internal_gains_mode: int [1, 2, 3]
         citygml_out.save_gml_lxml(self, new_path, ref_coordinates=ref_coordinates, gml_copy=gml_copy, results=results)
 
     def load_citygml(self, method="iwu", path=None, energyade=False,
-                     gml_bldg_ids=None, gml_bldg_names=None, gml_bldg_addresses=None):
+                     gml_bldg_ids=None, gml_bldg_names=None, gml_bldg_addresses=None,
+                     streaming=False, workers=None, executor=None, gml_index_file=False,
+                     gml_surface_cache=None):
         """Loads buildings from a citygml file
 
         calls the function load_gml choose_gml or load_gmlade
@@ -1098,22 +1299,69 @@ internal_gains_mode: int [1, 2, 3]
             user's selection
         :param gml_bldg_ids: List[string]
             user's selection
+        :param streaming: Boolean
+            Stream the file with lxml.etree.iterparse instead of loading the
+            whole tree, so the memory needed does not grow with the size of
+            the file. No copies of the GML buildings are returned then.
+            Default is False
+        :param workers: int
+            Number of worker processes that create the TEASER buildings from
+            the CityGML buildings, the buildings are added to the project in
+            file order. Not used for EnergyADE files. Default is None, which
+            creates all buildings in this process unless an executor is given
+        :param executor: concurrent.futures.Executor
+            Executor to use instead of a new process pool, default is None
+        :param gml_index_file: Boolean
+            Store the index of building ids, names and addresses used for
+            the selection next to the CityGML file and reuse it, so repeated
+            selections only read the chosen buildings. Default is False
+        :param gml_surface_cache: string
+            Directory of the on-disk cache of the GML surfaces. The surfaces
+            of each building are stored per file content hash and gml:id, so
+            loading an unchanged file again skips the XML geometry decoding.
+            Not used for EnergyADE files. Default is None (no cache)
 
         """
         gml_copy = None
-        if energyade is True:
+        boundary_box = None
+        surface_cache = None
+        if gml_surface_cache is not None and energyade is not True:
+            surface_cache = SurfaceGMLCache.for_file(path, gml_surface_cache)
+        if streaming is True:
+            if energyade is True:
+                energyade_in.stream_ade_lxml(path, self)
+            else:
+                boundary_box = citygml_in.stream_gml_lxml(
+                    path,
+                    self,
+                    method=method,
+                    bldg_ids=gml_bldg_ids,
+                    bldg_names=gml_bldg_names,
+                    bldg_addresses=gml_bldg_addresses,
+                    workers=workers,
+                    executor=executor,
+                    surface_cache=surface_cache,
+                )
+        elif energyade is True:
             energyade_in.load_ade_lxml(path, self)
         elif gml_bldg_names is not None:
-            chosen_gmls=citygml_in.choose_gml_lxml(path, bldg_names=gml_bldg_names)
-            citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=chosen_gmls)
+            chosen_gmls=citygml_in.choose_gml_lxml(path, bldg_names=gml_bldg_names, sidecar=gml_index_file)
+            citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=chosen_gmls,
+                                     workers=workers, executor=executor, surface_cache=surface_cache)
         elif gml_bldg_ids is not None:
-            chosen_gmls=citygml_in.choose_gml_lxml(path, bldg_ids=gml_bldg_ids)
-            citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=chosen_gmls)
+            chosen_gmls=citygml_in.choose_gml_lxml(path, bldg_ids=gml_bldg_ids, sidecar=gml_index_file)
+            citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=chosen_gmls,
+                                     workers=workers, executor=executor, surface_cache=surface_cache)
         elif gml_bldg_addresses is not None:
-            chosen_gmls=citygml_in.choose_gml_lxml(path, bldg_addresses=gml_bldg_addresses)
-            citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=chosen_gmls)
+            chosen_gmls=citygml_in.choose_gml_lxml(path, bldg_addresses=gml_bldg_addresses, sidecar=gml_index_file)
+            citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=chosen_gmls,
+                                     workers=workers, executor=executor, surface_cache=surface_cache)
         else:
-            gml_copy, boundary_box = citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=None)
+            gml_copy, boundary_box = citygml_in.load_gml_lxml(path, self, method=method, chosen_gmls=None,
+                                                              workers=workers, executor=executor,
+                                                              surface_cache=surface_cache)
+        if surface_cache is not None:
+            surface_cache.save()
         return gml_copy, boundary_box
 
     def export_aixlib(
@@ -1123,6 +1371,9 @@ internal_gains_mode: int [1, 2, 3]
         corG=None,
         internal_id=None,
         path=None,
+        table_format="txt",
+        workers=None,
+        executor=None,
     ):
         """Exports values to a record file for Modelica simulation
 
@@ -1144,6 +1395,18 @@ internal_gains_mode: int [1, 2, 3]
         path : string
             if the Files should not be stored in default output path of TEASER,
             an alternative path can be specified as a full path
+        table_format : str
+            File format of the set temperature, AHU and internal gains
+            tables, "txt" (default) for text files or "mat" for MATLAB v4
+            files, which are smaller and faster to write and to load
+        workers : int
+            Number of worker processes to export the buildings in parallel,
+            the exported files are identical to the serial export. Default is
+            None, which exports all buildings in this process unless an
+            executor is given.
+        executor : concurrent.futures.Executor
+            Executor (e.g. ProcessPoolExecutor) to export the buildings in
+            parallel instead of creating a new process pool, default is None
         """
 
         if building_model is not None or zone_model is not None or corG is not None:
@@ -1164,17 +1427,27 @@ internal_gains_mode: int [1, 2, 3]
 
         if internal_id is None:
             aixlib_output.export_multizone(
-                buildings=self.buildings, prj=self, path=path
+                buildings=self.buildings,
+                prj=self,
+                path=path,
+                table_format=table_format,
+                workers=workers,
+                executor=executor,
             )
         else:
             for bldg in self.buildings:
                 if bldg.internal_id == internal_id:
                     aixlib_output.export_multizone(
-                        buildings=[bldg], prj=self, path=path
+                        buildings=[bldg],
+                        prj=self,
+                        path=path,
+                        table_format=table_format,
                     )
         return path
 
-    def export_ibpsa(self, library="AixLib", internal_id=None, path=None):
+    def export_ibpsa(
+        self, library="AixLib", internal_id=None, path=None, table_format="txt"
+    ):
         """Exports values to a record file for Modelica simulation
 
         For Annex 60 Library
@@ -1194,6 +1467,10 @@ internal_gains_mode: int [1, 2, 3]
         path : string
             if the Files should not be stored in default output path of TEASER,
             an alternative path can be specified as a full path
+        table_format : str
+            File format of the internal gains tables, "txt" (default) for
+            text files or "mat" for MATLAB v4 files, which are smaller and
+            faster to write and to load
         """
 
         ass_error_1 = (
@@ -1217,12 +1494,21 @@ internal_gains_mode: int [1, 2, 3]
 
         if internal_id is None:
             ibpsa_output.export_ibpsa(
-                buildings=self.buildings, prj=self, path=path, library=library
+                buildings=self.buildings,
+                prj=self,
+                path=path,
+                library=library,
+                table_format=table_format,
             )
         else:
             for bldg in self.buildings:
                 if bldg.internal_id == internal_id:
-                    ibpsa_output.export_ibpsa(buildings=[bldg], prj=self, path=path)
+                    ibpsa_output.export_ibpsa(
+                        buildings=[bldg],
+                        prj=self,
+                        path=path,
+                        table_format=table_format,
+                    )
         return path
 
     def set_default(self, load_data=None):
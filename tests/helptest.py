@@ -224,3 +224,83 @@ def building_test2(prj):
     ground_material.heat_capac = 0.84
 
     return bldg
+
+
+def write_gml_test_file(path, number_of_buildings=4):
+    """
+    writes a CityGML file with LoD2 box shaped buildings for testing
+
+    Every third building is a multi family house (function 1010), the others
+    are single family houses (function 1000). Building i is named
+    "Building{i}", has the id "BLDG_{i}" and the address
+    ("Street{i % 7}", "{i}").
+    """
+    def surface(kind, coords):
+        pos_list = " ".join(str(float(coord)) for point in coords for coord in point)
+        return (
+            "<bldg:boundedBy><bldg:{kind}><bldg:lod2MultiSurface>"
+            "<gml:MultiSurface><gml:surfaceMember><gml:Polygon><gml:exterior>"
+            "<gml:LinearRing>\n<gml:posList srsDimension=\"3\">{pos_list}"
+            "</gml:posList>\n</gml:LinearRing></gml:exterior></gml:Polygon>"
+            "</gml:surfaceMember></gml:MultiSurface></bldg:lod2MultiSurface>"
+            "</bldg:{kind}></bldg:boundedBy>\n".format(kind=kind, pos_list=pos_list)
+        )
+
+    with open(path, "w") as gml_file:
+        gml_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<core:CityModel xmlns:core="http://www.opengis.net/citygml/2.0" '
+            'xmlns:bldg="http://www.opengis.net/citygml/building/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml" '
+            'xmlns:xal="urn:oasis:names:tc:ciq:xsdschema:xAL:2.0">\n'
+            "<gml:boundedBy><gml:Envelope srsDimension=\"3\">"
+            "<gml:lowerCorner>0 0 0</gml:lowerCorner>"
+            "<gml:upperCorner>1000 1000 30</gml:upperCorner>"
+            "</gml:Envelope></gml:boundedBy>\n"
+        )
+        for i in range(number_of_buildings):
+            x0, y0 = 20.0 * (i % 50), 20.0 * (i // 50)
+            x1, y1, height = x0 + 10.0, y0 + 8.0 + i % 3, 6.0
+            corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+            gml_file.write(
+                '<core:cityObjectMember><bldg:Building gml:id="BLDG_{i}">\n'
+                "<gml:name>Building{i}</gml:name>\n"
+                "<bldg:function>{function}</bldg:function>\n"
+                "<bldg:yearOfConstruction>{yoc}</bldg:yearOfConstruction>\n"
+                "<bldg:measuredHeight>{height}</bldg:measuredHeight>\n"
+                "<bldg:storeysAboveGround>2</bldg:storeysAboveGround>\n"
+                "<bldg:storeyHeightsAboveGround>3.0</bldg:storeyHeightsAboveGround>\n".format(
+                    i=i,
+                    function="1010" if i % 3 == 0 else "1000",
+                    yoc=1950 + (7 * i) % 60,
+                    height=height,
+                )
+            )
+            gml_file.write(
+                surface("GroundSurface", [(x, y, 0.0) for x, y in reversed(corners)])
+            )
+            gml_file.write(surface("RoofSurface", [(x, y, height) for x, y in corners]))
+            for (xa, ya), (xb, yb) in zip(corners[:-1], corners[1:]):
+                gml_file.write(
+                    surface(
+                        "WallSurface",
+                        [
+                            (xa, ya, 0.0),
+                            (xb, yb, 0.0),
+                            (xb, yb, height),
+                            (xa, ya, height),
+                            (xa, ya, 0.0),
+                        ],
+                    )
+                )
+            gml_file.write(
+                "<bldg:address><core:Address><core:xalAddress>"
+                "<xal:AddressDetails><xal:Country><xal:Locality><xal:Thoroughfare>"
+                "<xal:ThoroughfareName>Street{street}</xal:ThoroughfareName>"
+                "<xal:ThoroughfareNumber>{i}</xal:ThoroughfareNumber>"
+                "</xal:Thoroughfare></xal:Locality></xal:Country>"
+                "</xal:AddressDetails></core:xalAddress></core:Address>"
+                "</bldg:address>\n"
+                "</bldg:Building></core:cityObjectMember>\n".format(street=i % 7, i=i)
+            )
+        gml_file.write("</core:CityModel>\n")
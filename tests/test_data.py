@@ -10,6 +10,7 @@ import math
 import os
 import helptest
 import warnings as warnings
+import pytest
 
 prj = Project(True)
 
@@ -625,6 +626,605 @@ class Test_teaser(object):
         prj.used_library_calc = "AixLib"
         prj.calc_all_buildings(raise_errors=True)
 
+    def test_calc_all_buildings_parallel(self):
+        """test of calc_all_buildings in a process pool against serial"""
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+
+        prj_serial = Project()
+        prj_parallel = Project()
+        for prj_calc in (prj_serial, prj_parallel):
+            helptest.building_test2(prj_calc)
+            prj_calc.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="ResidentialBuilding",
+                year_of_construction=1988,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=200.0,
+            )
+            bld = Building(parent=prj_calc)
+            tz = ThermalZone(parent=bld)
+            tz.use_conditions = UseConditions(parent=tz)
+            prj_calc.number_of_elements_calc = 4
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            prj_serial.calc_all_buildings()
+            prj_parallel.calc_all_buildings(workers=2)
+
+        assert len(prj_parallel.buildings) == 2
+        for bldg_serial, bldg_parallel in zip(
+            prj_serial.buildings, prj_parallel.buildings
+        ):
+            assert bldg_parallel.parent is prj_parallel
+            assert bldg_parallel.library_attr.parent is bldg_parallel
+            assert bldg_parallel.sum_heat_load == bldg_serial.sum_heat_load
+            for tz_serial, tz_parallel in zip(
+                bldg_serial.thermal_zones, bldg_parallel.thermal_zones
+            ):
+                assert tz_parallel.model_attr.thermal_zone is tz_parallel
+                assert tz_parallel.model_attr.r1_ow == tz_serial.model_attr.r1_ow
+                assert tz_parallel.model_attr.c1_iw == tz_serial.model_attr.c1_iw
+                assert (
+                    tz_parallel.outer_walls[0].ua_value
+                    == tz_serial.outer_walls[0].ua_value
+                )
+
+    def test_recalculate(self):
+        """test of dirty tracking and incremental recalculation"""
+        prj_recalc = Project()
+        for year in (1950, 1970):
+            prj_recalc.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="ResidentialBuilding",
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=200.0,
+            )
+        prj_recalc.calc_all_buildings()
+        bldg_changed, bldg_unchanged = prj_recalc.buildings
+        zone = bldg_changed.thermal_zones[0]
+        assert bldg_changed.calc_dirty is False
+        assert zone.needs_recalc() is False
+
+        model_unchanged = bldg_unchanged.thermal_zones[0].model_attr
+        zone.outer_walls[0].layer[0].material.thermal_conduc = 0.3
+        assert zone.outer_walls[0].calc_dirty is True
+        assert zone.calc_dirty is True
+        assert bldg_changed.calc_dirty is True
+        assert bldg_unchanged.calc_dirty is False
+
+        prj_recalc.recalculate()
+        assert zone.needs_recalc() is False
+        assert bldg_unchanged.thermal_zones[0].model_attr is model_unchanged
+        r1_ow = zone.model_attr.r1_ow
+        ua_value_ow = zone.model_attr.ua_value_ow
+        heat_load = bldg_changed.sum_heat_load
+
+        prj_recalc.number_of_elements_calc = 2
+        zone.calc_zone_parameters(number_of_elements=2, t_bt=5)
+        assert zone.model_attr.r1_ow == r1_ow
+        assert zone.model_attr.ua_value_ow == ua_value_ow
+        assert heat_load == zone.model_attr.heat_load
+
+        prj_recalc.number_of_elements_calc = 4
+        assert zone.needs_recalc(number_of_elements=4) is True
+        prj_recalc.recalculate()
+        assert type(zone.model_attr).__name__ == "FourElement"
+
+        heat_load = zone.model_attr.heat_load
+        zone.use_conditions.infiltration_rate = 2.0
+        assert zone.needs_recalc(number_of_elements=4) is True
+        assert bldg_changed.calc_dirty is True
+        prj_recalc.recalculate()
+        assert zone.model_attr.heat_load > heat_load
+        heat_load = zone.model_attr.heat_load
+        zone.calc_zone_parameters(number_of_elements=4, t_bt=5)
+        assert zone.model_attr.heat_load == heat_load
+
+        from teaser.logic.buildingobjects.buildingphysics.buildingelement import (
+            BuildingElement,
+        )
+        from teaser.logic.buildingobjects.buildingphysics.innerwall import InnerWall
+
+        assert BuildingElement().calc_dirty is True
+        inner_wall = InnerWall()
+        assert zone.needs_recalc(number_of_elements=4) is False
+        inner_wall.parent = zone
+        assert zone.calc_dirty is True
+
+    def test_evaluate_retrofit_scenarios(self):
+        """test of retrofit scenarios against retrofit_all_buildings"""
+        prj_scenario = Project(load_data=True)
+        prj_scenario.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1960,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0,
+        )
+        bldg = prj_scenario.buildings[0]
+        ua_value_ow = bldg.thermal_zones[0].outer_walls[0].ua_value
+        heat_load = bldg.sum_heat_load
+
+        variants = [
+            {"year_of_retrofit": 2015, "material": "EPS_040_15"},
+            {"year_of_retrofit": 1995},
+        ]
+        results = prj_scenario.evaluate_retrofit_scenarios(variants)
+
+        assert len(results) == 2
+        assert list(results["variant"]) == [0, 1]
+        assert bldg.thermal_zones[0].outer_walls[0].ua_value == ua_value_ow
+        assert bldg.sum_heat_load == heat_load
+        assert bldg.year_of_retrofit is None
+
+        prj_scenario.retrofit_all_buildings(
+            year_of_retrofit=2015, material="EPS_040_15"
+        )
+        bldg.calc_lca_data()
+        assert round(results["sum_heat_load"][0], 6) == round(bldg.sum_heat_load, 6)
+        assert round(results["lca_gwp"][0], 6) == round(
+            bldg.lca_data.gwp.sum_stages(), 6
+        )
+        assert results["sum_heat_load"][1] > results["sum_heat_load"][0]
+
+    def test_evaluate_retrofit_scenarios_tabula(self):
+        """test of TABULA retrofit scenarios against retrofit_all_buildings"""
+        variants = [
+            {"type_of_retrofit": "retrofit"},
+            {"type_of_retrofit": "adv_retrofit"},
+        ]
+        expected = {}
+        for type_of_retrofit in ("retrofit", "adv_retrofit", None):
+            prj_scenario = Project(load_data=True)
+            prj_scenario.add_residential(
+                method="tabula_de",
+                usage="single_family_house",
+                name="ResidentialBuilding",
+                year_of_construction=1960,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=200.0,
+                construction_type="tabula_standard",
+            )
+            if type_of_retrofit is not None:
+                prj_scenario.retrofit_all_buildings(type_of_retrofit=type_of_retrofit)
+                bldg = prj_scenario.buildings[0]
+                expected[type_of_retrofit] = (
+                    bldg.sum_heat_load,
+                    sum(door.ua_value for door in bldg.thermal_zones[0].doors),
+                )
+
+        bldg = prj_scenario.buildings[0]
+        door_construction = bldg.thermal_zones[0].doors[0].construction_type
+        for order in (variants, variants[::-1]):
+            results = prj_scenario.evaluate_retrofit_scenarios(order)
+            for _, row in results.iterrows():
+                heat_load, ua_value_doors = expected[row["type_of_retrofit"]]
+                assert round(row["sum_heat_load"], 6) == round(heat_load, 6)
+                assert round(row["ua_value_doors"], 6) == round(ua_value_doors, 6)
+        assert bldg.thermal_zones[0].doors[0].construction_type == door_construction
+
+    def test_load_citygml_streaming(self):
+        """test of streaming CityGML import against the tree based import"""
+        path = os.path.join(utilities.get_default_path(), "streaming_test.gml")
+        helptest.write_gml_test_file(path, number_of_buildings=6)
+
+        prj_tree = Project(load_data=True)
+        gml_copy, boundary_box = prj_tree.load_citygml(path=path)
+        prj_stream = Project(load_data=True)
+        gml_copy_stream, boundary_box_stream = prj_stream.load_citygml(
+            path=path, streaming=True
+        )
+
+        assert len(gml_copy) == 6
+        assert gml_copy_stream is None
+        assert boundary_box_stream.find(
+            "{http://www.opengis.net/gml}upperCorner"
+        ).text == boundary_box.find("{http://www.opengis.net/gml}upperCorner").text
+        assert len(prj_stream.buildings) == 6
+        for bldg, bldg_stream in zip(prj_tree.buildings, prj_stream.buildings):
+            assert type(bldg_stream) is type(bldg)
+            assert bldg_stream.name == bldg.name
+            assert bldg_stream.year_of_construction == bldg.year_of_construction
+            assert len(bldg_stream.gml_surfaces) == len(bldg.gml_surfaces)
+            assert bldg_stream.net_leased_area == bldg.net_leased_area
+
+        prj_stream = Project(load_data=True)
+        prj_stream.load_citygml(
+            path=path,
+            gml_bldg_ids=["BLDG_1"],
+            gml_bldg_names=["Building2"],
+            gml_bldg_addresses=[("Street4", "4")],
+            streaming=True,
+        )
+        assert [bldg.name for bldg in prj_stream.buildings] == [
+            "Building1",
+            "Building2",
+            "Building4",
+        ]
+
+    def test_load_citygml_parallel(self):
+        """test of CityGML import in a process pool against serial import"""
+        path = os.path.join(utilities.get_default_path(), "parallel_test.gml")
+        helptest.write_gml_test_file(path, number_of_buildings=5)
+
+        prj_serial = Project(load_data=True)
+        prj_serial.load_citygml(path=path)
+        prj_parallel = Project(load_data=True)
+        gml_copy, boundary_box = prj_parallel.load_citygml(path=path, workers=2)
+        prj_stream = Project(load_data=True)
+        prj_stream.load_citygml(path=path, streaming=True, workers=2)
+
+        assert len(gml_copy) == 5
+        for prj_loaded in (prj_parallel, prj_stream):
+            assert len(prj_loaded.buildings) == 5
+            for bldg_serial, bldg in zip(prj_serial.buildings, prj_loaded.buildings):
+                assert bldg.parent is prj_loaded
+                assert type(bldg) is type(bldg_serial)
+                assert bldg.name == bldg_serial.name
+                assert bldg.net_leased_area == bldg_serial.net_leased_area
+                assert len(bldg.thermal_zones) == len(bldg_serial.thermal_zones)
+
+        prj_stream.calc_all_buildings()
+        prj_serial.calc_all_buildings()
+        for bldg_serial, bldg in zip(prj_serial.buildings, prj_stream.buildings):
+            assert bldg.sum_heat_load == bldg_serial.sum_heat_load
+
+        prj_share = Project(load_data=True, share_material_templates=True)
+        prj_share.load_citygml(path=path, workers=2)
+        templates = prj_share.data.material_templates
+        for bldg in prj_share.buildings:
+            for wall in bldg.thermal_zones[0].outer_walls:
+                for layer in wall.layer:
+                    assert layer.material is templates[layer.material.material_id]
+
+    def test_choose_gml_index(self):
+        """test of the CityGML building index used by choose_gml_lxml"""
+        from teaser.data.input import citygml_input
+
+        path = os.path.join(utilities.get_default_path(), "index_test.gml")
+        helptest.write_gml_test_file(path, number_of_buildings=9)
+        if os.path.isfile(path + ".index.json"):
+            os.remove(path + ".index.json")
+
+        index = citygml_input.index_gml_lxml(path, sidecar=True)
+        assert len(index["offsets"]) == 9
+        assert index["ids"]["BLDG_4"] == 4
+        assert index["names"]["Building8"] == [8]
+        assert index["addresses"]["Street1"] == {"1": [1], "8": [8]}
+        assert os.path.isfile(path + ".index.json")
+        assert citygml_input.index_gml_lxml(path, sidecar=True) == index
+
+        chosen_gmls, namespace = citygml_input.choose_gml_lxml(
+            path,
+            bldg_ids=["BLDG_7", "BLDG_2"],
+            bldg_names=["Building2"],
+            bldg_addresses=[("Street1", "8")],
+            sidecar=True,
+        )
+        assert [
+            building.get("{http://www.opengis.net/gml}id") for building in chosen_gmls
+        ] == ["BLDG_2", "BLDG_7", "BLDG_8"]
+        assert chosen_gmls[0].find("gml:name", namespace).text == "Building2"
+
+        prj_chosen = Project(load_data=True)
+        prj_chosen.load_citygml(
+            path=path, gml_bldg_names=["Building5"], gml_index_file=True
+        )
+        assert [bldg.name for bldg in prj_chosen.buildings] == ["Building5"]
+        assert len(prj_chosen.buildings[0].gml_surfaces) == 6
+
+    def test_choose_gml_index_edge_cases(self):
+        """test of the CityGML building index with unusual but valid files"""
+        from teaser.data.input import citygml_input
+
+        path = os.path.join(utilities.get_default_path(), "index_edge_test.gml")
+        content = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+            '<CityModel xmlns="http://www.opengis.net/citygml/2.0" '
+            'xmlns:b="http://www.opengis.net/citygml/building/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml">\n'
+            "<!-- <b:Building gml:id=\"COMMENT\"> -->\n"
+            '<cityObjectMember><b:Building gml:id="EMPTY" a="1>0"/></cityObjectMember>\n'
+            '<cityObjectMember><b:Building gml:id="UMLAUT">'
+            "<gml:name>Häuser</gml:name>"
+            "<b:function><![CDATA[</b:Building>]]></b:function>"
+            "</b:Building ></cityObjectMember>\n"
+            '<cityObjectMember><b:Building gml:id="LAST"><gml:name>Last</gml:name>'
+            "</b:Building></cityObjectMember>\n"
+            "</CityModel>\n"
+        )
+        with open(path, "wb") as gml_file:
+            gml_file.write(content.encode("iso-8859-1"))
+
+        index = citygml_input.index_gml_lxml(path)
+        assert index["encoding"] == "ISO-8859-1"
+        assert index["ids"] == {"EMPTY": 0, "UMLAUT": 1, "LAST": 2}
+        assert index["names"] == {"Häuser": [1], "Last": [2]}
+        chosen_gmls, namespace = citygml_input.choose_gml_lxml(
+            path, bldg_names=["Häuser"]
+        )
+        assert len(chosen_gmls) == 1
+        assert chosen_gmls[0].find("b:function", namespace).text == "</b:Building>"
+        chosen_gmls, namespace = citygml_input.choose_gml_lxml(path, bldg_ids=["EMPTY"])
+        assert chosen_gmls[0].get("a") == "1>0"
+
+        open(path, "w").close()
+        index = citygml_input.index_gml_lxml(path)
+        assert index["offsets"] == [] and index["ids"] == {}
+
+    def test_gml_surface_cache(self):
+        """test of the on-disk cache of GML surfaces"""
+        import shutil
+        from teaser.data.surfacegmlcache import SurfaceGMLCache
+
+        path = os.path.join(utilities.get_default_path(), "surface_cache_test.gml")
+        cache_dir = os.path.join(utilities.get_default_path(), "gml_surface_cache")
+        helptest.write_gml_test_file(path, number_of_buildings=4)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+        prj_plain = Project(load_data=True)
+        prj_plain.load_citygml(path=path)
+        prj_first = Project(load_data=True)
+        prj_first.load_citygml(path=path, gml_surface_cache=cache_dir)
+
+        cache = SurfaceGMLCache.for_file(path, cache_dir)
+        assert sorted(cache.entries) == ["BLDG_0", "BLDG_1", "BLDG_2", "BLDG_3"]
+        assert len(cache.get("BLDG_1")) == 6
+
+        prj_cached = Project(load_data=True)
+        prj_cached.load_citygml(path=path, gml_surface_cache=cache_dir)
+        for prj_loaded in (prj_first, prj_cached):
+            for bldg_plain, bldg in zip(prj_plain.buildings, prj_loaded.buildings):
+                assert bldg.net_leased_area == bldg_plain.net_leased_area
+                for surface_plain, surface in zip(
+                    bldg_plain.gml_surfaces, bldg.gml_surfaces
+                ):
+                    assert surface.gml_surface == surface_plain.gml_surface
+                    assert surface.surface_area == surface_plain.surface_area
+                    assert (
+                        surface.surface_orientation
+                        == surface_plain.surface_orientation
+                    )
+                    assert surface.surface_tilt == surface_plain.surface_tilt
+
+    def test_surface_gml_batch(self):
+        """test of vectorized SurfaceGMLBatch against SurfaceGML"""
+        import numpy as np
+        from teaser.data.surfacegml import SurfaceGML, SurfaceGMLBatch
+
+        gml_surfaces = [
+            [0, 0, 0, 0, 8, 0, 10, 8, 0, 10, 0, 0, 0, 0, 0],
+            [0, 0, 6, 10, 0, 6, 10, 8, 6, 0, 8, 6, 0, 0, 6],
+            [0, 0, 0, 10, 0, 0, 10, 0, 6, 0, 0, 6, 0, 0, 0],
+            [10, 0, 0, 10, 8, 0, 10, 8, 6, 10, 0, 6, 10, 0, 0],
+            [0, 0, 6, 5, 0, 9, 5, 8, 9, 0, 8, 6, 0, 0, 6],
+            [0, 0, 0, 4, 0, 0, 4, 3, 2, 0, 0, 0],
+            [1, 1, 0, 4, 2, 0, 5, 5, 1, 3, 6, 2, 0, 4, 1, 1, 1, 0],
+        ]
+        batch = SurfaceGMLBatch(
+            coordinates=np.concatenate(gml_surfaces),
+            offsets=np.cumsum([0] + [len(surface) for surface in gml_surfaces]),
+        )
+
+        assert len(batch) == 7
+        surface_view = batch.surface(2)
+        assert np.shares_memory(surface_view.coordinates, batch.coordinates)
+        assert not surface_view.coordinates.flags.writeable
+        assert surface_view.gml_surface == gml_surfaces[2]
+        assert isinstance(surface_view.gml_surface, list)
+        surface_view.gml_surface[2] = 1.0
+        assert surface_view.coordinates[2] == 1.0
+        assert batch.coordinates[batch.offsets[2] + 2] == 0.0
+
+        for index, gml_surface in enumerate(gml_surfaces):
+            surface = SurfaceGML(gml_surface)
+            surface_batch = batch.surface(index)
+            assert surface_batch.gml_surface == gml_surface
+            assert round(surface_batch.surface_area, 10) == round(
+                surface.surface_area, 10
+            )
+            assert round(surface_batch.surface_tilt, 10) == round(
+                surface.surface_tilt, 10
+            )
+            assert round(surface_batch.surface_orientation, 10) == round(
+                surface.surface_orientation, 10
+            )
+        assert batch.surface(0).surface_orientation == -2
+        assert batch.surface(1).surface_orientation == -1
+        assert batch.surface(2).surface_tilt == 90
+
+    def test_decode_double_list(self):
+        """test of the posList decoding of the CityGML import"""
+        import lxml.etree as ET
+        from teaser.data.input.citygml_input import (
+            decode_double_list,
+            decode_pos_elements,
+        )
+
+        values = decode_double_list("\n 1.5 2 -3e2\n4.25\t5 6 ")
+        assert values.dtype.name == "float64"
+        assert values.tolist() == [1.5, 2.0, -300.0, 4.25, 5.0, 6.0]
+        assert decode_double_list(None).size == 0
+        assert decode_double_list(" \n ").size == 0
+        for text in ["1 2 x 4", "1.5 2,5 3", "1 2 3x", "1 2 3 nan?"]:
+            with pytest.raises(ValueError):
+                decode_double_list(text)
+
+        ring = ET.fromstring(
+            '<gml:LinearRing xmlns:gml="http://www.opengis.net/gml">\n'
+            "<gml:pos>0 0 0</gml:pos><gml:pos>1 0 0</gml:pos>"
+            "<gml:pos>1 1 0.5</gml:pos><gml:pos/></gml:LinearRing>"
+        )
+        assert decode_pos_elements(ring.iter()).tolist() == [
+            0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.5,
+        ]
+
+    def test_get_gml_surfaces_lod(self):
+        """test of the surface selection of the CityGML import per LoD"""
+        import lxml.etree as ET
+        from teaser.data.input.citygml_input import get_gml_surfaces
+        from teaser.logic.buildingobjects.building import Building
+
+        def polygon(coordinates):
+            return (
+                "<gml:surfaceMember><gml:Polygon><gml:exterior><gml:LinearRing>"
+                "<gml:posList>{}</gml:posList>"
+                "</gml:LinearRing></gml:exterior></gml:Polygon></gml:surfaceMember>"
+            ).format(coordinates)
+
+        wall = polygon("0 0 0 10 0 0 10 0 6 0 0 6 0 0 0")
+        window = polygon("2 0 1 4 0 1 4 0 3 2 0 3 2 0 1")
+        roof = polygon("0 0 6 10 0 6 10 8 6 0 8 6 0 0 6")
+        header = (
+            '<bldg:Building xmlns:bldg="http://www.opengis.net/citygml/building/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml" gml:id="BLDG_1">'
+        )
+
+        lod1 = ET.fromstring(
+            header + "<bldg:lod1Solid><gml:Solid><gml:exterior><gml:CompositeSurface>"
+            + wall + roof
+            + "</gml:CompositeSurface></gml:exterior></gml:Solid></bldg:lod1Solid>"
+            "</bldg:Building>"
+        )
+        lod3 = ET.fromstring(
+            header + "<bldg:boundedBy><bldg:WallSurface><bldg:lod3MultiSurface>"
+            "<gml:MultiSurface>" + wall + "</gml:MultiSurface></bldg:lod3MultiSurface>"
+            "<bldg:opening><bldg:Window><bldg:lod3MultiSurface><gml:MultiSurface>"
+            + window + "</gml:MultiSurface></bldg:lod3MultiSurface></bldg:Window>"
+            "</bldg:opening></bldg:WallSurface></bldg:boundedBy>"
+            "<bldg:boundedBy><bldg:RoofSurface><bldg:lod3MultiSurface>"
+            "<gml:MultiSurface>" + roof + "</gml:MultiSurface></bldg:lod3MultiSurface>"
+            "</bldg:RoofSurface></bldg:boundedBy></bldg:Building>"
+        )
+
+        bldg = Building(parent=None)
+        get_gml_surfaces(bldg=bldg, city_object=lod1, namespace=lod1.nsmap)
+        # each ring of the Solid once, it used to be collected through the
+        # Solid and the Polygon exterior: [60.0, 80.0, 60.0, 80.0]
+        assert [surface.surface_area for surface in bldg.gml_surfaces] == [60.0, 80.0]
+
+        bldg = Building(parent=None)
+        get_gml_surfaces(bldg=bldg, city_object=lod3, namespace=lod3.nsmap)
+        assert [surface.name for surface in bldg.gml_surfaces] == [
+            None, None, None, "Window",
+        ]
+        assert bldg.gml_surfaces[-1].surface_area == 4.0
+
+    def test_energyade_feature_members(self):
+        """test of the extraction of EnergyADE constructions and materials"""
+        import lxml.etree as ET
+        from teaser.data.input import energyade_input
+
+        path = os.path.join(utilities.get_default_path(), "ade_members_test.gml")
+        with open(path, "w") as ade_file:
+            ade_file.write(
+                '<core:CityModel xmlns:core="http://www.opengis.net/citygml/2.0" '
+                'xmlns:gml="http://www.opengis.net/gml" '
+                'xmlns:xlink="http://www.w3.org/1999/xlink" '
+                'xmlns:energy="http://www.sig3d.org/citygml/2.0/energy/1.0">'
+                '<gml:featureMember><energy:Construction gml:id="Wall_Construction">'
+                "<gml:name>Wall</gml:name><energy:uValue>0.3</energy:uValue>"
+                '<energy:layer><energy:Layer gml:id="Wall_Layer"><energy:layerComponent>'
+                '<energy:LayerComponent gml:id="Wall_Component">'
+                "<energy:areaFraction>1</energy:areaFraction>"
+                "<energy:thickness>0.24</energy:thickness>"
+                '<energy:material xlink:href="#Brick"/></energy:LayerComponent>'
+                "</energy:layerComponent></energy:Layer></energy:layer>"
+                "</energy:Construction></gml:featureMember>"
+                '<gml:featureMember><energy:Construction gml:id="Window_Construction">'
+                "<gml:name>Window</gml:name><energy:uValue>1.3</energy:uValue>"
+                "<energy:opticalProperties><energy:OpticalProperties><energy:transmittance>"
+                "<energy:Transmittance><energy:fraction>0.6</energy:fraction>"
+                "<energy:wavelengthRange>solar</energy:wavelengthRange></energy:Transmittance>"
+                "</energy:transmittance><energy:glazingRatio>0.7</energy:glazingRatio>"
+                "</energy:OpticalProperties></energy:opticalProperties>"
+                "</energy:Construction></gml:featureMember>"
+                '<gml:featureMember><energy:SolidMaterial gml:id="Brick">'
+                "<gml:name>Brick</gml:name><energy:conductivity>0.8</energy:conductivity>"
+                "<energy:density>1800</energy:density>"
+                "<energy:specificHeat>1000</energy:specificHeat>"
+                "</energy:SolidMaterial></gml:featureMember>"
+                '<gml:featureMember><energy:Gas gml:id="Air"><gml:name>Air</gml:name>'
+                "<energy:isVentilated>false</energy:isVentilated>"
+                "<energy:rValue>0.18</energy:rValue></energy:Gas></gml:featureMember>"
+                "</core:CityModel>"
+            )
+
+        construction_dict, constr_win_dict, material_dict = (
+            energyade_input._get_feature_members(path)
+        )
+        assert construction_dict == {
+            "Wall_Construction": [
+                "Wall", "0.3", {"Wall_Layer": [{"Wall_Component": [1.0, 0.24, "Brick"]}]},
+            ]
+        }
+        assert constr_win_dict == {
+            "Window_Construction": ["Window", "1.3", "0.6", "solar", "0.7"]
+        }
+        assert material_dict == {
+            "Brick": ["Brick", "0.8", "1800", "1000"],
+            "Air": ["Air", "false", "0.18"],
+        }
+
+        root = ET.parse(path).getroot()
+        assert energyade_input._get_construction(
+            root.findall("gml:featureMember/energy:Construction", root.nsmap)
+        ) == (construction_dict, constr_win_dict)
+
+    def test_citygml_probe(self):
+        """test of the geometry probe of CityGML Buildings and BuildingParts"""
+        import lxml.etree as ET
+        from teaser.data.citygmlprobe import CityGMLProbe
+        from teaser.data.input.citygml_input import get_lod
+
+        building = ET.fromstring(
+            '<bldg:Building xmlns:bldg="http://www.opengis.net/citygml/building/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml" gml:id="BLDG_1">'
+            "<bldg:function>1000</bldg:function>"
+            "<bldg:lod0FootPrint><gml:MultiSurface><gml:surfaceMember><gml:Polygon>"
+            "<gml:exterior><gml:LinearRing><gml:posList>0 0 0 1 0 0 1 1 0 0 0 0"
+            "</gml:posList></gml:LinearRing></gml:exterior></gml:Polygon>"
+            "</gml:surfaceMember></gml:MultiSurface></bldg:lod0FootPrint>"
+            "<bldg:consistsOfBuildingPart><bldg:BuildingPart gml:id=\"PART_1\">"
+            "<bldg:boundedBy><bldg:GroundSurface><bldg:lod2MultiSurface>"
+            "<gml:MultiSurface><gml:surfaceMember><gml:Polygon><gml:exterior>"
+            "<gml:LinearRing><gml:pos>0 0 0</gml:pos><gml:pos>1 0 0</gml:pos>"
+            "<gml:pos>1 1 0</gml:pos><gml:pos>0 0 0</gml:pos></gml:LinearRing>"
+            "</gml:exterior></gml:Polygon></gml:surfaceMember></gml:MultiSurface>"
+            "</bldg:lod2MultiSurface></bldg:GroundSurface></bldg:boundedBy>"
+            "</bldg:BuildingPart></bldg:consistsOfBuildingPart></bldg:Building>"
+        )
+
+        probe = CityGMLProbe(building)
+        assert probe.lods == [0, 2]
+        assert probe.lod == 0
+        assert probe.lod_elements == ["lod0FootPrint"]
+        assert probe.geometry == "footprint"
+        assert probe.pos_list is True
+        assert len(probe.building_parts) == 1
+
+        part, part_probe = probe.building_parts[0]
+        assert part.get("{http://www.opengis.net/gml}id") == "PART_1"
+        assert part_probe.lod == 2
+        assert part_probe.lod_elements == []
+        assert part_probe.surface_types == ["GroundSurface"]
+        assert part_probe.geometry == "boundedBy"
+        assert part_probe.pos_list is False
+        assert part_probe.building_parts == []
+
+        assert get_lod(part) == 2
+        assert CityGMLProbe(ET.fromstring("<Building/>")).lod is None
+
     def test_retrofit_all_buildings(self):
         """test of retrofit_all_buildings, no calculation verification"""
         prj.add_residential(
@@ -2261,6 +2861,26 @@ class Test_teaser(object):
         therm_zone.inner_walls[0].delete_type_element(data_class=prj.data)
         therm_zone.windows[0].delete_type_element(data_class=prj.data)
 
+    def test_find_type_elements(self):
+        """test of the type element index against a linear search"""
+        from teaser.data.dataclass import DataClass
+
+        dat = DataClass(used_statistic="tabula_de")
+        for year in [1859, 1860, 1950, 2009, 2010, 2015, 2016.5]:
+            for construction in ["tabula_standard_1_SFH", "tabula_retrofit_1_SFH"]:
+                keys = tuple(
+                    key
+                    for key, element_in in dat.element_bind.items()
+                    if key != "version"
+                    and key.startswith("OuterWall")
+                    and element_in["construction_type"] == construction
+                    and element_in["building_age_group"][0]
+                    <= year
+                    <= element_in["building_age_group"][1]
+                )
+                assert dat.find_type_elements("OuterWall", construction, year) == keys
+        assert dat.find_type_elements("OuterWall", "heavy", 1950) == ()
+
     # methods in Wall
 
     def test_calc_equivalent_res_wall(self):
@@ -2280,6 +2900,101 @@ class Test_teaser(object):
         assert round(therm_zone.outer_walls[0].r3, 12) == 0.137027879186
         assert round(therm_zone.outer_walls[0].c1_korr, 6) == 111237.213205
 
+    def test_calc_equivalent_res_walls(self):
+        """test of vectorized calc_equivalent_res_walls against single walls"""
+        import numpy as np
+        import teaser.logic.buildingobjects.calculation.vdi6007 as vdi6007
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        walls = (
+            therm_zone.outer_walls
+            + therm_zone.rooftops
+            + therm_zone.ground_floors
+            + therm_zone.inner_walls
+        )
+        vdi6007.calc_equivalent_res_walls(walls)
+        batch = [(w.r1, w.r2, w.r3, w.c1, w.c2, w.c1_korr) for w in walls]
+        for wall, values in zip(walls, batch):
+            wall.calc_equivalent_res()
+            single = (wall.r1, wall.r2, wall.r3, wall.c1, wall.c2, wall.c1_korr)
+            np.testing.assert_allclose(values, single, rtol=1e-9)
+
+    def test_equivalent_res_cache(self):
+        """test of memoized equivalent resistances per layer stack"""
+        import numpy as np
+        import teaser.logic.buildingobjects.calculation.vdi6007 as vdi6007
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        walls = therm_zone.outer_walls + therm_zone.inner_walls
+
+        cache = vdi6007.EquivalentResCache(maxsize=1)
+        vdi6007.calc_equivalent_res_walls(walls, cache=None)
+        reference = [(w.r1, w.r2, w.r3, w.c1, w.c2, w.c1_korr) for w in walls]
+
+        walls[0].area *= 2.0
+        vdi6007.calc_equivalent_res_walls(walls[:1], cache=cache)
+        vdi6007.calc_equivalent_res_walls(walls[:1], cache=cache)
+        assert cache.cache_info()["misses"] == 1
+        assert cache.cache_info()["hits"] == 1
+        np.testing.assert_allclose(walls[0].r1, reference[0][0] / 2.0, rtol=1e-9)
+        np.testing.assert_allclose(walls[0].c1, reference[0][3] * 2.0, rtol=1e-9)
+        walls[0].area /= 2.0
+
+        cache.clear()
+        vdi6007.calc_equivalent_res_walls(walls, cache=cache)
+        vdi6007.calc_equivalent_res_walls(walls, cache=cache)
+        assert cache.cache_info()["misses"] + cache.cache_info()["hits"] == 2 * len(
+            walls
+        )
+        assert len(cache) == 1
+        cache.clear()
+        vdi6007.calc_equivalent_res_walls([walls[0], walls[0], walls[0]], cache=cache)
+        assert cache.cache_info()["misses"] == 3
+        for wall, values in zip(walls, reference):
+            single = (wall.r1, wall.r2, wall.r3, wall.c1, wall.c2, wall.c1_korr)
+            np.testing.assert_allclose(single, values, rtol=1e-9)
+        cache.clear()
+        assert cache.cache_info()["hits"] == 0
+
+    def test_calc_parallel_connection(self):
+        """test of closed-form parallel connection against pairwise VDI 6007"""
+        import numpy as np
+        import teaser.logic.buildingobjects.calculation.vdi6007 as vdi6007
+
+        omega = 2 * np.pi / 86400 / 5
+        r1 = [0.03, 0.005, 0.12, 0.0004]
+        c1 = [2.1e6, 8.5e5, 3.3e7, 1.2e5]
+
+        r1_ref = r1[0]
+        c1_ref = c1[0]
+        for r1_wall, c1_wall in zip(r1[1:], c1[1:]):
+            r1x = r1_ref
+            c1x = c1_ref
+            r1_ref = (
+                r1x * c1x ** 2
+                + r1_wall * c1_wall ** 2
+                + omega ** 2 * r1x * r1_wall * (r1x + r1_wall) * c1x ** 2 * c1_wall ** 2
+            ) / (
+                (c1x + c1_wall) ** 2
+                + omega ** 2 * (r1x + r1_wall) ** 2 * c1x ** 2 * c1_wall ** 2
+            )
+            c1_ref = (
+                (c1x + c1_wall) ** 2
+                + omega ** 2 * (r1x + r1_wall) ** 2 * c1x ** 2 * c1_wall ** 2
+            ) / (
+                c1x
+                + c1_wall
+                + omega ** 2 * (r1x ** 2 * c1x + r1_wall ** 2 * c1_wall) * c1x * c1_wall
+            )
+
+        r1_par, c1_par = vdi6007.calc_parallel_connection(r1, c1, omega)
+        np.testing.assert_allclose(r1_par, r1_ref, rtol=1e-9)
+        np.testing.assert_allclose(c1_par, c1_ref, rtol=1e-9)
+
     def test_insulate_wall(self):
         """test of insulate_wall"""
         therm_zone = prj.buildings[-1].thermal_zones[-1]
@@ -2347,6 +3062,167 @@ class Test_teaser(object):
 
         mat.save_material_template(data_class=dat)
 
+    def test_material_lca_index(self):
+        """test of the id and name lookups of material and LCA data"""
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        mat_id = prj.data.material_name_index["cork_tile_200"]
+        mat = Material(parent=None)
+        mat.load_material_template(mat_name="cork_tile_200", data_class=prj.data)
+        assert mat.material_id == mat_id
+        assert mat.density == prj.data.material_index[mat_id]["density"]
+
+        lca_id = prj.data.material_index[mat_id]["lca_id"]
+        assert mat.lca_data.lca_data_id == lca_id
+        assert (
+            prj.data.lca_data_name_index[prj.data.lca_data_index[lca_id]["name"]]
+            == lca_id
+        )
+        assert "version" not in prj.data.lca_data_fallback_index
+
+    def test_data_class_cache(self):
+        """test of lazy, cached loading of DataClass and binary snapshots"""
+        import shutil
+        import teaser.data.dataclass as dataclass
+
+        dat = dataclass.DataClass()
+        assert "material_bind" not in vars(dat)
+        path = os.path.join(
+            utilities.create_path(utilities.get_default_path()), "MatSnapUT.json"
+        )
+        shutil.copyfile(dat.path_mat, path)
+        dat.path_mat = path
+        dataclass.save_binding_snapshot(path)
+        assert os.path.isfile(path + ".pickle")
+
+        dataclass._binding_cache.clear()
+        dat.load_mat_binding()
+        dat_2 = dataclass.DataClass()
+        assert dat.material_bind == dat_2.material_bind
+        assert dat.material_bind is not dat_2.material_bind
+        dat_2.material_bind["version"] = "0.8"
+        assert dataclass.DataClass().material_bind["version"] == "0.7"
+
+        dat_2.conditions_bind["Living"]["heating_profile"][0] = 0.0
+        assert dataclass.DataClass().conditions_bind["Living"]["heating_profile"][
+            0
+        ] == 294.15
+        prj_isolated = Project(load_data=True)
+        prj_isolated.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0,
+        )
+        prj_isolated.buildings[0].thermal_zones[0].use_conditions.heating_profile[
+            0
+        ] = 0.0
+        use_cond = Project(load_data=True).data.conditions_bind["Living"]
+        assert use_cond["heating_profile"][0] == 294.15
+
+        import pickle
+
+        for content in (
+            b"no pickle",
+            pickle.dumps(("stamp", None)),
+            pickle.dumps((dataclass._file_stamp(path), os.getcwd)),
+        ):
+            with open(path + ".pickle", "wb") as f:
+                f.write(content)
+            dataclass._binding_cache.clear()
+            dat.load_mat_binding()
+            assert dat.material_bind == dataclass.DataClass().material_bind
+
+    def test_share_material_templates(self):
+        """test of materials sharing one template and its LCA data"""
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+
+        dat = DataClass(share_material_templates=True)
+        mat_1 = Material(parent=None)
+        mat_1.load_material_template(mat_name="cork_tile_200", data_class=dat)
+        mat_2 = Material(parent=None)
+        mat_2.load_material_template(mat_name="cork_tile_200", data_class=dat)
+        mat_ref = Material(parent=None)
+        mat_ref.load_material_template(mat_name="cork_tile_200", data_class=prj.data)
+
+        assert mat_1.lca_data is mat_2.lca_data
+        assert mat_1.material_id == mat_ref.material_id
+        assert mat_1.thermal_conduc == mat_ref.thermal_conduc
+        assert mat_1.lca_data.gwp.a1_a3 == mat_ref.lca_data.gwp.a1_a3
+        mat_2.density = 1.0
+        assert mat_1.density == mat_ref.density
+        with pytest.raises(AttributeError):
+            mat_2.lca_data.ref_flow_unit = "kg"
+        with pytest.raises(AttributeError):
+            mat_2.lca_data.gwp.a1_a3 = 1.0
+
+        def add_buildings(prj_share):
+            prj_share.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="share_sfd",
+                year_of_construction=1970,
+                number_of_floors=2,
+                height_of_floors=3,
+                net_leased_area=200,
+            )
+            prj_share.add_non_residential(
+                method="bmvbs",
+                usage="office",
+                name="share_office",
+                year_of_construction=1990,
+                number_of_floors=3,
+                height_of_floors=3,
+                net_leased_area=1000,
+            )
+            prj_share.add_residential(
+                method="tabula_de",
+                usage="single_family_house",
+                name="share_sfh",
+                year_of_construction=1970,
+                number_of_floors=2,
+                height_of_floors=3,
+                net_leased_area=200,
+            )
+            prj_share.calc_all_buildings()
+
+        prj_ref = Project(load_data=True)
+        add_buildings(prj_ref)
+        prj_share = Project(load_data=True, share_material_templates=True)
+        add_buildings(prj_share)
+
+        assert prj_share.data.share_material_templates
+        materials = {}
+        for bldg in prj_share.buildings:
+            for zone in bldg.thermal_zones:
+                for wall in zone.outer_walls + zone.inner_walls:
+                    for layer in wall.layer:
+                        material = materials.setdefault(
+                            layer.material.material_id, layer.material
+                        )
+                        assert layer.material is material
+        assert len(materials) > 1
+        for bldg_ref, bldg in zip(prj_ref.buildings, prj_share.buildings):
+            assert bldg.sum_heat_load == bldg_ref.sum_heat_load
+            for zone_ref, zone in zip(bldg_ref.thermal_zones, bldg.thermal_zones):
+                assert zone.model_attr.ua_value_ow == zone_ref.model_attr.ua_value_ow
+
+        layer = prj_share.buildings[0].thermal_zones[0].outer_walls[0].layer[0]
+        with pytest.raises(AttributeError):
+            layer.material.density = 1.0
+        density = layer.material.density
+        gwp = layer.material.lca_data.gwp.a1_a3
+        material = layer.material.copy(parent=layer)
+        material.density = 1.0
+        material.lca_data.gwp.a1_a3 = 1.0
+        assert layer.material is material
+        assert materials[material.material_id].density == density
+        assert materials[material.material_id].lca_data.gwp.a1_a3 == gwp
+
     def test_properties_project(self):
         """Tests properties of project class"""
         prj.number_of_elements_calc
@@ -3131,6 +4007,210 @@ class Test_teaser(object):
 
         assert prj_test.buildings[-1].central_ahu.profile_v_flow == v_flow_week
 
+    def test_use_conditions_schedule_store(self):
+        """test of the profiles shared between UseConditions"""
+        import pickle
+        import numpy as np
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+        from teaser.logic.schedulestore import schedule_store
+
+        use_cond_1 = UseConditions()
+        use_cond_2 = UseConditions()
+        assert use_cond_1._schedules is None
+        assert use_cond_1.schedules is use_cond_1.schedules
+        use_cond_2.schedules
+        assert use_cond_1.heating_profile is not use_cond_2.heating_profile
+        assert schedule_store.intern(use_cond_1.heating_profile) is (
+            schedule_store.intern(use_cond_2.heating_profile)
+        )
+
+        use_cond_1.load_use_conditions("Living", prj.data)
+        use_cond_2.load_use_conditions("Living", prj.data)
+        use_cond_2.persons_profile = [0.5, 1.0]
+        use_cond_1.machines_profile = [1, 0]
+        assert use_cond_1._schedules is None
+        assert schedule_store.key([1, 0]) != schedule_store.key([1.0, 0.0])
+
+        schedules = use_cond_2.schedules
+        assert use_cond_1.persons_profile is not use_cond_2.persons_profile
+        assert pickle.loads(pickle.dumps(use_cond_2))._schedules is None
+        assert len(schedules) == 8760
+        assert schedules.index[25] == "01-02 01:00:00"
+        assert schedules["persons_profile"].tolist()[:4] == [0.5, 1.0, 0.5, 1.0]
+        assert use_cond_1.schedules["machines_profile"].tolist()[-2:] == [1, 0]
+        assert (
+            schedules["heating_profile"].tolist()
+            == (use_cond_2.heating_profile * 365)[:8760]
+        )
+        assert schedule_store.expand(use_cond_2.lighting_profile) is (
+            schedule_store.expand(use_cond_1.lighting_profile)
+        )
+
+        use_cond_3 = UseConditions()
+        use_cond_3.load_use_conditions("Living", prj.data)
+        use_cond_3.persons_profile = [0.5, 1.0]
+        assert use_cond_3.schedules is not schedules
+        for column in schedules.columns:
+            assert np.shares_memory(
+                use_cond_3.schedules[column].to_numpy(),
+                schedules[column].to_numpy(),
+            )
+        assert np.shares_memory(
+            use_cond_1.schedules["lighting_profile"].to_numpy(),
+            schedules["lighting_profile"].to_numpy(),
+        )
+        with pytest.raises(ValueError):
+            use_cond_3.schedules.iloc[0, 0] = 250.0
+        use_cond_3.schedules["persons_profile"] = 0.0
+        assert schedules["persons_profile"].tolist()[:2] == [0.5, 1.0]
+        use_cond_3.machines_profile = [0.25]
+        use_cond_copy = pickle.loads(pickle.dumps(use_cond_3))
+        assert use_cond_copy.schedules["persons_profile"].tolist()[:2] == [0.0, 0.0]
+        assert use_cond_copy.schedules["machines_profile"].tolist()[:2] == [0.25, 0.25]
+
+        custom = schedules.copy()
+        custom["heating_profile"] = 280.0
+        use_cond_3.schedules = custom
+        assert use_cond_3.schedules is custom
+        use_cond_3.cooling_profile = [300.0]
+        assert custom["cooling_profile"].tolist()[:2] == [300.0, 300.0]
+        use_cond_copy = pickle.loads(pickle.dumps(use_cond_3))
+        assert use_cond_copy.schedules["heating_profile"].tolist()[:2] == [280.0, 280.0]
+
+        profile = [290.0, 291.0]
+        use_cond_1.heating_profile = profile
+        use_cond_1.schedules
+        use_cond_1.heating_profile[0] = 250.0
+        assert profile == [290.0, 291.0]
+        use_cond_2.heating_profile = [290.0, 291.0]
+        assert use_cond_2.schedules["heating_profile"].tolist()[:2] == [290.0, 291.0]
+        assert use_cond_2.heating_profile == [290.0, 291.0]
+
+    def test_boundary_table(self):
+        """test of the text tables of the boundary conditions"""
+        import io
+        import numpy as np
+        import pandas as pd
+        from teaser.data.output import boundarytable
+
+        columns = [
+            np.resize(np.array([294.15, 1e-05, 0.1 + 0.2, np.nan]), 8760),
+            np.resize(np.array([0, 1]), 8760),
+            np.resize(np.array([True, False, False]), 8760),
+        ]
+        export = pd.DataFrame({i: column for i, column in enumerate(columns)})
+        export.index = [(i + 1) * 3600 for i in range(8760)]
+        expected = io.StringIO()
+        expected.write("#1\ndouble Tset(8760, 4)\n")
+        export.to_csv(expected, sep="\t", header=False, index_label=False)
+
+        text = boundarytable.format_table(name="Tset", columns=columns)
+        assert text == expected.getvalue()
+        assert boundarytable.format_table(name="Tset", columns=columns) is text
+
+        text = boundarytable.format_table(
+            name="Internals", columns=columns[1:], first_row=True
+        )
+        assert text.splitlines()[1:4] == [
+            "double Internals(8761, 3)",
+            "0\t0\tTrue",
+            "3600\t0\tTrue",
+        ]
+
+    def test_boundary_table_mat(self):
+        """test of the MATLAB v4 tables of the boundary conditions"""
+        import numpy as np
+        from teaser.data.output import boundarytable
+
+        columns = [
+            np.resize(np.array([294.15, 1e-05, 0.1 + 0.2]), 8760),
+            np.resize(np.array([0, 1]), 8760),
+        ]
+        path = os.path.join(utilities.get_default_path(), "Internals.mat")
+        boundarytable.write_table(
+            path=path,
+            name="Internals",
+            columns=columns,
+            first_row=True,
+            table_format="mat",
+        )
+        with open(path, "rb") as f:
+            header = np.frombuffer(f.read(20), dtype="<i4")
+            name = f.read(header[4])
+            data = np.frombuffer(f.read(), dtype="<f8")
+
+        assert header.tolist() == [0, 8761, 3, 0, 10]
+        assert name == b"Internals\0"
+        data = data.reshape((8761, 3), order="F")
+        assert data[:3, 0].tolist() == [0, 3600, 7200]
+        assert data[0, 1:].tolist() == data[1, 1:].tolist()
+        assert (data[1:, 1] == columns[0]).all()
+        assert (data[1:, 2] == columns[1]).all()
+
+        prj.set_default(load_data=True)
+        prj.name = "MatTables"
+        prj.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0,
+        )
+        prj.used_library_calc = "AixLib"
+        prj.calc_all_buildings()
+        path = prj.export_aixlib(table_format="mat")
+        bldg = prj.buildings[-1]
+        assert bldg.library_attr.file_ahu == "AHU_ResidentialBuilding.mat"
+        for file_name in (
+            bldg.library_attr.file_set_t_heat,
+            bldg.library_attr.file_set_t_cool,
+            bldg.library_attr.file_ahu,
+            bldg.library_attr.file_internal_gains,
+        ):
+            assert os.path.isfile(os.path.join(path, bldg.name, file_name))
+        with open(os.path.join(path, bldg.name, bldg.name + ".mo")) as f:
+            assert "InternalGains_ResidentialBuilding.mat" in f.read()
+
+    def test_export_aixlib_parallel(self):
+        """test of export_aixlib in a process pool against serial"""
+        import filecmp
+
+        prj_export = Project()
+        prj_export.name = "ParallelExport"
+        for year in (1950, 1970, 1990):
+            prj_export.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="ResidentialBuilding" + str(year),
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=200.0,
+            )
+        prj_export.calc_all_buildings()
+
+        path_serial = prj_export.export_aixlib(
+            path=os.path.join(utilities.get_default_path(), "serial")
+        )
+        path_parallel = prj_export.export_aixlib(
+            path=os.path.join(utilities.get_default_path(), "parallel"), workers=2
+        )
+
+        for directory, _, files in os.walk(path_serial):
+            relative = os.path.relpath(directory, path_serial)
+            assert sorted(os.listdir(os.path.join(path_parallel, relative))) == sorted(
+                os.listdir(directory)
+            )
+            _, mismatch, errors = filecmp.cmpfiles(
+                directory,
+                os.path.join(path_parallel, relative),
+                files,
+                shallow=False,
+            )
+            assert mismatch == [] and errors == []
+
     def test_export_bldg_threshold(self):
 
         prj.set_default(load_data=True)
@@ -1,12 +1,18 @@
 # import of libraries
 from PySide2 import QtWidgets, QtGui
 import os
-import lxml.etree as ET
 import glob
 import math
+import concurrent.futures
 
 # import of functions
 import gui_functions as gf
+import teaser.logic.parallel as parallel
+from teaser.data.citygmlprobe import CityGMLProbe
+from teaser.data.input.citygml_input import decode_double_list, decode_pos_elements, iterparse_gml
+
+# results of get_lods per file path, stored together with the size and modification time of the file
+lodsCache = {}
 
 def select_gml(self):
     """func to select file"""
@@ -34,38 +40,70 @@ def select_folder(self):
         return 0
 
 
-def get_files(self):
+def get_files(self, workers=None):
     """func to loop through all the files and buildings and add them to the table widget for selection"""
     #
     # function to reset the table IMPORTANT
     #
-    resultsDict = {}
     if os.path.isfile(self.inpPath):
         # case for single file
-        resultsDict[os.path.basename(self.inpPath)] = get_lods(self.inpPath)
-        gf.progressLoD(self, 100)
-        pass
+        filenames = [self.inpPath]
     elif os.path.isdir(self.inpPath):
         # case for multiple files
         filenames = glob.glob(os.path.join(self.inpPath, "*.gml")) + glob.glob(os.path.join(self.inpPath, "*.xml"))
-        for i, filename in enumerate(filenames):
-            resultsDict[os.path.basename(filename)] = get_lods(filename)
-            gf.progressLoD(self, (i + 1) / len(filenames) * 100)
-        pass
     else:
+        filenames = []
         gf.messageBox(self, "ERROR!", "Input path is neither file or directory.\nPlease reselect input data.")
 
+    resultsDict = scan_files(self, filenames, workers=workers)
+
     display_file_lod(self, resultsDict)
     self.btn_next.setEnabled(True)
 
 
+def scan_files(self, filenames, workers=None):
+    """scans all files with get_lods in a process pool while the GUI stays responsive
+
+    files that did not change since they were scanned last time are taken from lodsCache,
+    returns the buildings per file name in the order of filenames"""
+    results = {}
+    pending = {}
+    for filename in filenames:
+        stamp = get_file_stamp(filename)
+        if filename in lodsCache and lodsCache[filename][0] == stamp:
+            results[filename] = lodsCache[filename][1]
+        else:
+            pending[filename] = stamp
+
+    if pending:
+        with parallel.executor_scope(workers=workers) as pool:
+            futures = {pool.submit(get_lods, filename): filename for filename in pending}
+            running = set(futures)
+            while running:
+                # waiting only shortly, so the GUI can process its events in between
+                finished, running = concurrent.futures.wait(running, timeout=0.1,
+                                                            return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    filename = futures[future]
+                    results[filename] = future.result()
+                    lodsCache[filename] = (pending[filename], results[filename])
+                gf.progressLoD(self, len(results) / len(filenames) * 100)
+                QtWidgets.QApplication.processEvents()
+
+    gf.progressLoD(self, 100)
+    return {os.path.basename(filename): results[filename] for filename in filenames}
+
+
+def get_file_stamp(filename):
+    """returns size and modification time of a file, a changed stamp means the file has to be scanned again"""
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
 def get_lods(filename):
     """gets all files in a building"""
-    # parsing file
+    # streaming the file, only one building is held in memory at a time
     print("parsing", filename)
-    tree = ET.parse(filename)
-    root = tree.getroot()
-    nss = root.nsmap
 
     buildings = {}
 
@@ -74,23 +112,23 @@ def get_lods(filename):
     # bHeight, rHeight, rHeading, rType, bFunction, YOC, SAG, SBG
     # look at CITYBIT you dumb idiot
 
-    # getting all buildings in file
-    buildings_in_file = root.findall('core:cityObjectMember/bldg:Building', nss)
-
-    # iterating all buildings
-    for building_E in buildings_in_file:
+    # iterating all buildings in file
+    for building_E, nss in iterparse_gml(filename, ("{*}Building",)):
+        if building_E.getparent().tag != '{' + nss.get('core', '') + '}cityObjectMember' or \
+                building_E.tag != '{' + nss.get('bldg', '') + '}Building':
+            continue
         buildingName = building_E.attrib['{http://www.opengis.net/gml}id']
-        info = get_info_from_building(building_E, nss)
+        # probing the geometry of the building and its building parts once
+        probe = CityGMLProbe(building_E)
+        info = get_info_from_building(building_E, nss, probe)
         if info != {}:
             buildings[buildingName] = info
         else:
             # no ground coordinates or LoD found -> can't work with building
             pass
-        bps_in_bldg = building_E.findall('./bldg:consistsOfBuildingPart', nss)
-        for co_bp_E in bps_in_bldg:
-            bp_E = co_bp_E.find('bldg:BuildingPart', nss)
+        for bp_E, bp_probe in probe.building_parts:
             buildingParIDJoinded = buildingName + '/' + bp_E.attrib['{http://www.opengis.net/gml}id']
-            info = get_info_from_building(bp_E, nss)
+            info = get_info_from_building(bp_E, nss, bp_probe)
             if info != {}:
                 if info["bFunction"] == 'N/D':
                     buildingFunction_E = building_E.find('bldg:function', nss)
@@ -152,11 +190,13 @@ def display_file_lod(self, filesDict):
     return
 
 
-def get_info_from_building(element, nss):
-    """gathers necessary info on building"""
+def get_info_from_building(element, nss, probe=None):
+    """gathers necessary info on building, probe is the CityGMLProbe of the element if it is already probed"""
     # bHeight, rHeight, rHeading, rType, bFunction, YOC, SAG, SBG
     data = {}
-    gS_list = getGroundSurfaceCoorOfBuild(element, nss)
+    if probe is None:
+        probe = CityGMLProbe(element)
+    gS_list = getGroundSurfaceCoorOfBuild(element, nss, probe)
     # getting coordinates of groundSurface of the building
     if gS_list == '':
         # no geometry found -> skipping building
@@ -165,7 +205,7 @@ def get_info_from_building(element, nss):
         # found geometry of building -> can continue
         pass
 
-    lod = get_lod(element, nss)
+    lod = get_lod(probe)
     if lod == -1:
         # lod is not defined -> can't continue with building
         return {}
@@ -198,86 +238,80 @@ def get_info_from_building(element, nss):
     return data
 
 
-def getGroundSurfaceCoorOfBuild(element, nss):
-    """returns the ground surface coor form element"""
+def getGroundSurfaceCoorOfBuild(element, nss, probe):
+    """returns the ground surface coor form element, the probe tells where the geometry is modelled"""
 
     # LoD0
-    for tagName in ['bldg:lod0FootPrint', 'bldg:lod0RoofEdge']:
-        LoD_zero_E = element.find(tagName, nss)
-        if LoD_zero_E != None:
-            posList_E = LoD_zero_E.find('.//gml:posList', nss)
-
-            if posList_E != None:
-                return get_3dPosList_from_str(posList_E.text)
-
-            else:  # case hamburg lod2 2020
-                pos_Es = LoD_zero_E.findall('.//gml:pos', nss)
-                polygon = []
-                for pos_E in pos_Es:
-                    polygon.append(pos_E.text)
-                polyStr = ' '.join(polygon)
-                return get_3dPosList_from_str(polyStr)
-
-    groundSurface_E = element.find('bldg:boundedBy/bldg:GroundSurface', nss)
-    if groundSurface_E != None:
-        posList_E = groundSurface_E.find('.//gml:posList', nss)  # searching for list of coordinates
-
-        if posList_E != None:  # case aachen lod2
-            return get_3dPosList_from_str(posList_E.text)
-
-        else:  # case hamburg lod2 2020
-            pos_Es = groundSurface_E.findall('.//gml:pos', nss)
-            polygon = []
-            for pos_E in pos_Es:
-                polygon.append(pos_E.text)
-            polyStr = ' '.join(polygon)
-            return get_3dPosList_from_str(polyStr)
+    if probe.geometry == 'footprint':
+        for tagName in ['bldg:lod0FootPrint', 'bldg:lod0RoofEdge']:
+            LoD_zero_E = element.find(tagName, nss)
+            if LoD_zero_E is not None:
+                return get_coor_from_element(LoD_zero_E, nss, probe)
+
+    if 'GroundSurface' in probe.surface_types:
+        groundSurface_E = element.find('bldg:boundedBy/bldg:GroundSurface', nss)
+        # case aachen lod2 (posList) or case hamburg lod2 2020 (pos)
+        return get_coor_from_element(groundSurface_E, nss, probe)
 
     #  checking if no groundSurface element has been found
-    else:  # case for lod1 files
+    elif 'lod1Solid' in probe.lod_elements:  # case for lod1 files
         geometry = element.find('bldg:lod1Solid', nss)
-        if geometry != None:
-            poly_Es = geometry.findall('.//gml:Polygon', nss)
-            all_poylgons = []
-            for poly_E in poly_Es:
-                polygon = []
-                posList_E = element.find('.//gml:posList', nss)  # searching for list of coordinates
-                if posList_E != None:
-                    polyStr = posList_E.text
-                else:
-                    pos_Es = poly_E.findall('.//gml:pos', nss)  # searching for individual coordinates in polygon
-                    for pos_E in pos_Es:
-                        polygon.append(pos_E.text)
-                    polyStr = ' '.join(polygon)
-                coor_list = get_3dPosList_from_str(polyStr)
-                all_poylgons.append(coor_list)
-
-            # to get the groundSurface polygon, the average height of each polygon is calculated and the polygon with the lowest average height is considered the groundsurface
-            averages = []
-            for polygon in all_poylgons:
-                # need to get polygon with lowest z coordinate here
-                average = 0
-                for i in range(len(polygon) - 1):
-                    average -= - polygon[i][2]
-                averages.append(average / (len(polygon) - 1))
-
-            return all_poylgons[averages.index(min(averages))]
-        else:
-            return ''
+        poly_Es = geometry.findall('.//gml:Polygon', nss)
+        all_poylgons = []
+        for poly_E in poly_Es:
+            posList_E = element.find('.//gml:posList', nss) if probe.pos_list else None  # searching for list of coordinates
+            if posList_E is not None:
+                coor_list = get_3dPosList_from_str(posList_E.text)
+            else:
+                pos_Es = poly_E.findall('.//gml:pos', nss)  # searching for individual coordinates in polygon
+                coor_list = get_3dPosList_from_pos(pos_Es)
+            all_poylgons.append(coor_list)
+
+        # to get the groundSurface polygon, the average height of each polygon is calculated and the polygon with the lowest average height is considered the groundsurface
+        averages = []
+        for polygon in all_poylgons:
+            # need to get polygon with lowest z coordinate here
+            average = 0
+            for i in range(len(polygon) - 1):
+                average -= - polygon[i][2]
+            averages.append(average / (len(polygon) - 1))
+
+        return all_poylgons[averages.index(min(averages))]
+    else:
+        return ''
+
+
+def get_coor_from_element(element, nss, probe):
+    """returns the coordinates of the first posList or of all pos elements in element"""
+    posList_E = element.find('.//gml:posList', nss) if probe.pos_list else None  # searching for list of coordinates
+
+    if posList_E is not None:
+        return get_3dPosList_from_str(posList_E.text)
+
+    else:
+        pos_Es = element.findall('.//gml:pos', nss)
+        return get_3dPosList_from_pos(pos_Es)
 
 
-def get_lod(element, nss):
+def get_lod(probe):
     """returns the first LoD found in an building or buildingPart"""
-    lodFlags = {'bldg:lod0FootPrint': 0, 'bldg:lod1Solid': 1, 'bldg:lod2Solid': 2, 'bldg:lod3MultiSurface': 3,
-                'bldg:lod4MultiSurface': 4}
+    lodFlags = {'lod0FootPrint': 0, 'lod1Solid': 1, 'lod2Solid': 2, 'lod3MultiSurface': 3, 'lod4MultiSurface': 4}
     for flag in lodFlags:
-        if element.find('./' + flag, nss) != None:
+        if flag in probe.lod_elements:
             return lodFlags[flag]
     return -1
 
 
-
 def get_3dPosList_from_str(text):
-    coor_list = [float(x) for x in text.split()]
-    coor_list = [list(x) for x in zip(coor_list[0::3], coor_list[1::3], coor_list[2::3])]  # creating 2d coordinate array from 1d array
-    return coor_list
\ No newline at end of file
+    """returns the coordinates of a gml:posList as list of [x, y, z]"""
+    return get_3dPosList(decode_double_list(text))
+
+
+def get_3dPosList_from_pos(pos_Es):
+    """returns the coordinates of a run of gml:pos elements as list of [x, y, z]"""
+    return get_3dPosList(decode_pos_elements(pos_Es))
+
+
+def get_3dPosList(coordinates):
+    """creating 2d coordinate list from 1d array, incomplete points at the end are dropped"""
+    return coordinates[:coordinates.size // 3 * 3].reshape(-1, 3).tolist()